@@ -73,7 +73,6 @@ def decode_yarray_to_xy(
         return None
 
     lo, hi = robust_minmax(vals)
-    vals_norm = (vals - lo) / (hi - lo)
 
     # Ancho lateral (x)
     dx = (Ytop_cm - Ybottom_cm)
@@ -81,14 +80,17 @@ def decode_yarray_to_xy(
     if abs(dx) < 1e-9 or abs(dy) < 1e-9:
         return None
 
-    x_cm = Ybottom_cm + vals_norm * dx
+    # Escalado in-place: vals pasa a ser x_cm sin arrays intermedios
+    vals -= lo
+    vals *= dx / (hi - lo)
+    vals += Ybottom_cm
     N = vals.shape[0]
-    y_cm = np.linspace(Xback_cm, Xfront_cm, N)
+    y_cm = np.linspace(Xback_cm, Xfront_cm, N, dtype=np.float64)
 
     df = pd.DataFrame({
         "sample_idx": np.arange(N, dtype=int),
-        "x_cm": x_cm.astype(float),
-        "y_cm": y_cm.astype(float),
+        "x_cm": vals,
+        "y_cm": y_cm,
     })
     return df
 
@@ -20,10 +20,22 @@ DEFAULT_MAX_COLUMNS = 32
 DEFAULT_PLOT_WINDOW_SECONDS = 5.0
 DEFAULT_R_OFFSET = 80000.0  # Offset for right-side data visualization
 PLOT_UPDATE_INTERVAL = 1.0 / 20.0  # 20 Hz update rate for plot markers
+PLOT_USE_OPENGL = True  # Paint the CSV plot through an OpenGL viewport when available
 
 # Video playback constants
 DEFAULT_FPS = 30.0
 DEFAULT_TIMER_INTERVAL = 33  # milliseconds (approximately 30 fps)
+VIDEO_FRAME_CACHE_FRAMES = 64  # Decoded frames kept for revisits (backward scrubbing)
+VIDEO_FRAME_CACHE_MAX_MB = 256  # Memory cap of that cache
+VIDEO_PREFETCH_FRAMES = 16  # Frames decoded ahead of the playhead during playback
+VIDEO_MAX_LATENESS_S = 0.040  # Playback drops frames once it is further behind the clock than this
+VIDEO_FILMSTRIP_INTERVAL_S = 1.0  # One scrub preview thumbnail per this many seconds of video
+VIDEO_FILMSTRIP_WIDTH = 160  # Thumbnail width in pixels (height follows the video's aspect ratio)
+VIDEO_FILMSTRIP_MAX_MB = 64  # Memory cap of the thumbnails; long videos get fewer of them
+# Hardware decoder for the PyAV backend, e.g. 'cuda' (NVDEC), 'vaapi', 'qsv',
+# 'videotoolbox', 'd3d11va'; None decodes on the CPU. When set, the OpenCV
+# fallback also asks FFmpeg for any available hardware decoder
+VIDEO_HWACCEL_DEVICE = None
 
 # Playback speed options (multipliers)
 PLAYBACK_SPEED_OPTIONS = [0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 1.5, 2.0]
@@ -59,6 +71,10 @@ FOOTPRINT_FILE_NAMES = {
 # Directory exclusions
 EXCLUDED_DIRECTORIES = {'sitdown', 'stand'}
 
+# Threads walking top-level subdirectories in discover_datasets; listing
+# directories is I/O bound, which pays off most on network shares
+DISCOVER_MAX_WORKERS = 8
+
 # UI window defaults
 DEFAULT_WINDOW_WIDTH = 1100
 DEFAULT_WINDOW_HEIGHT = 800
@@ -6,11 +6,33 @@ This package contains the main application components:
 - VideoController: Video playback control logic
 - DataManager: CSV and GaitRite data management
 - PlotManager: Plot visualization management
+
+The classes are imported on first access, so importing one submodule (e.g.
+core.data_manager for headless processing) does not load Qt, pyqtgraph and
+OpenCV through the others.
 """
 
-from .video_player import VideoPlayer
-from .video_controller import VideoController
-from .data_manager import DataManager
-from .plot_manager import PlotManager
+import importlib
+
+# public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "VideoPlayer": ".video_player",
+    "VideoController": ".video_controller",
+    "DataManager": ".data_manager",
+    "PlotManager": ".plot_manager",
+}
 
 __all__ = ["VideoPlayer", "VideoController", "DataManager", "PlotManager"]
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,6 +6,7 @@ Manages all data-related operations separate from UI logic.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Tuple
 import numpy as np
 import pandas as pd
@@ -33,6 +34,10 @@ class DataManager:
         """Initialize the data manager with default values."""
         self.csv_sampling_rate: float = DEFAULT_CSV_SAMPLING_RATE
         self.csv_len: int = 0
+        # (inputs, result) of get_time_axis and video_frame_to_csv_table;
+        # rebuilt when the CSV length, sampling rate or video timing change
+        self._time_axis_cache: Optional[tuple] = None
+        self._frame_table_cache: Optional[tuple] = None
         
         # Processed data arrays for left and right sides
         self.sums_L: Optional[List[np.ndarray]] = None
@@ -69,11 +74,26 @@ class DataManager:
         Returns:
             True if data loaded successfully, False otherwise
         """
-        try:
-            df_L = pd.read_csv(csv_path_L, header=0)
-        except Exception as e:
-            print(f"[DataManager] Error reading L.csv: {e}", flush=True)
-            return False
+        # Parse L and R concurrently so the two reads overlap
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            future_L = pool.submit(self._read_sensor_csv, csv_path_L)
+            future_R = None
+            if csv_path_R and os.path.exists(csv_path_R):
+                future_R = pool.submit(self._read_sensor_csv, csv_path_R)
+            
+            try:
+                df_L = future_L.result()
+            except Exception as e:
+                print(f"[DataManager] Error reading L.csv: {e}", flush=True)
+                return False
+            
+            # Try to load right side CSV
+            df_R = None
+            if future_R is not None:
+                try:
+                    df_R = future_R.result()
+                except Exception:
+                    df_R = None
         
         # Limit columns to maximum
         max_col_L = min(DEFAULT_MAX_COLUMNS, df_L.shape[1])
@@ -84,14 +104,6 @@ class DataManager:
         # Store raw data for heatmap (NEW)
         self.raw_data_L = dfL_sel.copy()
         
-        # Try to load right side CSV
-        df_R = None
-        if csv_path_R and os.path.exists(csv_path_R):
-            try:
-                df_R = pd.read_csv(csv_path_R, header=0)
-            except Exception:
-                df_R = None
-        
         if df_R is not None:
             max_col_R = min(DEFAULT_MAX_COLUMNS, df_R.shape[1])
             dfR_sel = df_R.iloc[:, 0:max_col_R] if max_col_R >= 1 else pd.DataFrame()
@@ -138,6 +150,26 @@ class DataManager:
         print(f"[DataManager] Loaded CSV data: L={len_L} samples, R={len_R} samples", flush=True)
         return True
     
+    @staticmethod
+    def _read_sensor_csv(path: str) -> pd.DataFrame:
+        """
+        Read a pressure sensor CSV file (header row, one column per sensor).
+        
+        Uses PyArrow's multithreaded block reader when it is installed,
+        otherwise pandas.
+        
+        Args:
+            path: Path to the CSV file
+            
+        Returns:
+            DataFrame with the file contents
+        """
+        try:
+            import pyarrow.csv as pv
+        except ImportError:
+            return pd.read_csv(path, header=0)
+        return pv.read_csv(path).to_pandas()
+    
     def _compute_group_sums(self, df: pd.DataFrame, target_length: int) -> List[np.ndarray]:
         """
         Compute summed values for each group of columns.
@@ -164,12 +196,9 @@ class DataManager:
                 group_df = df.iloc[:, start:end].fillna(0).astype(float)
                 arr = group_df.to_numpy()
                 
-                # Pad if necessary
-                if arr.shape[0] < target_length:
-                    pad = np.zeros((target_length - arr.shape[0], arr.shape[1]), dtype=float)
-                    arr = np.vstack([arr, pad])
-                
-                y_sum = arr.sum(axis=1)
+                # Sum first and zero-pad the 1-D result (padded rows sum to 0)
+                y_sum = np.zeros(target_length, dtype=float)
+                y_sum[:arr.shape[0]] = arr.sum(axis=1)
             
             sums.append(y_sum)
         
@@ -197,11 +226,9 @@ class DataManager:
             else:
                 try:
                     arr = df.iloc[:, valid_idx].fillna(0).astype(float).to_numpy()
-                    # Pad if necessary
-                    if arr.shape[0] < target_length:
-                        pad = np.zeros((target_length - arr.shape[0], arr.shape[1]), dtype=float)
-                        arr = np.vstack([arr, pad])
-                    y_sum = arr.sum(axis=1)
+                    # Sum first and zero-pad the 1-D result (padded rows sum to 0)
+                    y_sum = np.zeros(target_length, dtype=float)
+                    y_sum[:arr.shape[0]] = arr.sum(axis=1)
                 except Exception:
                     y_sum = np.zeros(target_length, dtype=float)
             sums.append(y_sum)
@@ -219,6 +246,12 @@ class DataManager:
         """
         from pathlib import Path
 
+        # Drop the previous dataset's data so a folder without footprints
+        # does not keep showing them
+        self.gaitrite_df = None
+        self.footprints_left_df = None
+        self.footprints_right_df = None
+
         base = Path(base_directory).expanduser().resolve()
         gait_file = base / GAITRITE_FILE_NAME
         
@@ -282,11 +315,14 @@ class DataManager:
             right_exists: Whether right footprints already exist
         """
         try:
-            # Read gaitrite_test.csv
-            try:
-                df_g = pd.read_csv(gait_file, delimiter=';')
-            except Exception:
-                df_g = pd.read_csv(gait_file)
+            # Reuse the DataFrame already parsed by load_gaitrite_data; only
+            # read gaitrite_test.csv again if that parse failed.
+            df_g = self.gaitrite_df
+            if df_g is None:
+                try:
+                    df_g = pd.read_csv(gait_file, delimiter=';')
+                except Exception:
+                    df_g = pd.read_csv(gait_file)
             
             if df_g is None or df_g.empty:
                 return
@@ -303,27 +339,51 @@ class DataManager:
             except Exception:
                 decode_yarray_to_xy = None
             
+            # Extract every per-row field as a NumPy array once, instead of
+            # calling pd.notna()/int()/float() on each iterrows() Series
+            def _numeric(col: str) -> np.ndarray:
+                return pd.to_numeric(df_g[col], errors='coerce').to_numpy(dtype=float)
+            
+            # Stable-sort the step rows once so footprint blocks are accumulated
+            # already ordered by (gait_id, event); sample_idx is monotonic
+            # within each block, so the concatenated output needs no re-sort.
+            # The keys are the integer-coerced ids written to the output
+            # (missing ones last), not the raw columns, which may be strings.
+            gait_f = _numeric('Gait_Id')
+            event_f = _numeric('Event')
+            order = np.lexsort((np.trunc(event_f), np.trunc(gait_f)))
+            df_g = df_g.iloc[order]
+            gait_f = gait_f[order]
+            event_f = event_f[order]
+            
+            foot_f = _numeric('Foot')
+            foot_i64 = np.where(np.isnan(foot_f), -1, foot_f).astype(np.int64)
+            gait_valid = ~np.isnan(gait_f)
+            gait_i64 = np.where(gait_valid, gait_f, 0).astype(np.int64)
+            event_valid = ~np.isnan(event_f)
+            event_i64 = np.where(event_valid, event_f, 0).astype(np.int64)
+            
+            bounds_cm = np.column_stack([
+                _numeric(c) for c in ('Xback', 'Xfront', 'Ybottom', 'Ytop')
+            ]) * GAITRITE_CONVERSION_FACTOR
+            # Rows whose bounds are present but not numeric are skipped
+            bounds_raw_notna = df_g[['Xback', 'Xfront', 'Ybottom', 'Ytop']].notna().to_numpy()
+            bounds_ok = ~(np.isnan(bounds_cm) & bounds_raw_notna).any(axis=1)
+            
+            yarray_col = df_g['Yarray'].to_numpy(dtype=object)
+            yarray_notna = df_g['Yarray'].notna().to_numpy()
+            
             # Accumulate footprints by foot (0=left, 1=right)
             accum = {0: [], 1: []}
             
-            for _, r in df_g.iterrows():
-                try:
-                    foot = int(r['Foot']) if pd.notna(r['Foot']) else None
-                except Exception:
-                    foot = None
-                
-                if foot not in (0, 1):
+            for row_idx in range(len(df_g)):
+                foot = int(foot_i64[row_idx])
+                if foot not in (0, 1) or not bounds_ok[row_idx]:
                     continue
                 
-                try:
-                    Xback_cm = float(r['Xback']) * GAITRITE_CONVERSION_FACTOR
-                    Xfront_cm = float(r['Xfront']) * GAITRITE_CONVERSION_FACTOR
-                    Ybottom_cm = float(r['Ybottom']) * GAITRITE_CONVERSION_FACTOR
-                    Ytop_cm = float(r['Ytop']) * GAITRITE_CONVERSION_FACTOR
-                except Exception:
-                    continue
+                Xback_cm, Xfront_cm, Ybottom_cm, Ytop_cm = bounds_cm[row_idx].tolist()
                 
-                yarray_raw = str(r['Yarray']) if pd.notna(r['Yarray']) else ''
+                yarray_raw = str(yarray_col[row_idx]) if yarray_notna[row_idx] else ''
                 
                 # Decode Yarray to xy points
                 if decode_yarray_to_xy is not None:
@@ -341,14 +401,16 @@ class DataManager:
                                 lo, hi = float(np.min(vals)), float(np.max(vals))
                             if hi == lo:
                                 hi = lo + 1e-9
-                            vals_norm = (vals - lo) / (hi - lo)
+                            # Rescale in place: vals becomes x_cm without temporaries
                             N = vals.shape[0]
-                            x_cm = Ybottom_cm + vals_norm * (Ytop_cm - Ybottom_cm)
-                            y_cm = np.linspace(Xback_cm, Xfront_cm, N)
+                            vals -= lo
+                            vals *= (Ytop_cm - Ybottom_cm) / (hi - lo)
+                            vals += Ybottom_cm
+                            y_cm = np.linspace(Xback_cm, Xfront_cm, N, dtype=np.float64)
                             df_xy = pd.DataFrame({
                                 'sample_idx': np.arange(N, dtype=int),
-                                'x_cm': x_cm.astype(float),
-                                'y_cm': y_cm.astype(float),
+                                'x_cm': vals,
+                                'y_cm': y_cm,
                             })
                     except Exception:
                         df_xy = None
@@ -360,8 +422,8 @@ class DataManager:
                 df_xy = df_xy.copy()
                 df_xy['participant'] = os.path.basename(base_directory)
                 df_xy['source_file'] = os.path.basename(gait_file)
-                df_xy['gait_id'] = int(r['Gait_Id']) if pd.notna(r['Gait_Id']) else None
-                df_xy['event'] = int(r['Event']) if pd.notna(r['Event']) else None
+                df_xy['gait_id'] = gait_i64[row_idx] if gait_valid[row_idx] else None
+                df_xy['event'] = event_i64[row_idx] if event_valid[row_idx] else None
                 df_xy['foot'] = foot
                 df_xy['xback_cm'] = Xback_cm
                 df_xy['xfront_cm'] = Xfront_cm
@@ -377,18 +439,14 @@ class DataManager:
             target_right = os.path.join(base_directory, 'generated_footprints_right.csv')
             
             if not left_exists and accum[0]:
-                out_left = pd.concat(accum[0], ignore_index=True).sort_values(
-                    ['gait_id', 'event', 'sample_idx']
-                ).reset_index(drop=True)
-                out_left.to_csv(target_left, index=False)
+                out_left = pd.concat(accum[0], ignore_index=True)
+                self._write_footprints_csv(out_left, target_left)
                 print(f"[DataManager] Generated left footprints: {target_left}", flush=True)
                 generated_any = True
             
             if not right_exists and accum[1]:
-                out_right = pd.concat(accum[1], ignore_index=True).sort_values(
-                    ['gait_id', 'event', 'sample_idx']
-                ).reset_index(drop=True)
-                out_right.to_csv(target_right, index=False)
+                out_right = pd.concat(accum[1], ignore_index=True)
+                self._write_footprints_csv(out_right, target_right)
                 print(f"[DataManager] Generated right footprints: {target_right}", flush=True)
                 generated_any = True
             
@@ -398,6 +456,35 @@ class DataManager:
         except Exception as e:
             print(f"[DataManager] Error generating footprints from Yarray: {e}", flush=True)
     
+    @staticmethod
+    def _write_footprints_csv(df: pd.DataFrame, path: str):
+        """
+        Write a generated footprints DataFrame to CSV.
+
+        Uses PyArrow's multithreaded CSV writer when it is installed and falls
+        back to pandas with a fixed float format, which avoids the slow
+        per-value repr() formatting of the default writer.
+
+        Args:
+            df: Footprints DataFrame to write
+            path: Destination CSV path
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pv
+        except ImportError:
+            pa = None
+
+        if pa is not None:
+            try:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                pv.write_csv(table, path, write_options=pv.WriteOptions(include_header=True))
+                return
+            except Exception as e:
+                print(f"[DataManager] PyArrow CSV write failed, using pandas: {e}", flush=True)
+
+        df.to_csv(path, index=False, float_format='%.6f', lineterminator='\n', chunksize=100_000)
+
     def _load_global_sensor_coordinates(self):
         """
         Load global sensor coordinate files from the package's `in/` directory.
@@ -520,13 +607,20 @@ class DataManager:
         """
         Generate time axis array for CSV data based on sampling rate.
         
+        The array is cached and shared between callers (it is read-only).
+        
         Returns:
             Numpy array of time values in seconds
         """
         if self.csv_len <= 0 or self.csv_sampling_rate <= 0:
             return np.array([0.0])
         
-        return np.arange(self.csv_len, dtype=float) / float(self.csv_sampling_rate)
+        key = (self.csv_len, self.csv_sampling_rate)
+        if self._time_axis_cache is None or self._time_axis_cache[0] != key:
+            axis = np.arange(self.csv_len, dtype=float) / float(self.csv_sampling_rate)
+            axis.flags.writeable = False
+            self._time_axis_cache = (key, axis)
+        return self._time_axis_cache[1]
     
     def video_frame_to_csv_index(self, video_frame: int, video_fps: float, video_total_frames: int = None) -> int:
         """
@@ -561,6 +655,36 @@ class DataManager:
         
         return idx
     
+    def video_frame_to_csv_table(self, video_fps: float, video_total_frames: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        video_frame_to_csv_index for every video frame at once, as lookup tables.
+        
+        The tables are cached until the CSV data or the video timing change,
+        so the per-frame cursor sync is two array lookups.
+        
+        Args:
+            video_fps: Video frames per second
+            video_total_frames: Total frames in video
+            
+        Returns:
+            (CSV index per frame (int32), time axis value at that index), or
+            None if there is no CSV data or video
+        """
+        if video_fps <= 0 or video_total_frames <= 0 or self.csv_sampling_rate <= 0 or self.csv_len <= 0:
+            return None
+        
+        key = (self.csv_len, self.csv_sampling_rate, video_fps, video_total_frames)
+        if self._frame_table_cache is None or self._frame_table_cache[0] != key:
+            frames = np.arange(video_total_frames, dtype=float)
+            if video_total_frames > 1:
+                # same proportional mapping (and round-half-even) as video_frame_to_csv_index
+                idx = np.rint(frames / float(video_total_frames - 1) * float(self.csv_len - 1))
+            else:
+                idx = np.rint(frames / float(video_fps) * float(self.csv_sampling_rate))
+            idx = np.clip(idx, 0, self.csv_len - 1).astype(np.int32)
+            self._frame_table_cache = (key, (idx, self.get_time_axis()[idx]))
+        return self._frame_table_cache[1]
+    
     def get_total_csv_duration_seconds(self) -> float:
         """
         Get the total duration of CSV data in seconds.
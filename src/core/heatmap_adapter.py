@@ -25,12 +25,16 @@ Signals:
 - fps_report(float): Emitted ~once per second with measured FPS
 """
 
+import logging
 import sys
 import os
+import time
 from typing import List, Tuple, Optional
 import numpy as np
 from PyQt6 import QtCore
 
+log = logging.getLogger(__name__)
+
 try:
     # Prefer bundled heatmap_project package inside video_gait_analyzer
     from src.heatmap_generation.animator import Animator
@@ -47,11 +51,94 @@ except Exception:
         from animator import Animator
         from prerenderer import PreRenderer
     except Exception as e:
-        print(f"[HeatmapAdapter] Warning: Could not import Heatmap_Project modules: {e}", flush=True)
+        log.warning("[HeatmapAdapter] Could not import Heatmap_Project modules: %s", e)
         Animator = None
         PreRenderer = None
 
 
+def _empty_pending() -> dict:
+    """Return a blank pending-state record (None means 'no change requested')."""
+    return {'data': None, 'seek': None, 'fps': None, 'params': None, 'size': None}
+
+
+# Parameters that change kernel or image shapes and therefore need a new Animator;
+# anything else (trailLength, margin, legendWidth, fps) is applied in place
+PARAM_REBUILD_KEYS = frozenset({'wFinal', 'hFinal', 'gridW', 'gridH', 'radius', 'smoothness'})
+
+
+def _apply_params(animator, params: dict):
+    """
+    Apply parameters to an Animator, rebuilding it only when required.
+    
+    Args:
+        animator: Animator whose coordinates, sequences and frame index are kept
+        params: Rendering parameters to apply
+        
+    Returns:
+        The same Animator if only cosmetic parameters changed, otherwise a new one
+    """
+    changed = {k for k, v in params.items() if animator.params.get(k) != v}
+    if changed.isdisjoint(PARAM_REBUILD_KEYS):
+        animator.apply_cosmetic(dict(params))
+        return animator
+    
+    new_animator = Animator(dict(params), animator.coords_left, animator.coords_right)
+    # Sequences are already converted arrays; hand them over without copying
+    new_animator.frame_idx = animator.frame_idx
+    new_animator.adopt_sequences(animator.left_seq, animator.right_seq)
+    return new_animator
+
+
+def _as_coords_array(coords):
+    """
+    Convert sensor coordinates to a contiguous float32 array of shape (n, 2).
+    
+    Kernel precomputation, COP computation and marker rasterization all work
+    on whole coordinate arrays, so converting once here saves a list-to-array
+    conversion in each of them (COP runs every frame).
+    
+    Args:
+        coords: Sequence of (x, y) sensor coordinates
+        
+    Returns:
+        float32 array of shape (n, 2), or the original value if it cannot be converted
+    """
+    try:
+        return np.ascontiguousarray(
+            np.asarray(coords if coords is not None else [], dtype=np.float32).reshape(-1, 2))
+    except (TypeError, ValueError):
+        return coords
+
+
+def _as_sequence_array(seq):
+    """
+    Convert a pressure sequence to a contiguous array (frames x sensors).
+    
+    Integer readings that fit in 16 bits (raw sensor ADC values) are stored
+    as uint16, a quarter of the size of the int64 NumPy would pick and half
+    of float32; anything else is kept as float32.
+    
+    Args:
+        seq: List of frames, each frame a list of pressure values
+        
+    Returns:
+        2D uint16/float32 array, or the original sequence if frames differ in length
+    """
+    try:
+        arr = np.asarray(seq)
+    except (TypeError, ValueError):
+        return seq
+    if arr.ndim != 2:
+        return seq
+    if (np.issubdtype(arr.dtype, np.integer) and arr.size
+            and arr.min() >= 0 and arr.max() <= np.iinfo(np.uint16).max):
+        return np.ascontiguousarray(arr, dtype=np.uint16)
+    try:
+        return np.ascontiguousarray(arr, dtype=np.float32)
+    except (TypeError, ValueError):
+        return seq
+
+
 class HeatmapWorker(QtCore.QObject):
     """
     Background worker that drives heatmap frame updates.
@@ -64,15 +151,32 @@ class HeatmapWorker(QtCore.QObject):
     frame_ready = QtCore.pyqtSignal(np.ndarray)  # Emits BGR frame as numpy array
     fps_report = QtCore.pyqtSignal(float)  # Emits measured FPS
     
-    def __init__(self, animator, fps: float = 64.0):
+    def __init__(self, animator, fps: float = 64.0, pending_source=None):
         super().__init__()
         self.animator = animator
+        # Callable returning (and clearing) the adapter's pending state
+        self._pending_source = pending_source
         self.prerenderer = PreRenderer(animator, capacity=8) if PreRenderer else None
         self.fps = fps
         self._running = False
         self._playing = False
         self._timer = None
         
+        # Monotonic playback clock: frame n is due at _t0 + n / fps
+        self._t0 = time.perf_counter()
+        self._n = 0
+        
+        # Most recently emitted frame, re-emitted as-is while the index is unchanged
+        self._last_emitted_idx = -1
+        self._last_frame = None
+        
+        # Time of the last logged render error (for throttling)
+        self._last_render_error = float('-inf')
+        
+        # FPS measurement window
+        self._fps_window_start = self._t0
+        self._fps_window_frames = 0
+        
     @QtCore.pyqtSlot()
     def start(self):
         """Initialize and start the animation loop."""
@@ -83,13 +187,19 @@ class HeatmapWorker(QtCore.QObject):
         if self.prerenderer:
             self.prerenderer.start()
         
-        # Use QTimer for frame updates (more Qt-friendly than time.sleep loop)
+        # QTimer only wakes the worker; the frame position is derived from
+        # the monotonic clock in _on_tick so timer jitter does not accumulate.
+        # It only runs while playing (see set_playing); requests made while
+        # paused are delivered through apply_pending.
         self._timer = QtCore.QTimer()
+        self._timer.setTimerType(QtCore.Qt.TimerType.PreciseTimer)
         self._timer.timeout.connect(self._on_tick)
         self._update_timer_interval()
-        self._timer.start()
+        self._rebase_clock()
+        if self._playing:
+            self._timer.start()
         
-        print("[HeatmapWorker] Started", flush=True)
+        log.debug("[HeatmapWorker] Started")
     
     @QtCore.pyqtSlot()
     def stop(self):
@@ -107,45 +217,125 @@ class HeatmapWorker(QtCore.QObject):
         if self.prerenderer:
             self.prerenderer.stop()
             
-        print("[HeatmapWorker] Stopped", flush=True)
+        log.debug("[HeatmapWorker] Stopped")
     
     @QtCore.pyqtSlot(bool)
     def set_playing(self, playing: bool):
-        """Enable/disable frame emission."""
+        """Enable/disable frame emission (the timer is stopped while paused)."""
         self._playing = playing
-        if self._playing and self.prerenderer:
-            # Request prerender around current frame
-            self.prerenderer.request(self.animator.frame_idx)
+        if not self._playing:
+            if self._timer and self._timer.isActive():
+                self._timer.stop()
+        else:
+            # Resume counting from the current frame, not from the last start
+            self._rebase_clock()
+            if self._timer and not self._timer.isActive():
+                self._update_timer_interval()
+                self._timer.start()
+            if self.prerenderer:
+                # Request prerender around current frame
+                self.prerenderer.request(self.animator.frame_idx)
     
     @QtCore.pyqtSlot(float)
     def set_fps(self, fps: float):
         """Update animation frame rate."""
         self.fps = max(1.0, float(fps))
         self._update_timer_interval()
+        self._rebase_clock()
         
     @QtCore.pyqtSlot(int)
     def seek(self, frame_idx: int):
         """Jump to specific frame."""
         self.animator.set_frame(frame_idx)
+        self._rebase_clock()
         if self.prerenderer:
             self.prerenderer.request(frame_idx)
         # Emit frame immediately
         self._emit_current_frame()
     
+    @QtCore.pyqtSlot()
+    def apply_pending(self):
+        """Apply the latest coalesced data/seek/rate/parameter requests, if any."""
+        if self._pending_source is None:
+            return
+        pending = self._pending_source()
+        
+        rebuilt = False
+        if pending['data'] is not None:
+            # Build the new animator here rather than on the GUI thread
+            params, left_coords, right_coords, left_seq, right_seq = pending['data']
+            try:
+                animator = Animator(params, left_coords, right_coords)
+                animator.load_sequences(_as_sequence_array(left_seq), _as_sequence_array(right_seq))
+                self._set_animator(animator)
+                rebuilt = True
+            except Exception as e:
+                log.error("[HeatmapWorker] Error loading data: %s", e)
+        
+        if pending['fps'] is not None:
+            self.set_fps(pending['fps'])
+        
+        if pending['params'] is not None or pending['size'] is not None:
+            params = dict(self.animator.params)
+            if pending['params'] is not None:
+                params.update(pending['params'])
+            if pending['size'] is not None:
+                params['wFinal'], params['hFinal'] = pending['size']
+            try:
+                self._set_animator(_apply_params(self.animator, params))
+                rebuilt = True
+            except Exception as e:
+                log.error("[HeatmapWorker] Error applying parameters: %s", e)
+        
+        if pending['seek'] is not None:
+            self.seek(pending['seek'])
+        elif rebuilt:
+            self._emit_current_frame()
+    
+    def _set_animator(self, animator):
+        """Switch to a new (or reconfigured) animator and drop stale pre-rendered frames."""
+        self.animator = animator
+        self._last_frame = None
+        if self.prerenderer:
+            self.prerenderer.animator = animator
+            self.prerenderer.clear()
+    
     def _update_timer_interval(self):
         """Update timer interval based on current FPS."""
-        if self._timer and self._timer.isActive():
+        if self._timer:
             interval_ms = int(1000.0 / self.fps)
             self._timer.setInterval(interval_ms)
     
+    def _rebase_clock(self):
+        """Restart the playback clock from the current frame."""
+        self._t0 = time.perf_counter()
+        self._n = 0
+    
+    def _report_fps(self, now: float):
+        """Count an emitted frame and report the measured FPS about once per second."""
+        self._fps_window_frames += 1
+        elapsed = now - self._fps_window_start
+        if elapsed >= 1.0:
+            self.fps_report.emit(self._fps_window_frames / elapsed)
+            self._fps_window_start = now
+            self._fps_window_frames = 0
+    
     @QtCore.pyqtSlot()
     def _on_tick(self):
         """Called by timer to advance and emit frame."""
+        self.apply_pending()
         if not self._playing:
             return
-            
-        # Advance to next frame
-        self.animator.step(1)
+        
+        # Advance as many frames as are due since the clock was rebased, so
+        # late ticks catch up instead of compounding into lag
+        now = time.perf_counter()
+        target_n = int((now - self._t0) * self.fps)
+        delta = target_n - self._n
+        if delta <= 0:
+            return
+        self.animator.step(delta)
+        self._n = target_n
         
         # Request prerender around current position
         if self.prerenderer:
@@ -153,24 +343,42 @@ class HeatmapWorker(QtCore.QObject):
         
         # Emit current frame
         self._emit_current_frame()
+        self._report_fps(now)
     
     def _emit_current_frame(self):
         """Render and emit the current frame."""
         try:
+            idx = self.animator.frame_idx
+            
+            # Same frame as last time (e.g. repeated seeks while paused):
+            # nothing to render
+            if idx == self._last_emitted_idx and self._last_frame is not None:
+                self.frame_ready.emit(self._last_frame)
+                return
+            
             # Try to get from prerenderer cache first
             frame = None
             if self.prerenderer:
-                frame = self.prerenderer.get(self.animator.frame_idx)
+                frame = self.prerenderer.get(idx)
             
-            # If not in cache, render directly
+            # If not in cache, render into a new array: the emitted frame is
+            # queued to the GUI thread, so it must not be reused afterwards
             if frame is None:
-                frame = self.animator.get_frame()
+                frame = self.animator.render_frame_at(idx)
+            
+            self._last_emitted_idx = idx
+            self._last_frame = frame
             
             # Emit frame (BGR format, as returned by animator)
             self.frame_ready.emit(frame)
             
-        except Exception as e:
-            print(f"[HeatmapWorker] Error rendering frame: {e}", flush=True)
+        except Exception:
+            # Log at most once per second so a persistent error does not
+            # flood the log at the render rate
+            now = time.monotonic()
+            if now - self._last_render_error >= 1.0:
+                self._last_render_error = now
+                log.exception("[HeatmapWorker] Error rendering frame")
 
 
 class HeatmapAdapter(QtCore.QObject):
@@ -191,7 +399,7 @@ class HeatmapAdapter(QtCore.QObject):
         
         # Check if Heatmap_Project modules are available
         if Animator is None:
-            print("[HeatmapAdapter] Warning: Heatmap_Project not available", flush=True)
+            log.warning("[HeatmapAdapter] Heatmap_Project not available")
             self._available = False
             return
         
@@ -212,13 +420,19 @@ class HeatmapAdapter(QtCore.QObject):
         }
         
         # Initialize animator with empty data
-        self.animator = Animator(self.params, [], [])
+        self.animator = Animator(dict(self.params), [], [])
+        self._total_frames = 0
         
         # Worker thread
         self.thread = None
         self.worker = None
         
-        print("[HeatmapAdapter] Initialized", flush=True)
+        # Latest seek/rate/parameter requests, coalesced until the worker
+        # picks them up (last write wins)
+        self._pending_mutex = QtCore.QMutex()
+        self._pending = _empty_pending()
+        
+        log.debug("[HeatmapAdapter] Initialized")
     
     def is_available(self) -> bool:
         """Check if Heatmap_Project modules are available."""
@@ -230,14 +444,15 @@ class HeatmapAdapter(QtCore.QObject):
             return
         
         if self.animator is None:
-            print("[HeatmapAdapter] ERROR: No animator - call set_data() first!", flush=True)
+            log.error("[HeatmapAdapter] No animator - call set_data() first!")
             return
         
         # Store current frame position before creating worker
         current_frame_idx = self.animator.frame_idx
         
         # Create worker and thread
-        self.worker = HeatmapWorker(self.animator, fps=self.params['fps'])
+        self.worker = HeatmapWorker(self.animator, fps=self.params['fps'],
+                                    pending_source=self._take_pending)
         self.thread = QtCore.QThread()
         
         # Move worker to thread
@@ -253,12 +468,9 @@ class HeatmapAdapter(QtCore.QObject):
         
         # Seek to current position to emit initial frame
         if current_frame_idx > 0:
-            QtCore.QMetaObject.invokeMethod(
-                self.worker, 'seek', QtCore.Qt.ConnectionType.QueuedConnection,
-                QtCore.Q_ARG(int, current_frame_idx)
-            )
+            self._post_pending('seek', current_frame_idx)
         
-        print("[HeatmapAdapter] Thread started", flush=True)
+        log.debug("[HeatmapAdapter] Thread started")
     
     def stop(self):
         """Stop the animation thread and cleanup."""
@@ -277,9 +489,22 @@ class HeatmapAdapter(QtCore.QObject):
             self.thread.wait()
             self.thread = None
         
+        # The worker may have rebuilt the animator; keep the latest one and
+        # apply any requests it did not get to
+        if self.worker:
+            self.animator = self.worker.animator
         self.worker = None
-        
-        print("[HeatmapAdapter] Thread stopped", flush=True)
+        pending = self._take_pending()
+        if pending['data'] is not None:
+            params, left_coords, right_coords, left_seq, right_seq = pending['data']
+            self.animator = Animator(params, left_coords, right_coords)
+            self.animator.load_sequences(_as_sequence_array(left_seq), _as_sequence_array(right_seq))
+        if pending['params'] is not None or pending['size'] is not None:
+            self.animator = _apply_params(self.animator, dict(self.params))
+        if pending['seek'] is not None:
+            self.animator.set_frame(pending['seek'])
+        
+        log.debug("[HeatmapAdapter] Thread stopped")
     
     def pause(self):
         """Pause animation (keeps thread alive)."""
@@ -301,10 +526,7 @@ class HeatmapAdapter(QtCore.QObject):
         """Change animation frame rate."""
         self.params['fps'] = hz
         if self.worker:
-            QtCore.QMetaObject.invokeMethod(
-                self.worker, 'set_fps', QtCore.Qt.ConnectionType.QueuedConnection,
-                QtCore.Q_ARG(float, hz)
-            )
+            self._post_pending('fps', float(hz))
     
     def set_data(self, 
                  left_coords: List[Tuple[float, float]], 
@@ -323,49 +545,44 @@ class HeatmapAdapter(QtCore.QObject):
         if not self._available:
             return
         
-        # Recreate animator with new coordinates
-        self.animator = Animator(self.params, left_coords, right_coords)
-        self.animator.load_sequences(left_seq, right_seq)
+        self._total_frames = max(len(left_seq), len(right_seq))
         
-        # Update worker's animator reference
         if self.worker:
-            self.worker.animator = self.animator
-            if self.worker.prerenderer:
-                self.worker.prerenderer.animator = self.animator
+            # The worker builds the new animator in its own thread
+            self._post_pending('data', (dict(self.params), _as_coords_array(left_coords),
+                                        _as_coords_array(right_coords), left_seq, right_seq))
+        else:
+            # Recreate animator with new coordinates; sequences are converted to
+            # arrays once here and shared by any animator rebuilt from this one
+            self.animator = Animator(dict(self.params), _as_coords_array(left_coords),
+                                     _as_coords_array(right_coords))
+            self.animator.load_sequences(_as_sequence_array(left_seq), _as_sequence_array(right_seq))
         
-        print(f"[HeatmapAdapter] Data loaded: {len(left_seq)} frames", flush=True)
+        log.debug("[HeatmapAdapter] Data loaded: %d frames", len(left_seq))
     
     def set_size(self, width: int, height: int):
         """
         Update render dimensions.
         
-        Note: This recreates the animator with new dimensions.
+        Note: This recreates the animator if the dimensions changed.
         """
         if not self._available:
             return
         
+        if (self.params['wFinal'], self.params['hFinal']) == (width, height):
+            return
+        
         # Update parameters
         self.params['wFinal'] = width
         self.params['hFinal'] = height
         
-        # Recreate animator with new size
-        old_left_coords = self.animator.coords_left
-        old_right_coords = self.animator.coords_right
-        old_left_seq = self.animator.left_seq
-        old_right_seq = self.animator.right_seq
-        old_frame_idx = self.animator.frame_idx
-        
-        self.animator = Animator(self.params, old_left_coords, old_right_coords)
-        self.animator.load_sequences(old_left_seq, old_right_seq)
-        self.animator.set_frame(old_frame_idx)
-        
-        # Update worker's animator reference
         if self.worker:
-            self.worker.animator = self.animator
-            if self.worker.prerenderer:
-                self.worker.prerenderer.animator = self.animator
+            # Worker rebuilds the animator once for the latest size
+            self._post_pending('size', (width, height))
+        else:
+            self.animator = _apply_params(self.animator, self.params)
         
-        print(f"[HeatmapAdapter] Size updated: {width}x{height}", flush=True)
+        log.debug("[HeatmapAdapter] Size updated: %dx%d", width, height)
     
     def update_params(self, **kwargs):
         """
@@ -377,6 +594,9 @@ class HeatmapAdapter(QtCore.QObject):
         - trailLength: Number of COP trail points
         - margin: Image margin
         - legendWidth: Colorbar width
+        
+        Only radius/smoothness (and size/grid) changes rebuild the animator;
+        cosmetic parameters are applied to the existing one.
         """
         if not self._available:
             return
@@ -386,24 +606,13 @@ class HeatmapAdapter(QtCore.QObject):
             if key in self.params:
                 self.params[key] = value
         
-        # Recreate animator with new parameters
-        old_left_coords = self.animator.coords_left
-        old_right_coords = self.animator.coords_right
-        old_left_seq = self.animator.left_seq
-        old_right_seq = self.animator.right_seq
-        old_frame_idx = self.animator.frame_idx
-        
-        self.animator = Animator(self.params, old_left_coords, old_right_coords)
-        self.animator.load_sequences(old_left_seq, old_right_seq)
-        self.animator.set_frame(old_frame_idx)
-        
-        # Update worker's animator reference
         if self.worker:
-            self.worker.animator = self.animator
-            if self.worker.prerenderer:
-                self.worker.prerenderer.animator = self.animator
+            # Worker rebuilds the animator once for the latest parameters
+            self._post_pending('params', dict(self.params))
+        else:
+            self.animator = _apply_params(self.animator, self.params)
         
-        print(f"[HeatmapAdapter] Parameters updated: {kwargs}", flush=True)
+        log.debug("[HeatmapAdapter] Parameters updated: %s", kwargs)
     
     def seek(self, frame_idx: int):
         """Jump to specific frame."""
@@ -411,30 +620,71 @@ class HeatmapAdapter(QtCore.QObject):
             return
         
         if self.worker:
-            QtCore.QMetaObject.invokeMethod(
-                self.worker, 'seek', QtCore.Qt.ConnectionType.QueuedConnection,
-                QtCore.Q_ARG(int, frame_idx)
-            )
+            self._post_pending('seek', int(frame_idx))
         else:
             # If worker not running, update animator directly
             self.animator.set_frame(frame_idx)
     
+    def _post_pending(self, key: str, value):
+        """
+        Record a request for the worker, replacing any earlier one of the same kind.
+        
+        Only the first request after the worker drained the pending state
+        queues a wake-up call, so bursts (e.g. slider scrubbing) cost one
+        queued event instead of one per call.
+        """
+        self._pending_mutex.lock()
+        try:
+            was_idle = all(v is None for v in self._pending.values())
+            self._pending[key] = value
+        finally:
+            self._pending_mutex.unlock()
+        
+        if was_idle and self.worker:
+            QtCore.QMetaObject.invokeMethod(
+                self.worker, 'apply_pending', QtCore.Qt.ConnectionType.QueuedConnection
+            )
+    
+    def _take_pending(self) -> dict:
+        """Return the pending requests and reset them (called from the worker thread)."""
+        self._pending_mutex.lock()
+        try:
+            pending = self._pending
+            self._pending = _empty_pending()
+        finally:
+            self._pending_mutex.unlock()
+        return pending
+    
+    def _active_animator(self):
+        """Return the animator currently in use (the worker may have rebuilt it)."""
+        if self.worker:
+            return self.worker.animator
+        return self.animator
+    
     def get_current_frame_index(self) -> int:
         """Get current frame index."""
         if not self._available:
             return 0
-        return self.animator.frame_idx
+        return self._active_animator().frame_idx
     
     def get_total_frames(self) -> int:
         """Get total number of frames."""
         if not self._available:
             return 0
-        return self.animator.n_frames()
+        # Known as soon as set_data returns, even while the worker is still
+        # building the animator
+        return self._total_frames
     
     def show_initial_frame(self):
         """Render and emit the first frame immediately (without starting playback)."""
         if not self._available or self.animator is None:
-            print("[HeatmapAdapter] Cannot show initial frame - not available or no animator", flush=True)
+            log.warning("[HeatmapAdapter] Cannot show initial frame - not available or no animator")
+            return
+        
+        if self.worker:
+            # The worker owns the animator (and may still be loading new data);
+            # let it render frame 0 once pending requests are applied
+            self._post_pending('seek', 0)
             return
         
         try:
@@ -447,7 +697,7 @@ class HeatmapAdapter(QtCore.QObject):
             # Emit the frame directly
             self.frame_ready.emit(frame)
             
-            print("[HeatmapAdapter] Initial frame displayed", flush=True)
+            log.debug("[HeatmapAdapter] Initial frame displayed")
             
         except Exception as e:
-            print(f"[HeatmapAdapter] Error showing initial frame: {e}", flush=True)
+            log.error("[HeatmapAdapter] Error showing initial frame: %s", e)
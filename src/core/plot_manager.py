@@ -28,10 +28,19 @@ from ..constants import (
     CARPET_BACKGROUND_COLOR,
     CARPET_BORDER_COLOR,
     PLOT_UPDATE_INTERVAL,
+    PLOT_USE_OPENGL,
     GAITRITE_CONVERSION_FACTOR,
     SENSOR_GROUP_LABELS,
 )
 
+# pyqtgraph ships Numba-compiled versions of its path building and LUT
+# routines but leaves them off by default; use them when numba is installed
+try:
+    import numba  # noqa: F401
+    pg.setConfigOptions(useNumba=True)
+except ImportError:
+    pass
+
 
 class PlotManager:
     """
@@ -54,6 +63,8 @@ class PlotManager:
         self.gaitrite_plot = gaitrite_plot
         # Optional container widget (provided by VideoPlayer) where a horizontal legend will be placed
         self.legend_container: Optional[QtWidgets.QWidget] = legend_container
+        if PLOT_USE_OPENGL:
+            self._enable_opengl(plot_widget)
         
         # Plot items
         self.plot_items_L: List = []
@@ -61,14 +72,21 @@ class PlotManager:
         
         # Cursor elements
         self.cursor_line: Optional[pg.InfiniteLine] = None
-        self.cursor_segment: Optional[pg.PlotDataItem] = None
-        self.cursor_qline: Optional[QtWidgets.QGraphicsLineItem] = None  # QGraphicsLineItem for Z-control
+        self.cursor_segment: Optional[QtWidgets.QGraphicsLineItem] = None
         self.scatter_L: Optional[pg.ScatterPlotItem] = None
         self.scatter_R: Optional[pg.ScatterPlotItem] = None
         
         # GaitRite elements
         self.gaitrite_trajectory_item: Optional[pg.PlotDataItem] = None
         self.gaitrite_footprint_items: List = []
+        # Persistent GaitRite items: the carpet is drawn once and the footprint
+        # item of each color is refilled with setData on later drawings
+        self._carpet_item: Optional[pg.PlotDataItem] = None
+        self._footprint_items: dict = {}
+        # Trajectory line and its start/end markers, replaced on every drawing
+        self._trajectory_items: List = []
+        # GaitRite view range right after it was last locked to the carpet
+        self._carpet_view_range: Optional[list] = None
         
         # Gait event markers
         self.gait_event_lines: List = []  # List of InfiniteLine items for event markers
@@ -82,17 +100,90 @@ class PlotManager:
         self.r_offset: float = DEFAULT_R_OFFSET
         self.marker_group_index_L: int = 0
         self.marker_group_index_R: int = 0
+        # Arrays of the marker groups (the right one already shifted by
+        # r_offset) and their lengths, resolved once per data set / group
+        # change instead of on every marker update
+        self._arr_L: Optional[np.ndarray] = None
+        self._arr_R: Optional[np.ndarray] = None
+        self._len_L: int = 0
+        self._len_R: int = 0
+        # sums_R_data shifted down by r_offset as plotted (_arr_R is taken from
+        # it), and the offset it was computed with
+        self._sums_R_shifted: Optional[List[np.ndarray]] = None
+        self._shifted_offset: Optional[float] = None
+        # (sums_L, sums_R) lists as passed by the caller, to recognise the
+        # plotted data in update_markers without comparing contents
+        self._marker_sources: tuple = (None, None)
         
         # Fixed line height for cursor (constant vertical span)
         self.fixed_line_height: float = 20000.0  # Fixed height in data units
+
+        # Pens and brushes, built once and shared by every item that uses them
+        self._pens_L = [pg.mkPen(c, width=2) for c in PLOT_COLORS]
+        self._pens_R = [pg.mkPen(c, width=2, style=QtCore.Qt.PenStyle.DashLine) for c in PLOT_COLORS]
+        self._no_pen = pg.mkPen(None)
+        self._marker_brush_L = pg.mkBrush(*MARKER_LEFT_COLOR)
+        self._marker_brush_R = pg.mkBrush(*MARKER_RIGHT_COLOR)
+        self._segment_pen = pg.mkPen(color=(255, 200, 0), width=2)
+        self._cursor_pen = pg.mkPen(CURSOR_COLOR, width=1)
+        self._carpet_pen = pg.mkPen(CARPET_BORDER_COLOR, width=2)
+        self._carpet_brush = pg.mkBrush(*CARPET_BACKGROUND_COLOR)
+        self._trajectory_pen = pg.mkPen('black', width=2)
+        self._endpoint_pen = pg.mkPen('k', width=2)
+        self._start_brush = pg.mkBrush(0, 200, 0)
+        self._end_brush = pg.mkBrush(200, 0, 0)
+        self._footprint_pens = {
+            FOOTPRINT_LEFT_COLOR: pg.mkPen(color=FOOTPRINT_LEFT_COLOR, width=2),
+            FOOTPRINT_RIGHT_COLOR: pg.mkPen(color=FOOTPRINT_RIGHT_COLOR, width=2),
+        }
         
-        # Update throttling
+        # Update throttling (time.monotonic() timestamps)
         self._last_plot_update: float = 0.0
+        self._last_cursor_update: float = 0.0
         self._plot_update_interval: float = PLOT_UPDATE_INTERVAL
         
         # X-axis range tracking (to ensure cursor reaches end of visible range)
         self._x_max: float = 0.0
+
+        # Latest cursor position waiting for the coalescing timer (see
+        # update_cursor_position); the timer lives with the plot widget
+        self._pending_cursor_pos: Optional[float] = None
+        self._cursor_timer = QtCore.QTimer(plot_widget)
+        self._cursor_timer.setSingleShot(True)
+        self._cursor_timer.timeout.connect(self._apply_pending_cursor)
+
+        # (bottom, top) of the cursor segment, cached until the Y range changes
+        self._segment_span: Optional[tuple] = None
+        # CSV index the markers were last drawn at (-1: redraw on next update)
+        self._last_marker_index: int = -1
+        try:
+            self.plot_widget.getViewBox().sigYRangeChanged.connect(self._on_y_range_changed)
+        except Exception:
+            pass
         
+    @staticmethod
+    def _enable_opengl(widget: pg.PlotWidget):
+        """
+        Paint a plot widget through an OpenGL viewport when the platform has one.
+
+        The continuously redrawn CSV curves are then rasterized by the GPU
+        instead of the CPU raster engine. A GL viewport without a usable
+        context paints nothing at all, so the switch is only made after a
+        test context could be created; otherwise the widget keeps its
+        default raster viewport.
+
+        Args:
+            widget: Plot widget to switch to OpenGL painting
+        """
+        try:
+            context = QtGui.QOpenGLContext()
+            if not context.create():
+                print("[PlotManager] No OpenGL context available, using raster painting", flush=True)
+                return
+            widget.useOpenGL(True)
+        except Exception as e:
+            print(f"[PlotManager] OpenGL viewport not available, using raster painting: {e}", flush=True)
+
     def create_csv_plots(self, x_data: np.ndarray, sums_L: List[np.ndarray], 
                          sums_R: List[np.ndarray], r_offset: float = None):
         """
@@ -106,11 +197,75 @@ class PlotManager:
         """
         if r_offset is not None:
             self.r_offset = r_offset
+
+        self._marker_sources = (sums_L, sums_R)
+
+        # Normalize once to C-contiguous float64, the layout pyqtgraph builds
+        # its paths from; conforming arrays pass through without a copy
+        x_data = np.ascontiguousarray(x_data, dtype=np.float64)
+        sums_L = [np.ascontiguousarray(a, dtype=np.float64) for a in sums_L]
+        sums_R = [np.ascontiguousarray(a, dtype=np.float64) for a in sums_R]
         
         # Store data for event Y-range calculation
         self.sums_L_data = sums_L
         self.sums_R_data = sums_R
+        self._sums_R_shifted = None
+        self._refresh_marker_arrays()
+        shifted_R = self._shifted_R()
+        self._segment_span = None
+        
+        # Reload with the same group layout: refill the existing curves and keep
+        # the marker/cursor items instead of tearing the scene down and
+        # rebuilding it; anything else goes through the full rebuild
+        if self._csv_curves_reusable(len(sums_L), len(sums_R)):
+            self.clear_gait_events()
+            self._update_csv_curves(x_data, sums_L, shifted_R)
+            self._reset_cursor_items()
+        else:
+            self._reset_csv_plot()
+            self._create_csv_curves(x_data, sums_L, shifted_R)
         
+        # Determine legend labels: use SENSOR_GROUP_LABELS when we have exactly 3 groups
+        try:
+            if len(sums_L) == 3:
+                group_labels = SENSOR_GROUP_LABELS
+            else:
+                group_labels = [f'Group {i+1}' for i in range(len(sums_L))]
+        except Exception:
+            group_labels = [f'Group {i+1}' for i in range(len(sums_L))]
+
+        # Create scatter items for markers
+        self._create_scatter_items()
+        
+        # Create cursor segment
+        self._create_cursor_segment()
+        
+        # Create cursor line (vertical yellow line for time sync)
+        self.create_cursor_line()
+        
+        # Set Y range with zoom for better visibility
+        self._set_optimal_y_range(sums_L, sums_R)
+        
+        try:
+            if self.legend_container is not None:
+                # Build label/color lists: first all L then all R
+                labels = []
+                colors = []
+                for idx in range(len(self.plot_items_L)):
+                    labels.append(f'L {group_labels[idx]}' if idx < len(group_labels) else f'L Group {idx+1}')
+                    colors.append(pg.mkColor(PLOT_COLORS[idx % len(PLOT_COLORS)]))
+                for idx in range(len(self.plot_items_R)):
+                    labels.append(f'R {group_labels[idx]}' if idx < len(group_labels) else f'R Group {idx+1}')
+                    colors.append(pg.mkColor(PLOT_COLORS[idx % len(PLOT_COLORS)]))
+                self.populate_horizontal_legend(labels, colors)
+            else:
+                # Fallback: do nothing (no legend container provided)
+                pass
+        except Exception:
+            pass
+
+    def _reset_csv_plot(self):
+        """Empty the CSV plot and set up its (read-only, white) appearance."""
         # Clear the plot widget and drop references to any old plot items so
         # they will be recreated and re-added to the new plot scene. This
         # prevents markers/cursor from being 'missing' after a reload because
@@ -198,33 +353,26 @@ class PlotManager:
                 else:
                     # Fallback: hide text pen to make labels invisible
                     try:
-                        axis_left.setTextPen(pg.mkPen(None))
+                        axis_left.setTextPen(self._no_pen)
                     except Exception:
                         pass
             except Exception:
                 pass
         except Exception:
             pass
-        
+
+    def _create_csv_curves(self, x_data: np.ndarray, sums_L: List[np.ndarray], shifted_R: List[np.ndarray]):
+        """Create one curve per left group and per right group (already shifted by r_offset)."""
         self.plot_items_L = []
         self.plot_items_R = []
-        
-        # Determine legend labels: use SENSOR_GROUP_LABELS when we have exactly 3 groups
-        try:
-            if len(sums_L) == 3:
-                group_labels = SENSOR_GROUP_LABELS
-            else:
-                group_labels = [f'Group {i+1}' for i in range(len(sums_L))]
-        except Exception:
-            group_labels = [f'Group {i+1}' for i in range(len(sums_L))]
 
         # Plot each group
         for group_idx in range(len(sums_L)):
             # Left side
             y_L = sums_L[group_idx]
-            pen_L = pg.mkPen(PLOT_COLORS[group_idx % len(PLOT_COLORS)], width=2)
-            label_L = f'L {group_labels[group_idx]}'
+            pen_L = self._pens_L[group_idx % len(PLOT_COLORS)]
             plot_item_L = self.plot_widget.plot(x_data, y_L, pen=pen_L)
+            self._configure_curve(plot_item_L, x_data, y_L)
             # Set low Z-value for data lines so cursor stays on top
             try:
                 plot_item_L.setZValue(0)
@@ -233,49 +381,64 @@ class PlotManager:
             self.plot_items_L.append(plot_item_L)
             
             # Right side
-            if group_idx < len(sums_R):
-                y_R = sums_R[group_idx] - self.r_offset
-                pen_R = pg.mkPen(
-                    PLOT_COLORS[group_idx % len(PLOT_COLORS)], 
-                    width=2, 
-                    style=QtCore.Qt.PenStyle.DashLine
-                )
-                label_R = f'R {group_labels[group_idx]}'
+            if group_idx < len(shifted_R):
+                y_R = shifted_R[group_idx]
+                pen_R = self._pens_R[group_idx % len(PLOT_COLORS)]
                 plot_item_R = self.plot_widget.plot(x_data, y_R, pen=pen_R)
+                self._configure_curve(plot_item_R, x_data, y_R)
                 # Set low Z-value for data lines so cursor stays on top
                 try:
                     plot_item_R.setZValue(0)
                 except Exception:
                     pass
                 self.plot_items_R.append(plot_item_R)
-        
-        # Create scatter items for markers
-        self._create_scatter_items()
-        
-        # Create cursor segment
-        self._create_cursor_segment()
-        
-        # Create cursor line (vertical yellow line for time sync)
-        self.create_cursor_line()
-        
-        # Set Y range with zoom for better visibility
-        self._set_optimal_y_range(sums_L, sums_R)
-        
+
+    def _csv_curves_reusable(self, n_left: int, n_right: int) -> bool:
+        """Whether the current curves and cursor items can be refilled for a new data set."""
+        expected_R = min(n_left, n_right)
+        if len(self.plot_items_L) != n_left or len(self.plot_items_R) != expected_R or n_left == 0:
+            return False
+        items = self.plot_items_L + self.plot_items_R + [self.scatter_L, self.scatter_R, self.cursor_segment, self.cursor_line]
+        # every item must still be on the plot (nothing cleared it meanwhile)
+        return all(item is not None and item.scene() is not None for item in items)
+
+    def _update_csv_curves(self, x_data: np.ndarray, sums_L: List[np.ndarray], shifted_R: List[np.ndarray]):
+        """Refill the existing curves with new data (same group layout)."""
+        for item, y in zip(self.plot_items_L, sums_L):
+            item.setData(x_data, y)
+            self._configure_curve(item, x_data, y)
+        for item, y in zip(self.plot_items_R, shifted_R):
+            item.setData(x_data, y)
+            self._configure_curve(item, x_data, y)
+
+    def _reset_cursor_items(self):
+        """Put the kept cursor items back in the state of freshly created ones."""
+        self.cursor_line.setPos(0)
+        self.cursor_segment.setVisible(False)
+        self._pending_cursor_pos = None
+        if self._cursor_timer.isActive():
+            self._cursor_timer.stop()
+
+    @staticmethod
+    def _configure_curve(item: pg.PlotDataItem, x: np.ndarray, y: np.ndarray):
+        """
+        Let pyqtgraph draw a long data curve at screen resolution.
+
+        Peak downsampling keeps the min/max of the samples that fall on each
+        pixel column, so the drawn shape is unchanged while the path only grows
+        with the plot width; clip-to-view drops samples outside the X range.
+        The per-redraw finite check is skipped once the data is known finite.
+
+        Args:
+            item: Curve returned by PlotWidget.plot()
+            x: X data of the curve
+            y: Y data of the curve
+        """
         try:
-            if self.legend_container is not None:
-                # Build label/color lists: first all L then all R
-                labels = []
-                colors = []
-                for idx in range(len(self.plot_items_L)):
-                    labels.append(f'L {group_labels[idx]}' if idx < len(group_labels) else f'L Group {idx+1}')
-                    colors.append(pg.mkColor(PLOT_COLORS[idx % len(PLOT_COLORS)]))
-                for idx in range(len(self.plot_items_R)):
-                    labels.append(f'R {group_labels[idx]}' if idx < len(group_labels) else f'R Group {idx+1}')
-                    colors.append(pg.mkColor(PLOT_COLORS[idx % len(PLOT_COLORS)]))
-                self.populate_horizontal_legend(labels, colors)
-            else:
-                # Fallback: do nothing (no legend container provided)
-                pass
+            item.setDownsampling(auto=True, method='peak')
+            item.setClipToView(True)
+            if np.isfinite(x).all() and np.isfinite(y).all():
+                item.setSkipFiniteCheck(True)
         except Exception:
             pass
 
@@ -370,38 +533,40 @@ class PlotManager:
         if self.scatter_L is None:
             self.scatter_L = pg.ScatterPlotItem(
                 size=10,
-                pen=pg.mkPen(None),
-                brush=pg.mkBrush(*MARKER_LEFT_COLOR)
+                pen=self._no_pen,
+                brush=self._marker_brush_L
             )
             self.plot_widget.addItem(self.scatter_L)
         
         if self.scatter_R is None:
             self.scatter_R = pg.ScatterPlotItem(
                 size=10,
-                pen=pg.mkPen(None),
-                brush=pg.mkBrush(*MARKER_RIGHT_COLOR)
+                pen=self._no_pen,
+                brush=self._marker_brush_R
             )
             self.plot_widget.addItem(self.scatter_R)
     
     def _create_cursor_segment(self):
         """
         Create cursor segment for highlighting current position.
-        EXACTLY as original - creates PlotDataItem with very high Z-value.
-        QGraphicsLineItem is created dynamically later if needed.
+
+        The segment is a plain QGraphicsLineItem with a very high Z-value: it is
+        moved on every marker update, and setLine() only changes two endpoints
+        where a PlotDataItem.setData() would rebuild its arrays and path.
+        It stays hidden until the first update gives it a position.
         """
-        # Create PlotDataItem as primary method (exactly as original)
         if self.cursor_segment is None:
             try:
                 # Thinner cursor segment for less visual weight
-                seg_pen = pg.mkPen(color=(255, 200, 0), width=2)
-                self.cursor_segment = pg.PlotDataItem(pen=seg_pen)
+                self.cursor_segment = QtWidgets.QGraphicsLineItem()
+                self.cursor_segment.setPen(self._segment_pen)
+                self.cursor_segment.setVisible(False)
                 # add after plotting so it renders on top; force very high Z
                 self.plot_widget.addItem(self.cursor_segment)
                 try:
                     self.cursor_segment.setZValue(10**6)
                 except Exception:
                     pass
-                self.cursor_segment.setData(x=[], y=[])
             except Exception:
                 self.cursor_segment = None
         
@@ -425,7 +590,7 @@ class PlotManager:
             self.cursor_line = pg.InfiniteLine(
                 pos=0, 
                 angle=90, 
-                pen=pg.mkPen(CURSOR_COLOR, width=1)
+                pen=self._cursor_pen
             )
             self.plot_widget.addItem(self.cursor_line)
         
@@ -436,9 +601,17 @@ class PlotManager:
                               sums_R: Optional[List[np.ndarray]] = None,
                               csv_idx: Optional[int] = None,
                               csv_len: Optional[int] = None,
-                              at_last_video_frame: bool = False):
+                              at_last_video_frame: bool = False,
+                              force: bool = False):
         """
         Update cursor line position based on video time.
+
+        Updates are coalesced to at most one per PLOT_UPDATE_INTERVAL: a call
+        arriving sooner only records the position, and a single-shot timer
+        moves the cursor to the latest recorded one when the interval is up.
+        Fast playback or scrubbing therefore repaints the cursor at a bounded
+        rate without losing its final position. Pass force=True to move it
+        immediately (seeks, stepping, the final frame).
         
         Args:
             time_seconds: Current video time in seconds
@@ -447,19 +620,42 @@ class PlotManager:
             csv_idx: CSV index (optional, for backward compatibility)
             csv_len: Total CSV length (optional, to detect last sample)
             at_last_video_frame: Flag indicating we're at the last video frame
+            force: Move the cursor now even if the previous update was too recent
         """
+        # When at the last video frame, always position cursor at the end of visible range
+        # This handles cases where video is longer than CSV data
+        if at_last_video_frame and self._x_max > 0:
+            # Position cursor at exact end of visible plot range
+            pos = self._x_max
+        else:
+            # Normal positioning based on provided time
+            # Clamp to valid range to prevent cursor going beyond plot bounds
+            pos = time_seconds
+            if self._x_max > 0:
+                pos = max(0.0, min(time_seconds, self._x_max))
+
+        if not force:
+            wait = self._plot_update_interval - (time.monotonic() - self._last_cursor_update)
+            if wait > 0:
+                self._pending_cursor_pos = pos
+                if not self._cursor_timer.isActive():
+                    self._cursor_timer.start(max(1, int(wait * 1000)))
+                return
+        self._move_cursor(pos)
+
+    def _move_cursor(self, pos: float):
+        """Move the cursor line now, superseding any coalesced update."""
+        self._pending_cursor_pos = None
+        if self._cursor_timer.isActive():
+            self._cursor_timer.stop()
+        self._last_cursor_update = time.monotonic()
         if self.cursor_line is not None:
-            # When at the last video frame, always position cursor at the end of visible range
-            # This handles cases where video is longer than CSV data
-            if at_last_video_frame and self._x_max > 0:
-                # Position cursor at exact end of visible plot range
-                self.cursor_line.setPos(self._x_max)
-            else:
-                # Normal positioning based on provided time
-                # Clamp to valid range to prevent cursor going beyond plot bounds
-                if self._x_max > 0:
-                    time_seconds = max(0.0, min(time_seconds, self._x_max))
-                self.cursor_line.setPos(time_seconds)
+            self.cursor_line.setPos(pos)
+
+    def _apply_pending_cursor(self):
+        """Timer slot: move the cursor to the latest coalesced position."""
+        if self._pending_cursor_pos is not None:
+            self._move_cursor(self._pending_cursor_pos)
     
     def set_plot_x_range(self, x_min: float, x_max: float):
         """
@@ -470,6 +666,13 @@ class PlotManager:
             x_max: Maximum X value (time in seconds)
         """
         self._x_max = x_max  # Store for cursor positioning
+        # Nothing else moves this plot's X range (mouse and auto-range are off),
+        # so an unchanged range needs no view update and signal round
+        try:
+            if self.plot_widget.getViewBox().viewRange()[0] == [x_min, x_max]:
+                return
+        except Exception:
+            pass
         print(f"[PlotManager] set_plot_x_range: x_min={x_min:.4f}, x_max={x_max:.4f}", flush=True)
         self.plot_widget.setXRange(x_min, x_max, padding=0)
     
@@ -485,7 +688,13 @@ class PlotManager:
             sums_L: Left side data groups
             sums_R: Right side data groups
         """
-        current_time = time.time()
+        # Paused or slow scrubbing repeats the same index; the markers already
+        # show it unless something they depend on changed meanwhile
+        if (csv_index == self._last_marker_index and sums_L is self._marker_sources[0]
+                and sums_R is self._marker_sources[1] and self.r_offset == self._shifted_offset):
+            return
+        
+        current_time = time.monotonic()
         do_update = (current_time - self._last_plot_update) >= self._plot_update_interval
         
         if not do_update:
@@ -497,50 +706,65 @@ class PlotManager:
             return
             
         x_val = x_data[csv_index]
+
+        if sums_L is not self._marker_sources[0] or sums_R is not self._marker_sources[1]:
+            # data other than what was plotted: resolve the marker arrays again
+            self._marker_sources = (sums_L, sums_R)
+            self.sums_L_data = sums_L
+            self.sums_R_data = sums_R
+            self._sums_R_shifted = None
+            self._refresh_marker_arrays()
+        elif self.r_offset != self._shifted_offset:
+            # r_offset was changed since the shifted arrays were built
+            self._refresh_marker_arrays()
         
-        # Update left marker
-        yL = 0.0
-        if self.marker_group_index_L < len(sums_L):
-            arrL = sums_L[self.marker_group_index_L]
-            if csv_index < len(arrL):
-                yL = float(arrL[csv_index])
-                if self.scatter_L is not None:
-                    self.scatter_L.setData([x_val], [yL])
+        # Update left/right markers. The segment replaces them visually, so
+        # they are normally hidden; setData rebuilds a scatter item's point
+        # list, so it is only spent on a marker that is actually shown
+        scatter_L = self.scatter_L
+        if scatter_L is not None and csv_index < self._len_L and scatter_L.isVisible():
+            scatter_L.setData([x_val], [float(self._arr_L[csv_index])])
         
-        # Update right marker
-        yR_shifted = 0.0 - self.r_offset
-        if self.marker_group_index_R < len(sums_R):
-            arrR = sums_R[self.marker_group_index_R]
-            if csv_index < len(arrR):
-                yR = float(arrR[csv_index])
-                yR_shifted = yR - self.r_offset
-                if self.scatter_R is not None:
-                    self.scatter_R.setData([x_val], [yR_shifted])
+        scatter_R = self.scatter_R
+        if scatter_R is not None and csv_index < self._len_R and scatter_R.isVisible():
+            scatter_R.setData([x_val], [float(self._arr_R[csv_index])])
         
         # Draw vertical line that moves in X axis with FIXED height
-        # Line has fixed Y coordinates covering the full data range
-        if self.cursor_segment is not None:
-            try:
-                # Prefer the current visible Y range so the cursor matches the plotted viewport
-                try:
-                    vb = self.plot_widget.getViewBox()
-                    vr = vb.viewRange()  # returns [xRange, yRange]
-                    y_min, y_max = float(vr[1][0]), float(vr[1][1])
-                except Exception:
-                    y_min, y_max = None, None
+        # Line has fixed Y coordinates covering the full data range; they are
+        # resolved once per Y range change, so this per-frame path has no
+        # view queries and no exception handling
+        segment = self.cursor_segment
+        if segment is not None:
+            span = self._segment_span
+            if span is None:
+                span = self._segment_span = self._compute_segment_span()
+            # Line moves only in X direction, Y coordinates stay constant
+            segment.setLine(x_val, span[0], x_val, span[1])
+            if not segment.isVisible():
+                segment.setVisible(True)
+        
+        self._last_marker_index = csv_index
 
-                if y_min is None or y_max is None or y_min == y_max:
-                    # Fallback: compute a span that covers left (near 0) and right (shifted by -r_offset)
-                    half_h = self.fixed_line_height / 2.0
-                    y_top = half_h
-                    y_bottom = -self.r_offset - half_h
-                else:
-                    y_bottom, y_top = y_min, y_max
+    def _compute_segment_span(self) -> tuple:
+        """Return the (bottom, top) Y coordinates of the cursor segment."""
+        # Prefer the current visible Y range so the cursor matches the plotted viewport
+        try:
+            vb = self.plot_widget.getViewBox()
+            vr = vb.viewRange()  # returns [xRange, yRange]
+            y_min, y_max = float(vr[1][0]), float(vr[1][1])
+        except Exception:
+            y_min, y_max = None, None
 
-                # Line moves only in X direction, Y coordinates stay constant
-                self.cursor_segment.setData(x=[x_val, x_val], y=[y_bottom, y_top])
-            except Exception:
-                pass
+        if y_min is None or y_max is None or y_min == y_max:
+            # Fallback: compute a span that covers left (near 0) and right (shifted by -r_offset)
+            half_h = self.fixed_line_height / 2.0
+            return (-self.r_offset - half_h, half_h)
+        return (y_min, y_max)
+
+    def _on_y_range_changed(self, *args):
+        """Drop the cached cursor segment span when the plot's Y range changes."""
+        self._segment_span = None
+        self._last_marker_index = -1
     
     
     def draw_gaitrite_footprints(self, footprints_left: Optional[pd.DataFrame],
@@ -555,11 +779,10 @@ class PlotManager:
             footprints_right: Right footprint data
             gaitrite_df: Main GaitRite data for trajectory (optional)
         """
-        self.gaitrite_plot.clear()
-        self.gaitrite_footprint_items = []
-        
-        # Draw carpet background first
-        self._draw_carpet_background()
+        # Keep the carpet and reuse the footprint items; only the previous
+        # trajectory is removed from the plot
+        self._clear_gaitrite_items()
+        self._ensure_carpet()
         
         # Draw trajectory if GaitRite data is available
         if gaitrite_df is not None:
@@ -577,8 +800,43 @@ class PlotManager:
         
         # If we drew any footprints or trajectory, lock the view to the carpet
         # so the drawing appears exactly in carpet coordinates and scale.
+        self._lock_view_to_carpet()
+
+        # If nothing was drawn (no footprints/trajectory), fallback to auto-adjust
+        if not drew_any:
+            self._auto_adjust_gaitrite_view()
+
+    def draw_gaitrite_carpet(self):
+        """Show the empty GaitRite carpet (no footprints or trajectory)."""
+        self._clear_gaitrite_items()
+        self._ensure_carpet()
+        self._lock_view_to_carpet()
+
+    def _clear_gaitrite_items(self):
+        """Remove the previous trajectory and empty the footprint items."""
+        for item in self._trajectory_items:
+            try:
+                self.gaitrite_plot.removeItem(item)
+            except Exception:
+                pass
+        self._trajectory_items = []
+        self.gaitrite_trajectory_item = None
+        for item in self._footprint_items.values():
+            try:
+                item.setData([], [])
+            except Exception:
+                pass
+        self.gaitrite_footprint_items = []
+
+    def _lock_view_to_carpet(self):
+        """Show exactly the carpet area at a 1:1 aspect ratio."""
         try:
             vb = self.gaitrite_plot.getViewBox()
+            # Still showing what the last lock produced (no resize or other
+            # range change since): setting the same ranges again would only
+            # recompute the view and re-emit its range signals
+            if self._carpet_view_range is not None and vb.viewRange() == self._carpet_view_range:
+                return
             # Lock aspect ratio 1:1 so X/Y use same scale (shape preserved)
             try:
                 vb.setAspectLocked(True)
@@ -597,12 +855,14 @@ class PlotManager:
                 vb.disableAutoRange()
             except Exception:
                 pass
+            self._carpet_view_range = vb.viewRange()
         except Exception:
             pass
 
-        # If nothing was drawn (no footprints/trajectory), fallback to auto-adjust
-        if not drew_any:
-            self._auto_adjust_gaitrite_view()
+    def _ensure_carpet(self):
+        """Draw the carpet background unless it is already on the plot."""
+        if self._carpet_item is None or self._carpet_item.scene() is None:
+            self._carpet_item = self._draw_carpet_background()
     
     def _draw_carpet_background(self):
         """
@@ -613,12 +873,17 @@ class PlotManager:
         bg_x = [0, CARPET_WIDTH_CM, CARPET_WIDTH_CM, 0, 0]
         bg_y = [0, 0, CARPET_LENGTH_CM, CARPET_LENGTH_CM, 0]
         
-        self.gaitrite_plot.plot(
+        carpet_item = self.gaitrite_plot.plot(
             bg_x, bg_y,
-            pen=pg.mkPen(CARPET_BORDER_COLOR, width=2),
+            pen=self._carpet_pen,
             fillLevel=0,
-            brush=pg.mkBrush(*CARPET_BACKGROUND_COLOR)
+            brush=self._carpet_brush,
+            # constant, finite outline: no per-draw NaN/Inf scan needed
+            connect='all',
+            skipFiniteCheck=True
         )
+        self._cache_static_item(carpet_item)
+        return carpet_item
     
     def _draw_gaitrite_trajectory(self, gaitrite_df: pd.DataFrame):
         """
@@ -629,18 +894,16 @@ class PlotManager:
             gaitrite_df: DataFrame with columns Ybottom, Ytop, Xback, Xfront
         """
         try:
-            traj_x = []
-            traj_y = []
-            
             # Check for required columns (exactly as in original)
             if all(c in gaitrite_df.columns for c in ('Ybottom', 'Ytop', 'Xback', 'Xfront')):
-                # Compute centers using midpoints (EXACT formula from original)
-                ctr_x = (((gaitrite_df['Ybottom'].astype(float) + gaitrite_df['Ytop'].astype(float)) / 2.0) 
-                         * GAITRITE_CONVERSION_FACTOR).values
-                ctr_y = (((gaitrite_df['Xback'].astype(float) + gaitrite_df['Xfront'].astype(float)) / 2.0) 
-                         * GAITRITE_CONVERSION_FACTOR).values
-                traj_x = list(ctr_x)
-                traj_y = list(ctr_y)
+                # Compute centers using midpoints (EXACT formula from original),
+                # on plain float arrays that are handed to pyqtgraph as they are
+                yb = gaitrite_df['Ybottom'].to_numpy(dtype=np.float64)
+                yt = gaitrite_df['Ytop'].to_numpy(dtype=np.float64)
+                xb = gaitrite_df['Xback'].to_numpy(dtype=np.float64)
+                xf = gaitrite_df['Xfront'].to_numpy(dtype=np.float64)
+                traj_x = ((yb + yt) / 2.0) * GAITRITE_CONVERSION_FACTOR
+                traj_y = ((xb + xf) / 2.0) * GAITRITE_CONVERSION_FACTOR
             else:
                 print(f"[PlotManager] Missing required columns for trajectory")
                 return
@@ -648,45 +911,40 @@ class PlotManager:
             # Draw trajectory if we have at least 2 points (exactly as in original)
             if len(traj_x) > 1:
                 # Draw BLACK line (NOT blue) - exactly as original
+                # Checked once here so pyqtgraph can skip its NaN/Inf scan
+                # of a fully finite path on every redraw
+                finite = bool(np.isfinite(traj_x).all() and np.isfinite(traj_y).all())
                 self.gaitrite_trajectory_item = self.gaitrite_plot.plot(
                     traj_x, traj_y,
-                    pen=pg.mkPen('black', width=2)  # BLACK, not blue!
+                    pen=self._trajectory_pen,  # BLACK, not blue!
+                    skipFiniteCheck=finite
                 )
                 # Set Z-value high so trajectory is above footprints
                 try:
                     self.gaitrite_trajectory_item.setZValue(1000)
                 except Exception:
                     pass
+                self._cache_static_item(self.gaitrite_trajectory_item)
+                self._trajectory_items.append(self.gaitrite_trajectory_item)
                 
-                # Mark start (green) and end (red) points - BIGGER SIZE
+                # Mark start (green) and end (red) points - BIGGER SIZE.
+                # One scatter item with a brush per point (the end point is
+                # drawn last, on top, as when they were separate items)
                 try:
-                    # Start point - GREEN (BIGGER)
-                    start_marker = pg.ScatterPlotItem(
-                        size=12,
-                        brush=pg.mkBrush(0, 200, 0),  # Green
-                        pen=pg.mkPen('k', width=2)
+                    endpoints = pg.ScatterPlotItem(size=12, pen=self._endpoint_pen)
+                    endpoints.setData(
+                        x=[traj_x[0], traj_x[-1]],
+                        y=[traj_y[0], traj_y[-1]],
+                        brush=[self._start_brush, self._end_brush]  # Green, Red
                     )
-                    start_marker.setData(x=[traj_x[0]], y=[traj_y[0]])
                     # Set Z-value even higher for markers
                     try:
-                        start_marker.setZValue(2000)
+                        endpoints.setZValue(2000)
                     except Exception:
                         pass
-                    self.gaitrite_plot.addItem(start_marker)
-                    
-                    # End point - RED (BIGGER)
-                    end_marker = pg.ScatterPlotItem(
-                        size=12,
-                        brush=pg.mkBrush(200, 0, 0),  # Red
-                        pen=pg.mkPen('k', width=2)
-                    )
-                    end_marker.setData(x=[traj_x[-1]], y=[traj_y[-1]])
-                    # Set Z-value even higher for markers
-                    try:
-                        end_marker.setZValue(2000)
-                    except Exception:
-                        pass
-                    self.gaitrite_plot.addItem(end_marker)
+                    self.gaitrite_plot.addItem(endpoints)
+                    self._cache_static_item(endpoints)
+                    self._trajectory_items.append(endpoints)
                 except Exception:
                     pass
                 
@@ -698,6 +956,11 @@ class PlotManager:
     def _plot_footprint_group(self, footprints: pd.DataFrame, color: str, side: str):
         """
         Plot footprint contours (EXACTLY as original ephy.py).
+
+        All contours of one side are drawn by a single PlotDataItem: they are
+        concatenated with a NaN after each one and plotted with
+        connect='finite', so every contour is still its own polyline but Qt
+        handles one item and one path instead of one per (gait_id, event).
         
         Args:
             footprints: DataFrame with columns: x_cm, y_cm, gait_id, event, sample_idx
@@ -707,8 +970,8 @@ class PlotManager:
         try:
             if footprints is None or footprints.empty:
                 return
-            
-            drew_count = 0
+            if 'x_cm' not in footprints.columns or 'y_cm' not in footprints.columns:
+                return
             
             # Check if we have gait_id column for grouping
             if 'gait_id' in footprints.columns:
@@ -718,53 +981,105 @@ class PlotManager:
             else:
                 group_col = None
             
-            if group_col is not None:
-                # Draw polygons grouped by gait_id and event
-                for gait_val, gait_group in footprints.groupby(group_col):
-                    # Check if we have event column
-                    if 'event' in gait_group.columns:
-                        event_groups = gait_group.groupby('event')
-                    else:
-                        event_groups = [(None, gait_group)]
-                    
-                    for event_val, event_group in event_groups:
-                        # Sort by sample_idx if available
-                        if 'sample_idx' in event_group.columns:
-                            grp_sorted = event_group.sort_values('sample_idx')
-                        else:
-                            grp_sorted = event_group
-                        
-                        # Draw contour if we have x_cm and y_cm
-                        if 'x_cm' in grp_sorted.columns and 'y_cm' in grp_sorted.columns:
-                            x_vals = grp_sorted['x_cm'].values
-                            y_vals = grp_sorted['y_cm'].values
-                            
-                            # Draw the contour line (exactly as original)
-                            footprint_item = self.gaitrite_plot.plot(
-                                x_vals, y_vals,
-                                pen=pg.mkPen(color=color, width=2)
-                            )
-                            self.gaitrite_footprint_items.append(footprint_item)
-                            drew_count += 1
-            else:
-                # No grouping column - draw all points as single contour
-                if 'x_cm' in footprints.columns and 'y_cm' in footprints.columns:
-                    x_vals = footprints['x_cm'].values
-                    y_vals = footprints['y_cm'].values;
-                    
+            x_vals, y_vals, drew_count = self._footprint_contours(footprints, group_col)
+            if drew_count > 0:
+                footprint_item = self._footprint_items.get(color)
+                if footprint_item is not None and footprint_item.scene() is not None:
+                    # refill the item kept from the previous drawing
+                    footprint_item.setData(x_vals, y_vals, connect='finite')
+                else:
                     footprint_item = self.gaitrite_plot.plot(
                         x_vals, y_vals,
-                        pen=pg.mkPen(color=color, width=2)
+                        pen=self._footprint_pen(color),
+                        connect='finite'
                     )
-                    self.gaitrite_footprint_items.append(footprint_item)
-                    drew_count = 1
-            
-            if drew_count > 0:
+                    self._cache_static_item(footprint_item)
+                    self._footprint_items[color] = footprint_item
+                self.gaitrite_footprint_items.append(footprint_item)
                 print(f"[PlotManager] Drew {drew_count} {side} footprint contours", flush=True)
             
         except Exception as e:
             print(f"[PlotManager] Error plotting {side} footprints: {e}", flush=True)
     
+    @staticmethod
+    def _footprint_contours(footprints: pd.DataFrame, group_col: Optional[str]):
+        """
+        Lay out the footprint contours as NaN-separated polylines.
+
+        One contour per (group_col, event) pair, in the order groupby would
+        give (sorted keys, rows with a missing key dropped), each sorted by
+        sample_idx when available. Rows are ordered with one lexsort and the
+        contours are split where the key changes, instead of two nested
+        groupby passes.
+
+        Args:
+            footprints: DataFrame with x_cm, y_cm and optionally group_col, event, sample_idx
+            group_col: Name of the gait id column, or None for a single contour
+
+        Returns:
+            (x, y, n_contours), with a NaN after every contour in x and y
+        """
+        x = footprints['x_cm'].to_numpy(dtype=np.float64)
+        y = footprints['y_cm'].to_numpy(dtype=np.float64)
+        if group_col is None:
+            # No grouping column - all points as a single contour
+            return np.append(x, np.nan), np.append(y, np.nan), 1
+
+        key_cols = [group_col] + (['event'] if 'event' in footprints.columns else [])
+        # sorted integer codes per key column; -1 marks a missing key
+        codes = [pd.factorize(footprints[col], sort=True)[0] for col in key_cols]
+        # np.lexsort sorts by its last key first: group, then event, then sample_idx
+        sort_keys = list(reversed(codes))
+        if 'sample_idx' in footprints.columns:
+            sort_keys.insert(0, footprints['sample_idx'].to_numpy())
+        order = np.lexsort(sort_keys)
+        valid = np.all([c >= 0 for c in codes], axis=0)
+        order = order[valid[order]]
+        if order.size == 0:
+            return np.empty(0), np.empty(0), 0
+
+        # contour number of every kept row (the key changes at a new contour)
+        key = codes[0][order].astype(np.int64)
+        if len(codes) > 1:
+            key = key * (int(codes[1].max()) + 1) + codes[1][order]
+        contour = np.concatenate(([0], np.cumsum(key[1:] != key[:-1])))
+        n_contours = int(contour[-1]) + 1
+        # row i goes to i + contour[i]; the slot after each contour stays NaN
+        dest = np.arange(order.size) + contour
+        x_out = np.full(order.size + n_contours, np.nan)
+        y_out = np.full(order.size + n_contours, np.nan)
+        x_out[dest] = x[order]
+        y_out[dest] = y[order]
+        return x_out, y_out, n_contours
+
+    @staticmethod
+    def _cache_static_item(item: QtWidgets.QGraphicsItem):
+        """
+        Let Qt keep a screen-space pixmap of an item that does not change.
+
+        With DeviceCoordinateCache the item is rasterized once per view
+        transform and blitted on later repaints. A PlotDataItem paints through
+        its curve and scatter children, so the cache mode is set on those.
+        Only for static items: moving ones (cursor line/segment) would
+        re-rasterize the cache on every update.
+        """
+        mode = QtWidgets.QGraphicsItem.CacheMode.DeviceCoordinateCache
+        try:
+            item.setCacheMode(mode)
+            if isinstance(item, pg.PlotDataItem):
+                item.curve.setCacheMode(mode)
+                item.scatter.setCacheMode(mode)
+        except Exception:
+            pass
+
+    def _footprint_pen(self, color) -> QtGui.QPen:
+        """Return the cached contour pen for a footprint color."""
+        pen = self._footprint_pens.get(color)
+        if pen is None:
+            pen = pg.mkPen(color=color, width=2)
+            self._footprint_pens[color] = pen
+        return pen
+
     def _auto_adjust_gaitrite_view(self):
         """
         Auto-adjust GaitRite plot view to fit all data.
@@ -773,7 +1088,8 @@ class PlotManager:
         try:
             self.gaitrite_plot.disableAutoRange()
             
-            # Collect all x,y data from all items
+            # Collect the finite x,y data of all items as arrays (footprint
+            # items hold NaN separators between contours)
             all_x = []
             all_y = []
             
@@ -783,15 +1099,24 @@ class PlotManager:
                     if d is None:
                         continue
                     xs, ys = d
-                    all_x.extend(list(xs))
-                    all_y.extend(list(ys))
+                    if xs is None or ys is None:
+                        continue
+                    xs = np.asarray(xs, dtype=np.float64)
+                    ys = np.asarray(ys, dtype=np.float64)
+                    xs = xs[np.isfinite(xs)]
+                    ys = ys[np.isfinite(ys)]
+                    if xs.size > 0 and ys.size > 0:
+                        all_x.append(xs)
+                        all_y.append(ys)
                 except Exception:
                     continue
             
             # Set range based on actual data or fallback to carpet size
             if len(all_x) > 0 and len(all_y) > 0:
-                minx, maxx = min(all_x), max(all_x)
-                miny, maxy = min(all_y), max(all_y)
+                minx = min(float(a.min()) for a in all_x)
+                maxx = max(float(a.max()) for a in all_x)
+                miny = min(float(a.min()) for a in all_y)
+                maxy = max(float(a.max()) for a in all_y)
                 padding_x = max(1.0, (maxx - minx) * 0.10)
                 padding_y = max(1.0, (maxy - miny) * 0.08)
                 self.gaitrite_plot.setXRange(minx - padding_x, maxx + padding_x, padding=0)
@@ -809,10 +1134,41 @@ class PlotManager:
     def set_marker_group_L(self, group_index: int):
         """Set the group index for left marker."""
         self.marker_group_index_L = group_index
+        self._refresh_marker_arrays()
     
     def set_marker_group_R(self, group_index: int):
         """Set the group index for right marker."""
         self.marker_group_index_R = group_index
+        self._refresh_marker_arrays()
+
+    def _refresh_marker_arrays(self):
+        """Resolve the arrays followed by the left/right markers and their lengths."""
+        self._last_marker_index = -1
+        self._arr_L, self._len_L = self._marker_array(self.sums_L_data, self.marker_group_index_L)
+        self._arr_R, self._len_R = self._marker_array(self._shifted_R(), self.marker_group_index_R)
+
+    def _shifted_R(self) -> Optional[List[np.ndarray]]:
+        """Return sums_R_data shifted down by r_offset, computed once per data set and offset."""
+        if self.sums_R_data is None:
+            self._shifted_offset = self.r_offset
+            return None
+        if self._sums_R_shifted is None or self._shifted_offset != self.r_offset:
+            try:
+                # one broadcast subtraction for all groups; rows index like the list
+                self._sums_R_shifted = np.stack(self.sums_R_data) - self.r_offset
+            except ValueError:
+                # groups of different lengths (or none at all)
+                self._sums_R_shifted = [arr - self.r_offset for arr in self.sums_R_data]
+            self._shifted_offset = self.r_offset
+        return self._sums_R_shifted
+
+    @staticmethod
+    def _marker_array(sums: Optional[List[np.ndarray]], group_index: int):
+        """Return (array, length) of one marker group, or (None, 0) if it does not exist."""
+        if sums is None or not 0 <= group_index < len(sums):
+            return None, 0
+        arr = sums[group_index]
+        return arr, len(arr)
     
     def _set_optimal_y_range(self, sums_L: List[np.ndarray], sums_R: List[np.ndarray]):
         """
@@ -823,20 +1179,13 @@ class PlotManager:
             sums_R: Right side data groups
         """
         try:
-            # Collect all Y values to determine the range
-            all_y_values = []
+            # Extents per side, R with its offset
+            ranges = [r for r in (self._data_extent(sums_L, 0),
+                                  self._data_extent(sums_R, -self.r_offset)) if r is not None]
             
-            # Add all L values
-            for arr in sums_L:
-                all_y_values.extend(arr.flatten())
-            
-            # Add all R values (with offset)
-            for arr in sums_R:
-                all_y_values.extend((arr - self.r_offset).flatten())
-            
-            if len(all_y_values) > 0:
-                y_min = np.min(all_y_values)
-                y_max = np.max(all_y_values)
+            if ranges:
+                y_min = min(r[0] for r in ranges)
+                y_max = max(r[1] for r in ranges)
                 
                 y_range = y_max - y_min
                 padding = y_range * 0.4
@@ -869,6 +1218,9 @@ class PlotManager:
         y_min_L, y_max_L = self._get_y_range_for_data(self.sums_L_data, 0)  # L without offset
         y_min_R, y_max_R = self._get_y_range_for_data(self.sums_R_data, -self.r_offset)  # R with offset
         
+        # One dashed pen per event color, shared by all markers of that color
+        event_pens = {}
+
         # Helper function to add event markers with limited Y range
         def add_event_markers(events: list, color: str, label: str, foot: str):
             # Determine Y range based on foot
@@ -877,6 +1229,11 @@ class PlotManager:
             else:  # foot == 'R'
                 y_min, y_max = y_min_R, y_max_R
             
+            pen = event_pens.get(color)
+            if pen is None:
+                pen = pg.mkPen(color, width=2, style=QtCore.Qt.PenStyle.DashLine)
+                event_pens[color] = pen
+
             for idx in events:
                 # Convert sample index to time
                 time_sec = idx / sampling_rate
@@ -885,7 +1242,7 @@ class PlotManager:
                 line = pg.PlotDataItem(
                     [time_sec, time_sec],
                     [y_min, y_max],
-                    pen=pg.mkPen(color, width=2, style=QtCore.Qt.PenStyle.DashLine)
+                    pen=pen
                 )
                 
                 # Add label using TextItem
@@ -984,20 +1341,29 @@ class PlotManager:
         Returns:
             (y_min, y_max) tuple
         """
-        if not sums_data:
-            return (0, 0)
-        
+        extent = self._data_extent(sums_data, offset)
+        return extent if extent is not None else (0, 0)
+
+    @staticmethod
+    def _data_extent(sums_data: Optional[List[np.ndarray]], offset: float = 0) -> Optional[tuple[float, float]]:
+        """
+        (min, max) of a set of data arrays shifted by offset, or None if there are no values.
+
+        The arrays are reduced in place and the offset is applied to the two
+        results, which gives the same extent as shifting every sample first.
+        """
+        if sums_data is None:
+            return None
         try:
-            all_values = []
-            for arr in sums_data:
-                all_values.extend((arr + offset).flatten())
-            
-            if all_values:
-                return (float(np.min(all_values)), float(np.max(all_values)))
+            arrays = [np.asarray(arr) for arr in sums_data]
+            arrays = [arr for arr in arrays if arr.size]
+            if not arrays:
+                return None
+            y_min = float(np.min([arr.min() for arr in arrays])) + offset
+            y_max = float(np.max([arr.max() for arr in arrays])) + offset
+            return (y_min, y_max)
         except Exception:
-            pass
-        
-        return (0, 0)
+            return None
     
     def update_legend_with_events(self, show_events: bool):
         """
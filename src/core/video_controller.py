@@ -9,32 +9,352 @@ Handles all video playback operations including:
 - Playback speed control
 """
 
+import enum
+import logging
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from typing import Optional
 import cv2
+import numpy as np
 from PyQt6 import QtCore
 
+from ..constants import (
+    VIDEO_FRAME_CACHE_FRAMES,
+    VIDEO_FRAME_CACHE_MAX_MB,
+    VIDEO_PREFETCH_FRAMES,
+    VIDEO_MAX_LATENESS_S,
+    VIDEO_FILMSTRIP_INTERVAL_S,
+    VIDEO_FILMSTRIP_WIDTH,
+    VIDEO_FILMSTRIP_MAX_MB,
+    VIDEO_HWACCEL_DEVICE,
+)
 
-class VideoController:
+# PyAV (libav bindings) seeks to keyframes and decodes forward from there,
+# which is much faster than OpenCV's frame-position seeks on H.264/H.265;
+# it is optional and OpenCV is used when it is missing
+try:
+    import av
+except ImportError:
+    av = None
+
+# Messages are formatted only when the level is enabled; main() sends them
+# through a queue so a burst of decode errors does not block the GUI thread
+log = logging.getLogger(__name__)
+
+
+class _PyAVCapture:
+    """
+    Minimal cv2.VideoCapture look-alike backed by PyAV.
+
+    Implements the subset of the VideoCapture interface the controller uses
+    (isOpened, get, set, grab, retrieve, read, release) so both backends are
+    interchangeable. As with OpenCV, grab() decodes without producing an
+    image and retrieve() converts the grabbed frame to BGR.
+    Setting CAP_PROP_POS_FRAMES is lazy: the next grab() decodes forward when
+    the target is a short step ahead of the current position, and otherwise
+    seeks to the preceding keyframe and decodes up to the target.
+    """
+
+    # Targets at most this many frames ahead are reached by decoding forward
+    # instead of seeking (a seek restarts decoding at the previous keyframe)
+    FORWARD_DECODE_LIMIT = 30
+
+    def __init__(self, path: str, hwaccel_device: Optional[str] = None):
+        self._container = None
+        if hwaccel_device:
+            self._container = self._open_hwaccel(path, hwaccel_device)
+        if self._container is None:
+            self._container = av.open(path)
+        self._stream = self._container.streams.video[0]
+        self._stream.thread_type = 'AUTO'
+        self._time_base = float(self._stream.time_base)
+        self._start = self._stream.start_time or 0
+        rate = self._stream.average_rate or self._stream.guessed_rate
+        self._fps = float(rate) if rate else 0.0
+        frames = int(self._stream.frames or 0)
+        if frames <= 0 and self._stream.duration and self._fps > 0:
+            frames = int(round(self._stream.duration * self._time_base * self._fps))
+        self._frame_count = frames
+        self._frames = None      # decode iterator, restarted after every seek
+        self._next_index = 0     # index of the frame the decoder yields next
+        self._target = None      # requested position, applied by the next grab()
+        self._grabbed = None     # last grabbed frame, converted by retrieve()
+
+    @staticmethod
+    def _open_hwaccel(path: str, device_type: str):
+        """
+        Open a video for decoding on a hardware device.
+
+        Decoding the first frame checks that the device really works;
+        unsupported codecs fall back to software inside FFmpeg.
+
+        Returns:
+            The open container, or None to decode on the CPU instead
+        """
+        container = None
+        try:
+            from av.codec.hwaccel import HWAccel
+            container = av.open(path, hwaccel=HWAccel(device_type=device_type, allow_software_fallback=True))
+            stream = container.streams.video[0]
+            next(container.decode(stream)).to_ndarray(format='bgr24')
+            container.seek(stream.start_time or 0, backward=True, any_frame=False, stream=stream)
+            log.info("[VideoController] Decoding on %s", device_type)
+            return container
+        except Exception as e:
+            log.warning("[VideoController] Hardware decoding (%s) not available, using CPU: %s", device_type, e)
+            if container is not None:
+                container.close()
+            return None
+
+    def isOpened(self) -> bool:
+        return self._container is not None
+
+    def get(self, prop_id: int) -> float:
+        if prop_id == cv2.CAP_PROP_FRAME_COUNT:
+            return float(self._frame_count)
+        if prop_id == cv2.CAP_PROP_FPS:
+            return self._fps
+        if prop_id == cv2.CAP_PROP_POS_FRAMES:
+            return float(self._next_index if self._target is None else self._target)
+        return 0.0
+
+    def set(self, prop_id: int, value: float) -> bool:
+        if prop_id != cv2.CAP_PROP_POS_FRAMES or self._container is None:
+            return False
+        self._target = max(0, int(value))
+        return True
+
+    def grab(self) -> bool:
+        self._grabbed = None
+        if self._container is None:
+            return False
+        try:
+            if self._target is not None:
+                target, self._target = self._target, None
+                self._grabbed = self._frame_at(target)
+            else:
+                self._grabbed = self._decode_next()
+        except Exception as e:
+            log.error("[VideoController] PyAV decode error: %s", e)
+        return self._grabbed is not None
+
+    def retrieve(self) -> tuple:
+        if self._grabbed is None:
+            return False, None
+        return True, self._grabbed.to_ndarray(format='bgr24')
+
+    def read(self) -> tuple:
+        if not self.grab():
+            return False, None
+        return self.retrieve()
+
+    def release(self):
+        if self._container is not None:
+            self._container.close()
+            self._container = None
+            self._frames = None
+            self._grabbed = None
+
+    def _index_of(self, frame) -> int:
+        """Frame index of a decoded frame, from its timestamp when it has one."""
+        if frame.pts is None or self._fps <= 0:
+            return self._next_index
+        return int(round((frame.pts - self._start) * self._time_base * self._fps))
+
+    def _decode_next(self):
+        """Decode the next frame in stream order, or None at the end."""
+        if self._frames is None:
+            self._frames = self._container.decode(self._stream)
+        frame = next(self._frames, None)
+        if frame is not None:
+            self._next_index = self._index_of(frame) + 1
+        return frame
+
+    def read_keyframe(self, target: int) -> tuple:
+        """
+        Read the keyframe at or before frame `target` without decoding up to it.
+
+        Costs one seek and one decoded frame whatever the keyframe interval,
+        which is what drag scrubbing needs; the frame shown is approximate.
+
+        Args:
+            target: Frame index wanted
+
+        Returns:
+            Tuple of (success, frame_data, frame_index)
+        """
+        if self._container is None:
+            return False, None, target
+        self._target = None
+        try:
+            if self._frames is None or target != self._next_index:
+                self._seek(target)
+            frame = self._decode_next()
+        except Exception as e:
+            log.error("[VideoController] PyAV decode error: %s", e)
+            frame = None
+        if frame is None:
+            return False, None, target
+        return True, frame.to_ndarray(format='bgr24'), self._index_of(frame)
+
+    def _seek(self, target: int):
+        """Position the decoder on the keyframe at or before frame `target`."""
+        pts = self._start
+        if self._fps > 0:
+            pts += int(target / self._fps / self._time_base)
+        self._container.seek(pts, backward=True, any_frame=False, stream=self._stream)
+        self._frames = None
+        self._next_index = 0
+
+    def _frame_at(self, target: int):
+        """Decode frame `target`, seeking first unless it is a short step ahead."""
+        ahead = target - self._next_index
+        if self._frames is None or ahead < 0 or ahead > self.FORWARD_DECODE_LIMIT:
+            self._seek(target)
+        # decode forward from the keyframe (or current position) to the target
+        frame = self._decode_next()
+        while frame is not None and self._index_of(frame) < target:
+            frame = self._decode_next()
+        return frame
+
+
+class _DecodeWorker(QtCore.QObject):
+    """
+    Decodes in a QThread for a VideoController: drag seeks and read-ahead.
+
+    Drag seek requests are not queued: the controller keeps only the latest
+    target and every wake-up of the worker decodes whatever that target is
+    at the time, so the decoder never spends time on positions the slider
+    already left. During playback the worker fills the frame cache ahead of
+    the playhead, so the timer's advance_frame finds its frames decoded.
+    """
+
+    # Signals
+    seek_done = QtCore.pyqtSignal(int, int, object)  # generation, frame index, BGR frame
+
+    def __init__(self, controller: 'VideoController'):
+        super().__init__()
+        self._controller = controller
+
+    @QtCore.pyqtSlot()
+    def seek_latest(self):
+        """Decode the most recent drag target, if one is still pending."""
+        request = self._controller._take_drag_seek()
+        if request is None:
+            return
+        generation, frame_number = request
+        result = self._controller._read_drag_frame(generation, frame_number)
+        if result is not None:
+            self.seek_done.emit(generation, result[0], result[1])
+
+    @QtCore.pyqtSlot()
+    def prefetch(self):
+        """Decode frames ahead of the playhead until the read-ahead window is full."""
+        # a pending drag seek goes first; its own wake-up is already queued
+        while self._controller._pending_drag_seek is None and self._controller._prefetch_one():
+            pass
+
+
+class _SeekState(enum.Enum):
+    """Seek state of a VideoController; only one seek mode is active at a time."""
+    IDLE = 0
+    DRAGGING = 1  # slider held: keyframe seeks through the worker only
+    EXACT = 2     # an exact seek is reading from the capture
+
+
+class VideoController(QtCore.QObject):
     """
     Controller for video playback operations.
     
-    This class encapsulates all video-related operations using OpenCV,
-    providing a clean interface for the main application.
+    This class encapsulates all video-related operations using PyAV when
+    it is installed and OpenCV otherwise, providing a clean interface for
+    the main application.
+    
+    Signals:
+        drag_frame_ready(np.ndarray): frame of the latest drag seek (see
+            seek_to_frame_fast), delivered on the GUI thread
     """
     
-    def __init__(self):
-        """Initialize the video controller with default values."""
+    # Signals
+    drag_frame_ready = QtCore.pyqtSignal(np.ndarray)
+    _drag_seek_requested = QtCore.pyqtSignal()
+    _prefetch_requested = QtCore.pyqtSignal()
+    
+    def __init__(self, use_pyav: Optional[bool] = None):
+        """
+        Initialize the video controller with default values.
+        
+        Args:
+            use_pyav: Decode with PyAV (default: whenever it is installed);
+                      OpenCV is used when False or when PyAV cannot open a file
+        """
+        super().__init__()
+        self._use_pyav: bool = (av is not None) if use_pyav is None else (bool(use_pyav) and av is not None)
+        # cv2.VideoCapture, or a _PyAVCapture with the same interface
         self.video_cap: Optional[cv2.VideoCapture] = None
         self.video_path: Optional[str] = None
+        # True between a successful load and release, so seeks do not have
+        # to ask the capture (isOpened) every time
+        self._is_open: bool = False
+        # Set by shutdown (under _capture_lock); later loads are refused
+        self._closed: bool = False
+        self._video_stamp: Optional[tuple] = None  # (size, mtime) of the loaded file
         self.current_frame: int = 0
         self.total_frames: int = 0
         self.fps: float = 30.0
         self.is_playing: bool = False
         self.playback_rate: float = 1.0
         
-        # Seeking state flags
-        self._seeking: bool = False
-        self._fast_seek_lock: bool = False
+        # Seek state (IDLE / DRAGGING / EXACT), changed only under _state_lock
+        # so a keyboard seek during a drag cannot interleave with it;
+        # _scrub_was_playing is whether playback ran when the drag started
+        self._seek_state: _SeekState = _SeekState.IDLE
+        self._state_lock = threading.Lock()
+        self._scrub_was_playing: bool = False
+        
+        # Drag seeks and playback read-ahead run in a worker thread (started on first use). The
+        # capture is shared with it, so every access holds _capture_lock;
+        # _pending_drag_seek is the single "latest target wins" slot and
+        # _seek_generation invalidates drag results older than a regular seek
+        self._capture_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending_drag_seek: Optional[tuple] = None
+        self._seek_generation: int = 0
+        self._seek_thread: Optional[QtCore.QThread] = None
+        self._seek_worker: Optional[_DecodeWorker] = None
+        self._prefetch_frames: int = VIDEO_PREFETCH_FRAMES
+        
+        # LRU cache of decoded frames (frame index -> BGR frame), so revisited
+        # frames are not decoded again; guarded by _capture_lock like the capture
+        self._frame_cache: OrderedDict = OrderedDict()
+        self._cache_bytes: int = 0
+        self._cache_max_frames: int = VIDEO_FRAME_CACHE_FRAMES
+        self._cache_max_bytes: int = VIDEO_FRAME_CACHE_MAX_MB * 1024 * 1024
+        # Frame index the capture returns on its next read, and the index a
+        # sequential read should return; they differ after a cache hit, which
+        # does not move the capture (None: unknown, read where the capture is)
+        self._capture_next: Optional[int] = None
+        self._read_next: Optional[int] = None
+        # Forward seeks of up to this many frames decode the gap instead of
+        # seeking (about a keyframe interval; set from the fps on load)
+        self._short_seek_frames: int = 30
+        
+        # Low-resolution thumbnails for scrub previews, built by a background
+        # thread after each load with its own capture: _thumbs[i] shows frame
+        # _thumb_frames[i] and the first _thumb_count of them are filled.
+        # _filmstrip_stop cancels the build of the previous video and
+        # shutdown() waits for _filmstrip_threads to finish
+        self._filmstrip_lock = threading.Lock()
+        self._thumbs: Optional[np.ndarray] = None
+        self._thumb_frames: Optional[np.ndarray] = None
+        self._thumb_count: int = 0
+        self._thumb_step: int = 1
+        self._filmstrip_stop: Optional[threading.Event] = None
+        self._filmstrip_threads: list = []
         
         # Drag seek throttling
         self._last_drag_seek_time: float = 0.0
@@ -43,6 +363,9 @@ class VideoController:
         # Timer for playback
         self.timer = QtCore.QTimer()
         self._last_timer_time: float = 0.0
+        # (monotonic time, frame) playback is scheduled from; None until the
+        # next playback step, re-anchored on play, seek and rate change
+        self._play_clock: Optional[tuple] = None
         
     def load_video(self, path: str) -> bool:
         """
@@ -54,19 +377,55 @@ class VideoController:
         Returns:
             True if video loaded successfully, False otherwise
         """
+        self._cancel_drag_seeks()
+        self._play_clock = None
+        with self._capture_lock:
+            if self._closed:
+                return False
+            stamp = self._file_stamp(path)
+            if (self._is_open and path == self.video_path and stamp is not None and stamp == self._video_stamp):
+                # Same unchanged file (dataset reloaded): keep the capture and
+                # its decoded frames instead of probing the file again
+                self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                self._capture_next = self._read_next = 0
+                self.current_frame = 0
+                log.info("[VideoController] Reusing loaded video: %s, frames=%d, fps=%s", path, self.total_frames, self.fps)
+                return True
+            self._video_stamp = stamp
+            self._stop_filmstrip()
+            if not self._load_video_locked(path):
+                return False
+            self._start_filmstrip(path)
+            return True
+    
+    @staticmethod
+    def _file_stamp(path: str) -> Optional[tuple]:
+        """(size, modification time) of a file, or None if it cannot be read."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return (st.st_size, st.st_mtime_ns)
+    
+    def _load_video_locked(self, path: str) -> bool:
+        """Body of load_video; the caller holds _capture_lock."""
         # Release previous video if any
+        self._is_open = False
         if self.video_cap:
             self.video_cap.release()
+        self._clear_frame_cache()
+        self._capture_next = self._read_next = None
         
         self.video_path = path
-        self.video_cap = cv2.VideoCapture(path)
+        self.video_cap = self._open_capture(path)
         
         if not self.video_cap.isOpened():
-            print(f"[VideoController] Failed to open video: {path}", flush=True)
+            log.error("[VideoController] Failed to open video: %s", path)
             return False
         
         reported_frames = int(self.video_cap.get(cv2.CAP_PROP_FRAME_COUNT))
         self.fps = float(self.video_cap.get(cv2.CAP_PROP_FPS)) or 30.0
+        self._short_seek_frames = max(1, int(self.fps))
         self.current_frame = 0
         
         # Ensure video is positioned at frame 0
@@ -81,20 +440,176 @@ class VideoController:
         else:
             # Last frame not readable, use one less
             self.total_frames = reported_frames - 1
-            print(f"[VideoController] Adjusted frame count from {reported_frames} to {self.total_frames}", flush=True)
+            log.info("[VideoController] Adjusted frame count from %d to %d", reported_frames, self.total_frames)
         
         # Reset to beginning
         self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        self._capture_next = self._read_next = 0
         self.current_frame = 0
+        self._is_open = True
         
-        print(f"[VideoController] Loaded video: {path}, frames={self.total_frames}, fps={self.fps}", flush=True)
+        log.info("[VideoController] Loaded video: %s, frames=%d, fps=%s", path, self.total_frames, self.fps)
         return True
     
+    def _open_capture(self, path: str):
+        """
+        Open a video with the preferred backend.
+        
+        Args:
+            path: Absolute path to video file
+            
+        Returns:
+            A _PyAVCapture, or a cv2.VideoCapture if PyAV is disabled or fails
+        """
+        if self._use_pyav:
+            try:
+                return _PyAVCapture(path, VIDEO_HWACCEL_DEVICE)
+            except Exception as e:
+                log.warning("[VideoController] PyAV could not open video, using OpenCV: %s", e)
+        if VIDEO_HWACCEL_DEVICE:
+            # OpenCV picks the hardware API itself; FFmpeg's decoder threads
+            # already default to the number of CPUs
+            try:
+                cap = cv2.VideoCapture(path, cv2.CAP_FFMPEG,
+                                       [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])
+                if cap.isOpened():
+                    return cap
+            except Exception as e:
+                log.warning("[VideoController] OpenCV hardware decoding not available: %s", e)
+        return cv2.VideoCapture(path)
+    
     def release(self):
         """Release video resources."""
-        if self.video_cap:
-            self.video_cap.release()
-            self.video_cap = None
+        self._cancel_drag_seeks()
+        with self._capture_lock:
+            # after any load in progress, so the filmstrip it started is
+            # cancelled too
+            self._stop_filmstrip()
+            self._is_open = False
+            if self.video_cap:
+                self.video_cap.release()
+                self.video_cap = None
+            self._clear_frame_cache()
+    
+    def shutdown(self):
+        """Release the video and stop the decode and filmstrip threads; the controller cannot load again."""
+        with self._capture_lock:
+            self._closed = True
+        self.release()
+        # a cancelled build stops after the thumbnail it is decoding; the
+        # interpreter must not exit while FFmpeg is still in that thread
+        for thread in self._filmstrip_threads:
+            thread.join()
+        self._filmstrip_threads = []
+        if self._seek_thread is not None:
+            self._seek_thread.quit()
+            self._seek_thread.wait()
+            self._seek_thread = None
+            self._seek_worker = None
+    
+    def _start_filmstrip(self, path: str):
+        """Start building the scrub preview thumbnails of the loaded video in a background thread."""
+        if self.total_frames <= 0:
+            return
+        stop = threading.Event()
+        with self._filmstrip_lock:
+            self._filmstrip_stop = stop
+        thread = threading.Thread(target=self._build_filmstrip, args=(path, self.total_frames, self.fps, stop),
+                                  name='filmstrip', daemon=True)
+        self._filmstrip_threads = [t for t in self._filmstrip_threads if t.is_alive()] + [thread]
+        thread.start()
+    
+    def _stop_filmstrip(self):
+        """Cancel a running thumbnail build and drop the thumbnails."""
+        with self._filmstrip_lock:
+            if self._filmstrip_stop is not None:
+                self._filmstrip_stop.set()
+                self._filmstrip_stop = None
+            self._thumbs = self._thumb_frames = None
+            self._thumb_count = 0
+    
+    def _build_filmstrip(self, path: str, total_frames: int, fps: float, stop: threading.Event):
+        """
+        Decode one frame per VIDEO_FILMSTRIP_INTERVAL_S into small thumbnails (filmstrip thread).
+        
+        Uses a capture of its own, so playback and seeks are not blocked. With
+        PyAV each thumbnail is the keyframe at or before its position (one
+        decoded frame per thumbnail); the index it really shows is recorded.
+        
+        Args:
+            path: Video file
+            total_frames: Number of readable frames
+            fps: Frame rate of the video
+            stop: Set when the thumbnails are no longer wanted
+        """
+        cap = None
+        try:
+            cap = self._open_capture(path)
+            if not cap.isOpened():
+                return
+            step = max(1, int(round(fps * VIDEO_FILMSTRIP_INTERVAL_S)))
+            thumbs = frames = None
+            k = 0
+            while k * step < total_frames and not stop.is_set():
+                target = k * step
+                if hasattr(cap, 'read_keyframe'):
+                    ret, frame, index = cap.read_keyframe(target)
+                else:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, target)
+                    ret, frame = cap.read()
+                    index = target
+                if not ret or frame is None:
+                    break
+                if thumbs is None:
+                    # size and count known from the first frame; fewer
+                    # thumbnails for long videos to stay under the memory cap
+                    h0, w0 = frame.shape[:2]
+                    w = VIDEO_FILMSTRIP_WIDTH
+                    h = max(1, int(round(w * h0 / w0)))
+                    max_count = max(1, (VIDEO_FILMSTRIP_MAX_MB * 1024 * 1024) // (w * h * 3))
+                    step = max(step, math.ceil(total_frames / max_count))
+                    count = math.ceil(total_frames / step)
+                    thumbs = np.empty((count, h, w, 3), dtype=np.uint8)
+                    frames = np.empty(count, dtype=np.int64)
+                    with self._filmstrip_lock:
+                        if stop.is_set():
+                            return
+                        self._thumbs, self._thumb_frames, self._thumb_count = thumbs, frames, 0
+                        self._thumb_step = step
+                cv2.resize(frame, (thumbs.shape[2], thumbs.shape[1]), dst=thumbs[k], interpolation=cv2.INTER_AREA)
+                frames[k] = index
+                with self._filmstrip_lock:
+                    if stop.is_set():
+                        return
+                    self._thumb_count = k + 1
+                k += 1
+            if thumbs is not None and not stop.is_set():
+                log.info("[VideoController] Built %d scrub preview thumbnails", k)
+        except Exception as e:
+            log.error("[VideoController] Filmstrip error: %s", e)
+        finally:
+            if cap is not None:
+                cap.release()
+    
+    def get_thumb(self, frame_number: int) -> Optional[np.ndarray]:
+        """
+        Low-resolution preview of a frame for scrubbing, without decoding.
+        
+        Args:
+            frame_number: Frame index to preview
+            
+        Returns:
+            BGR thumbnail of the nearest frame before it that has one, or None
+            if the thumbnails of that part of the video are not built yet
+        """
+        with self._filmstrip_lock:
+            thumbs, frames, count, step = self._thumbs, self._thumb_frames, self._thumb_count, self._thumb_step
+        if not count:
+            return None
+        if count < len(frames) and frame_number >= count * step:
+            return None
+        i = max(0, int(np.searchsorted(frames[:count], frame_number, side='right')) - 1)
+        return thumbs[i]
     
     def read_frame(self) -> tuple:
         """
@@ -103,94 +618,436 @@ class VideoController:
         Returns:
             Tuple of (success, frame_data)
         """
-        if not self.video_cap:
-            return False, None
-        return self.video_cap.read()
+        with self._capture_lock:
+            if not self.video_cap:
+                return False, None
+            return self._read_sequential()
+    
+    def _read_sequential(self) -> tuple:
+        """Read the frame after the last one read, from the cache when possible; caller holds _capture_lock."""
+        index = self._read_next
+        if index is None:
+            ret, frame = self.video_cap.read()
+            self._capture_next = None
+            return ret, frame
+        
+        cached = self._cache_get(index)
+        if cached is not None:
+            self._read_next = index + 1
+            return True, cached
+        
+        if self._capture_next != index:
+            # the capture is still where it was before a cache hit
+            self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, index)
+        ret, frame = self.video_cap.read()
+        if ret:
+            self._capture_next = self._read_next = index + 1
+            self._cache_put(index, frame)
+        else:
+            self._capture_next = self._read_next = None
+        return ret, frame
+    
+    def _skip_sequential(self) -> bool:
+        """
+        Move past the next sequential frame without producing an image; caller holds _capture_lock.
+        
+        Uses grab(), which decodes but skips the conversion to a BGR array
+        that read() does, so dropped frames cost less than shown ones.
+        """
+        index = self._read_next
+        if index is not None and index in self._frame_cache:
+            self._read_next = index + 1
+            return True
+        if index is not None and self._capture_next != index:
+            self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, index)
+        ret = self.video_cap.grab()
+        if ret and index is not None:
+            self._capture_next = self._read_next = index + 1
+        else:
+            self._capture_next = self._read_next = None
+        return ret
+    
+    def set_cache_size(self, max_frames: int, max_mb: Optional[float] = None):
+        """
+        Set how many decoded frames are kept for revisits.
+        
+        Args:
+            max_frames: Maximum number of cached frames (0 disables the cache)
+            max_mb: Optional memory cap in megabytes (default: unchanged)
+        """
+        with self._capture_lock:
+            self._cache_max_frames = max(0, int(max_frames))
+            if max_mb is not None:
+                self._cache_max_bytes = int(max(0.0, max_mb) * 1024 * 1024)
+            self._trim_frame_cache()
+    
+    def _cache_get(self, index: int):
+        """Return a cached frame and mark it recently used, or None."""
+        frame = self._frame_cache.get(index)
+        if frame is not None:
+            self._frame_cache.move_to_end(index)
+        return frame
+    
+    def _cache_put(self, index: int, frame):
+        """Cache a decoded frame, evicting the least recently used ones beyond the limits."""
+        if frame is None or self._cache_max_frames <= 0:
+            return
+        old = self._frame_cache.pop(index, None)
+        if old is not None:
+            self._cache_bytes -= old.nbytes
+        self._frame_cache[index] = frame
+        self._cache_bytes += frame.nbytes
+        self._trim_frame_cache()
+    
+    def _trim_frame_cache(self):
+        """Evict least recently used frames until the cache is within its limits."""
+        while self._frame_cache and (len(self._frame_cache) > self._cache_max_frames
+                                     or self._cache_bytes > self._cache_max_bytes):
+            _, frame = self._frame_cache.popitem(last=False)
+            self._cache_bytes -= frame.nbytes
     
-    def seek_to_frame(self, frame_number: int) -> tuple:
+    def _clear_frame_cache(self):
+        """Drop all cached frames (a new video was loaded or released)."""
+        self._frame_cache.clear()
+        self._cache_bytes = 0
+    
+    def seek_to_frame(self, frame_number: int, exact: bool = True) -> tuple:
         """
         Seek to a specific frame and read it.
         
+        Pending drag seeks are dropped, so a late drag result cannot replace
+        the frame read here.
+        
         Args:
             frame_number: Frame index to seek to
+            exact: Decode up to exactly this frame. When False and the backend
+                   supports it (PyAV), the keyframe at or before it is read
+                   instead and current_frame is set to that keyframe's index
             
         Returns:
             Tuple of (success, frame_data)
         """
-        if not self.video_cap or not self.video_cap.isOpened():
-            return False, None
+        self._cancel_drag_seeks()
+        self._play_clock = None
+        with self._capture_lock:
+            if not self._is_open:
+                return False, None
+            
+            # Clamp frame number to valid range
+            frame_number = self._clamp_frame(frame_number)
+            self.current_frame = frame_number
+            
+            try:
+                ret, frame, index = self._read_at(frame_number, exact)
+            except Exception as e:
+                log.error("[VideoController] Seek error: %s", e)
+                return False, None
+            
+            if ret:
+                self.current_frame = index
+            return ret, frame
+    
+    def _clamp_frame(self, frame_number: int) -> int:
+        """Clamp a frame index to the valid range of the loaded video."""
+        return max(0, min(int(frame_number), max(0, self.total_frames - 1)))
+    
+    def _read_at(self, frame_number: int, exact: bool) -> tuple:
+        """
+        Position the capture on a frame and read it; the caller holds _capture_lock.
         
-        # Clamp frame number to valid range
-        frame_number = max(0, min(int(frame_number), max(0, self.total_frames - 1)))
-        self.current_frame = frame_number
+        A cached frame is returned as it is, without moving the capture.
         
-        try:
-            self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, self.current_frame)
-            ret, frame = self.video_cap.read()
-        except Exception as e:
-            print(f"[VideoController] Seek error: {e}", flush=True)
-            return False, None
+        Returns:
+            Tuple of (success, frame_data, index of the frame read)
+        """
+        cached = self._cache_get(frame_number)
+        if cached is not None:
+            self._read_next = frame_number + 1
+            return True, cached, frame_number
         
-        return ret, frame
+        if not exact and isinstance(self.video_cap, _PyAVCapture):
+            ret, frame, index = self.video_cap.read_keyframe(frame_number)
+            index = max(0, min(index, frame_number))
+        else:
+            ahead = None if self._capture_next is None else frame_number - self._capture_next
+            if ahead is not None and 0 <= ahead <= self._short_seek_frames:
+                # short step forward: decoding the gap sequentially is much
+                # cheaper than a position seek, which restarts at a keyframe
+                ret = True
+                for _ in range(ahead):
+                    ret = self.video_cap.grab()
+                    if not ret:
+                        break
+                ret, frame = self.video_cap.read() if ret else (False, None)
+            else:
+                self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
+                ret, frame = self.video_cap.read()
+            index = frame_number
+        
+        if ret:
+            self._capture_next = self._read_next = index + 1
+            self._cache_put(index, frame)
+        else:
+            self._capture_next = self._read_next = None
+        return ret, frame, index
+    
+    def _set_state(self, expected, new_state: _SeekState) -> bool:
+        """
+        Atomically move to new_state if the current state is one of expected.
+        
+        Returns:
+            True if the transition was made
+        """
+        with self._state_lock:
+            if self._seek_state not in expected:
+                return False
+            self._seek_state = new_state
+            return True
+    
+    @contextmanager
+    def _state_transition(self, expected, new_state: _SeekState):
+        """
+        Hold new_state for the duration of a with block, then return to IDLE.
+        
+        Yields:
+            True if the state was entered; False if another seek is active
+            (the state is left unchanged)
+        """
+        if not self._set_state(expected, new_state):
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            with self._state_lock:
+                self._seek_state = _SeekState.IDLE
     
-    def seek_to_frame_safe(self, frame_number: int) -> tuple:
+    def seek_to_frame_safe(self, frame_number: int, exact: bool = True) -> tuple:
         """
-        Seek to a frame with re-entrancy protection.
+        Seek to a frame unless another seek or a slider drag is active.
         
         Args:
             frame_number: Frame index to seek to
+            exact: See seek_to_frame
             
         Returns:
-            Tuple of (success, frame_data)
+            Tuple of (success, frame_data); (False, None) while busy
         """
-        if self._seeking:
-            return False, None
+        with self._state_transition((_SeekState.IDLE,), _SeekState.EXACT) as entered:
+            if not entered:
+                return False, None
+            return self.seek_to_frame(frame_number, exact=exact)
+    
+    def begin_scrub(self) -> bool:
+        """
+        Enter the dragging state when the slider is pressed.
         
-        self._seeking = True
-        try:
-            result = self.seek_to_frame(frame_number)
-        finally:
-            self._seeking = False
+        Records whether playback was running so end_scrub can report it;
+        the caller pauses playback for the duration of the drag.
         
-        return result
+        Returns:
+            True if the drag started, False if another seek is active
+        """
+        if not self._set_state((_SeekState.IDLE,), _SeekState.DRAGGING):
+            return False
+        self._scrub_was_playing = self.is_playing
+        return True
     
-    def seek_to_frame_fast(self, frame_number: int) -> tuple:
+    def end_scrub(self, frame_number: int) -> tuple:
         """
-        Lightweight seek for drag operations (throttled).
+        Finish a slider drag with an exact seek to the release position.
+        
+        Without a drag in progress (e.g. a click on the track) this is a
+        plain seek_to_frame_safe.
         
         Args:
-            frame_number: Frame index to seek to
+            frame_number: Frame index the slider was released at
             
         Returns:
-            Tuple of (success, frame_data)
+            Tuple of (success, frame_data, was_playing); was_playing tells
+            the caller to resume playback
         """
-        if self._fast_seek_lock:
-            return False, None
+        if not self._set_state((_SeekState.DRAGGING,), _SeekState.EXACT):
+            ret, frame = self.seek_to_frame_safe(frame_number)
+            return ret, frame, False
+        was_playing, self._scrub_was_playing = self._scrub_was_playing, False
+        with self._state_transition((_SeekState.EXACT,), _SeekState.EXACT):
+            ret, frame = self.seek_to_frame(frame_number)
+        return ret, frame, was_playing
+    
+    def seek_to_frame_fast(self, frame_number: int):
+        """
+        Request a lightweight seek for drag operations; returns immediately.
         
-        self._fast_seek_lock = True
-        try:
-            result = self.seek_to_frame(frame_number)
-        finally:
-            self._fast_seek_lock = False
+        The seek runs in a worker thread and only the latest request is kept:
+        a target replaced before the worker gets to it is never decoded. The
+        frame (the keyframe at or before the target, see seek_to_frame with
+        exact=False) arrives through drag_frame_ready, with current_frame
+        already updated. Releasing the slider does the exact seek.
         
-        return result
+        Args:
+            frame_number: Frame index to seek to
+        """
+        if not self.video_cap or self._seek_state is _SeekState.EXACT:
+            return
+        
+        with self._pending_lock:
+            self._pending_drag_seek = (self._seek_generation, self._clamp_frame(frame_number))
+        self._ensure_seek_thread()
+        # queued to the worker thread; extra wake-ups find nothing pending
+        self._drag_seek_requested.emit()
+    
+    def _ensure_seek_thread(self):
+        """Start the decode worker thread on first use."""
+        if self._seek_thread is not None:
+            return
+        self._seek_worker = _DecodeWorker(self)
+        self._seek_thread = QtCore.QThread()
+        self._seek_worker.moveToThread(self._seek_thread)
+        self._drag_seek_requested.connect(self._seek_worker.seek_latest)
+        self._prefetch_requested.connect(self._seek_worker.prefetch)
+        self._seek_worker.seek_done.connect(self._on_drag_seek_done)
+        self._seek_thread.start()
     
-    def advance_frame(self) -> tuple:
+    def _take_drag_seek(self) -> Optional[tuple]:
+        """Remove and return the pending (generation, frame) drag target (worker thread)."""
+        with self._pending_lock:
+            request, self._pending_drag_seek = self._pending_drag_seek, None
+        return request
+    
+    def _read_drag_frame(self, generation: int, frame_number: int) -> Optional[tuple]:
+        """
+        Read a drag target in the worker thread.
+        
+        Returns:
+            (frame index, frame), or None if the read failed or was superseded
+        """
+        with self._capture_lock:
+            if generation != self._seek_generation or not self.video_cap:
+                return None
+            try:
+                ret, frame, index = self._read_at(frame_number, exact=False)
+            except Exception as e:
+                log.error("[VideoController] Seek error: %s", e)
+                return None
+        return (index, frame) if ret and frame is not None else None
+    
+    def _on_drag_seek_done(self, generation: int, index: int, frame):
+        """Publish a drag seek result on the GUI thread unless it was superseded."""
+        if generation != self._seek_generation or self._seek_state is _SeekState.EXACT:
+            return
+        self.current_frame = index
+        self._play_clock = None
+        self.drag_frame_ready.emit(frame)
+    
+    def _prefetch_one(self) -> bool:
+        """
+        Decode the first frame of the read-ahead window that is not cached yet (worker thread).
+        
+        The window starts at the next sequential read and is limited so that
+        it takes at most half of the frame cache, leaving the rest for
+        revisits. The capture is read sequentially from where it is; the
+        position of the next sequential read is not changed.
+        
+        Returns:
+            True if a frame was decoded, False if there is nothing to do
+        """
+        with self._capture_lock:
+            start = self._read_next
+            if not self.is_playing or not self.video_cap or start is None:
+                return False
+            window = min(self._prefetch_frames, self._cache_max_frames // 2)
+            if self._frame_cache:
+                frame_bytes = next(reversed(self._frame_cache.values())).nbytes
+                window = min(window, (self._cache_max_bytes // 2) // max(1, frame_bytes))
+            stop = min(start + window, self.total_frames)
+            index = next((i for i in range(start, stop) if i not in self._frame_cache), None)
+            if index is None:
+                return False
+            try:
+                if self._capture_next != index:
+                    self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, index)
+                ret, frame = self.video_cap.read()
+            except Exception as e:
+                log.error("[VideoController] Prefetch error: %s", e)
+                ret, frame = False, None
+            if not ret:
+                self._capture_next = None
+                return False
+            self._capture_next = index + 1
+            self._cache_put(index, frame)
+            return True
+    
+    def _cancel_drag_seeks(self):
+        """Drop the pending drag target and invalidate results still in flight."""
+        with self._pending_lock:
+            self._pending_drag_seek = None
+            self._seek_generation += 1
+    
+    def advance_frame(self, step: int = 1, decode: bool = True) -> tuple:
         """
         Advance to next frame.
         
+        Args:
+            step: Number of frames to advance; the frames before the last
+                  one are grabbed (decoded without image conversion) and dropped
+            decode: Return the image of the last frame; when False it is
+                    grabbed too and frame_data is None
+        
         Returns:
             Tuple of (success, frame_data)
         """
-        if not self.video_cap:
-            return False, None
+        with self._capture_lock:
+            if not self.video_cap:
+                return False, None
+            
+            ret, frame = True, None
+            for remaining in range(max(1, int(step)) - 1, -1, -1):
+                if remaining == 0 and decode:
+                    ret, frame = self._read_sequential()
+                else:
+                    ret = self._skip_sequential()
+                if not ret:
+                    frame = None
+                    break
+                self.current_frame += 1
         
-        ret, frame = self.video_cap.read()
-        if ret:
-            self.current_frame += 1
+        if self.is_playing and self._prefetch_frames > 0:
+            self._ensure_seek_thread()
+            self._prefetch_requested.emit()
         
         return ret, frame
     
+    def restart_play_clock(self):
+        """Schedule playback from the current frame and time (call when playback starts)."""
+        self._play_clock = None
+    
+    def playback_step(self) -> int:
+        """
+        Number of frames the next playback tick should advance.
+        
+        Playback is scheduled against the wall clock from the moment it was
+        (re)started. Normally this is 1; once decoding or the UI has fallen
+        more than VIDEO_MAX_LATENESS_S behind, the frames in between are
+        dropped so the video catches up instead of running late.
+        
+        Returns:
+            Frames to advance (at least 1, not past the last frame)
+        """
+        now = time.monotonic()
+        if self._play_clock is None:
+            self._play_clock = (now, self.current_frame)
+            return 1
+        start_time, start_frame = self._play_clock
+        rate = self.fps * self.playback_rate
+        if rate <= 0:
+            return 1
+        due = start_frame + int((now - start_time) * rate)
+        late = due - (self.current_frame + 1)
+        if late < max(1, math.ceil(VIDEO_MAX_LATENESS_S * rate)):
+            return 1
+        return max(1, min(due, self.total_frames - 1) - self.current_frame)
+    
     def next_frame(self) -> int:
         """
         Calculate next frame number.
@@ -229,13 +1086,18 @@ class VideoController:
         """
         if rate > 0:
             self.playback_rate = rate
+            self._play_clock = None
     
     def reset(self):
         """Reset playback to beginning."""
+        self._cancel_drag_seeks()
+        self._play_clock = None
         self.current_frame = 0
         self.is_playing = False
-        if self.video_cap:
-            self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        with self._capture_lock:
+            if self.video_cap:
+                self.video_cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                self._capture_next = self._read_next = 0
     
     def get_duration_seconds(self) -> float:
         """
@@ -5,10 +5,13 @@ This is the main application window that integrates all components:
 video playback, data visualization, and user interface.
 """
 
+import logging
 import os
 import sys
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
+import numpy as np
 from PyQt6 import QtWidgets, QtCore, QtGui
 import pyqtgraph as pg
 import cv2
@@ -20,13 +23,20 @@ from ..constants import (
     DEFAULT_VIDEO_BACKGROUND,
     PLAYBACK_SPEED_OPTIONS,
     DEFAULT_PLOT_WINDOW_SECONDS,
+    EXCLUDED_DIRECTORIES,
 )
-from ..utils import format_time_mmss, find_video_file, find_csv_file
+from ..utils import format_time_mmss, find_video_file, find_csv_file, list_subdirectories
 from .video_controller import VideoController
 from .data_manager import DataManager
 from .plot_manager import PlotManager
 from .heatmap_adapter import HeatmapAdapter
 
+log = logging.getLogger(__name__)
+
+# Numeric part of participant (P1, P02, ...) and session (1, 2, 10) folder names
+_SUBJECT_NUMBER_RE = re.compile(r'^P0*([0-9]+)')
+_SESSION_NUMBER_RE = re.compile(r'^0*([0-9]+)')
+
 
 class VideoPlayer(QtWidgets.QMainWindow):
     """
@@ -39,6 +49,12 @@ class VideoPlayer(QtWidgets.QMainWindow):
     - User interface and event handling
     """
     
+    # Results of the background file work, emitted from the I/O thread:
+    # session folder scan (session path, L.csv path, video path) and
+    # video open (path, success)
+    _session_scanned = QtCore.pyqtSignal(str, object, object)
+    _video_opened = QtCore.pyqtSignal(str, bool)
+    
     def __init__(self):
         """Initialize the video player application."""
         super().__init__()
@@ -55,6 +71,16 @@ class VideoPlayer(QtWidgets.QMainWindow):
         self.csv_paths: list = []
         self.heatmap_sync_enabled: bool = True  # Sync heatmap with video (enabled by default)
         self.base_heatmap_fps: float = 64.0  # Base FPS for heatmap (1.0x speed)
+        self._display_buf = None  # label-sized BGR buffer reused by _display_frame
+        # Session folder scans (the video search may walk the whole folder
+        # tree) and video opening run off the GUI thread, one at a time;
+        # _loading_video is the path being opened, None when idle
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='player-io')
+        # futures submitted to _io_pool and not finished yet (see _submit_io)
+        self._io_futures: set = set()
+        self._loading_video: Optional[str] = None
+        self._session_scanned.connect(self._on_session_scanned)
+        self._video_opened.connect(self._on_video_opened)
         
         # Setup window
         self.setWindowTitle("GaitScope")
@@ -67,14 +93,15 @@ class VideoPlayer(QtWidgets.QMainWindow):
         # Provide optional horizontal legend container to PlotManager
         self.plot_manager = PlotManager(self.plot_widget, self.gaitrite_plot, getattr(self, 'plot_legend_container', None))
         
-        # Connect video timer
+        # Connect video timer and drag seek results
         self.video_controller.timer.timeout.connect(self._on_timer)
+        self.video_controller.drag_frame_ready.connect(self._on_drag_frame_ready)
         
         # Connect heatmap signals
         if self.heatmap_adapter.is_available():
             self.heatmap_adapter.frame_ready.connect(self.heatmap_widget.update_frame)
         
-        print("[VideoPlayer] Initialized", flush=True)
+        log.debug("[VideoPlayer] Initialized")
     
     def _build_ui(self):
         """Build the user interface."""
@@ -130,7 +157,7 @@ class VideoPlayer(QtWidgets.QMainWindow):
         # Setup keyboard shortcuts
         self._setup_shortcuts()
 
-        print("[VideoPlayer] UI constructed", flush=True)
+        log.debug("[VideoPlayer] UI constructed")
     
     def _build_video_section(self) -> QtWidgets.QVBoxLayout:
         """
@@ -268,6 +295,7 @@ class VideoPlayer(QtWidgets.QMainWindow):
             self.populate_subjects()
             self.combo_subject.currentIndexChanged.connect(self.on_subject_changed)
             self.combo_group.currentIndexChanged.connect(self.on_group_changed)
+            self.combo_session.currentIndexChanged.connect(self.on_session_changed)
         except Exception:
             pass
     
@@ -292,6 +320,11 @@ class VideoPlayer(QtWidgets.QMainWindow):
         self.progress_slider.sliderPressed.connect(self.on_slider_pressed)
         progress_layout.addWidget(self.progress_slider, 8)
         
+        # Filmstrip thumbnail shown above the slider while dragging
+        self.scrub_preview = QtWidgets.QLabel(self)
+        self.scrub_preview.setStyleSheet("border: 1px solid white; background-color: black;")
+        self.scrub_preview.hide()
+        
         # Time label
         self.time_label = QtWidgets.QLabel('00:00 / 00:00')
         progress_layout.addWidget(self.time_label, 1)
@@ -472,9 +505,13 @@ class VideoPlayer(QtWidgets.QMainWindow):
     
     # ==================== Video Control Methods ====================
     
+    def _video_ready(self) -> bool:
+        """Whether a video is loaded and not being replaced by one that is still opening."""
+        return self._loading_video is None and bool(self.video_controller.video_cap)
+    
     def toggle_play_pause(self):
         """Toggle between play and pause states."""
-        if not self.video_controller.video_cap:
+        if not self._video_ready():
             return
 
         if self.video_controller.is_playing:
@@ -490,8 +527,9 @@ class VideoPlayer(QtWidgets.QMainWindow):
                     self.btn_heatmap_play.setText('▶ Play')
         else:
             # Play video
-            print(f"[Play] Starting playback from frame {self.video_controller.current_frame}/{self.video_controller.total_frames-1}", flush=True)
+            log.debug("[Play] Starting playback from frame %s/%s", self.video_controller.current_frame, self.video_controller.total_frames-1)
             self.video_controller.is_playing = True
+            self.video_controller.restart_play_clock()
             interval = self.video_controller.get_timer_interval()
             self.video_controller.timer.start(interval)
             self.btn_play.setText('⏸ Pause')
@@ -514,6 +552,8 @@ class VideoPlayer(QtWidgets.QMainWindow):
     
     def stop(self):
         """Stop playback and reset to beginning."""
+        if self._loading_video is not None:
+            return
         self.video_controller.reset()
         self.video_controller.timer.stop()
         self.btn_play.setText('▶ Play')
@@ -531,7 +571,7 @@ class VideoPlayer(QtWidgets.QMainWindow):
     
     def next_frame(self):
         """Advance to next frame."""
-        if not self.video_controller.video_cap:
+        if not self._video_ready():
             return
         if self.video_controller.is_playing:
             self.toggle_play_pause()
@@ -540,7 +580,7 @@ class VideoPlayer(QtWidgets.QMainWindow):
     
     def prev_frame(self):
         """Go to previous frame."""
-        if not self.video_controller.video_cap:
+        if not self._video_ready():
             return
         if self.video_controller.is_playing:
             self.toggle_play_pause()
@@ -555,6 +595,16 @@ class VideoPlayer(QtWidgets.QMainWindow):
             frame_number: Target frame number
         """
         ret, frame = self.video_controller.seek_to_frame_safe(frame_number)
+        self._show_seek_result(ret, frame)
+    
+    def _show_seek_result(self, ret: bool, frame):
+        """
+        Display the frame of a finished seek and sync the slider, time label and CSV cursor.
+        
+        Args:
+            ret: Whether the seek read a frame
+            frame: BGR frame (None if the seek failed)
+        """
         if ret and frame is not None:
             self._display_frame(frame)
         self.progress_slider.setValue(self.video_controller.current_frame)
@@ -586,11 +636,11 @@ class VideoPlayer(QtWidgets.QMainWindow):
         
         # Debug: log when approaching last frame
         if self.video_controller.current_frame >= self.video_controller.total_frames - 5:
-            print(f"[Timer] Frame {self.video_controller.current_frame}/{self.video_controller.total_frames-1}, at_last={at_last_frame}", flush=True)
+            log.debug("[Timer] Frame %s/%s, at_last=%s", self.video_controller.current_frame, self.video_controller.total_frames-1, at_last_frame)
         
         if at_last_frame:
             # Already at last frame, update cursor one final time before stopping
-            print(f"[Timer] Reached last frame ({self.video_controller.current_frame}), updating cursor and stopping", flush=True)
+            log.debug("[Timer] Reached last frame (%s), updating cursor and stopping", self.video_controller.current_frame)
             
             # Update cursor to final position
             self._update_csv_cursor_from_video()
@@ -609,12 +659,12 @@ class VideoPlayer(QtWidgets.QMainWindow):
                     self.btn_heatmap_play.setText('▶ Play')
             return
         
-        # Advance to next frame
-        ret, frame = self.video_controller.advance_frame()
+        # Advance to the frame that is due (drops frames when running late)
+        ret, frame = self.video_controller.advance_frame(self.video_controller.playback_step())
 
         if not ret:
             # Failed to read frame, stop playback
-            print(f"[Timer] Failed to read frame at {self.video_controller.current_frame}, stopping", flush=True)
+            log.error("[Timer] Failed to read frame at %s, stopping", self.video_controller.current_frame)
             self.video_controller.is_playing = False
             self.video_controller.timer.stop()
             self.btn_play.setText('▶ Play')
@@ -635,15 +685,15 @@ class VideoPlayer(QtWidgets.QMainWindow):
     
     def _toggle_heatmap_play(self):
         """Toggle heatmap animation play/pause."""
-        print("[VideoPlayer] _toggle_heatmap_play called", flush=True)
+        log.debug("[VideoPlayer] _toggle_heatmap_play called")
 
         if not self.heatmap_adapter.is_available():
-            print("[VideoPlayer] Heatmap adapter not available", flush=True)
+            log.info("[VideoPlayer] Heatmap adapter not available")
             return
 
         # Check if we have worker running
         if self.heatmap_adapter.worker is None:
-            print("[VideoPlayer] Starting heatmap adapter (no worker)...", flush=True)
+            log.debug("[VideoPlayer] Starting heatmap adapter (no worker)...")
             # Start the adapter
             self.heatmap_adapter.start()
             self.heatmap_adapter.resume()
@@ -651,12 +701,12 @@ class VideoPlayer(QtWidgets.QMainWindow):
             # Keep heatmap synced with video when starting via this control
             self._sync_heatmap_to_video()
         elif self.heatmap_adapter.worker._playing:
-            print("[VideoPlayer] Pausing heatmap...", flush=True)
+            log.debug("[VideoPlayer] Pausing heatmap...")
             # Pause
             self.heatmap_adapter.pause()
             self.btn_heatmap_play.setText('▶ Play')
         else:
-            print("[VideoPlayer] Resuming heatmap...", flush=True)
+            log.debug("[VideoPlayer] Resuming heatmap...")
             # Resume
             self.heatmap_adapter.resume()
             self.btn_heatmap_play.setText('⏸ Pause')
@@ -678,6 +728,10 @@ class VideoPlayer(QtWidgets.QMainWindow):
         """
         Display a frame in the video label.
         
+        The frame is scaled to the label size with OpenCV into a reused
+        buffer, which the QImage wraps as BGR without a colour conversion,
+        so the only copy made for Qt is the label-sized pixmap.
+        
         Args:
             frame_bgr: Frame in BGR format (OpenCV)
         """
@@ -686,18 +740,28 @@ class VideoPlayer(QtWidgets.QMainWindow):
             target_w = max(1, self.video_label.width())
             target_h = max(1, self.video_label.height())
 
-            # Convert BGR -> RGB and create QImage
-            frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
-            bytes_per_line = 3 * w0
-            image = QtGui.QImage(frame_rgb.data, w0, h0, bytes_per_line, QtGui.QImage.Format.Format_RGB888)
-            pix = QtGui.QPixmap.fromImage(image)
-
-            # Scale to fit inside label while preserving aspect ratio (no cropping)
-            pix = pix.scaled(target_w, target_h, QtCore.Qt.AspectRatioMode.KeepAspectRatio, QtCore.Qt.TransformationMode.SmoothTransformation)
-            self.video_label.setPixmap(pix)
+            # Fit inside the label while preserving aspect ratio (no cropping)
+            scale = min(target_w / w0, target_h / h0)
+            w = max(1, int(round(w0 * scale)))
+            h = max(1, int(round(h0 * scale)))
+            if (w, h) == (w0, h0):
+                image_bgr = np.ascontiguousarray(frame_bgr)
+            else:
+                buf = self._display_buf
+                if buf is None or buf.shape != (h, w, 3):
+                    buf = self._display_buf = np.empty((h, w, 3), dtype=np.uint8)
+                if scale < 0.5:
+                    # shrink by a whole factor first (OpenCV's fast area
+                    # path) so the bilinear pass below does not alias
+                    k = int(1.0 / scale)
+                    frame_bgr = cv2.resize(frame_bgr, None, fx=1.0 / k, fy=1.0 / k, interpolation=cv2.INTER_AREA)
+                image_bgr = cv2.resize(frame_bgr, (w, h), dst=buf, interpolation=cv2.INTER_LINEAR)
+
+            image = QtGui.QImage(image_bgr.data, w, h, image_bgr.strides[0], QtGui.QImage.Format.Format_BGR888)
+            self.video_label.setPixmap(QtGui.QPixmap.fromImage(image))
         except Exception:
             try:
-                # Fallback: basic conversion and keep aspect ratio
+                # Fallback: Qt conversion and scaling of the full frame
                 frame_rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
                 h, w = frame_rgb.shape[:2]
                 bytes_per_line = 3 * w
@@ -705,8 +769,8 @@ class VideoPlayer(QtWidgets.QMainWindow):
                 pix = QtGui.QPixmap.fromImage(image).scaled(
                     max(1, self.video_label.width()),
                     max(1, self.video_label.height()),
-                    QtCore.Qt.KeepAspectRatio,
-                    QtCore.Qt.SmoothTransformation
+                    QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+                    QtCore.Qt.TransformationMode.SmoothTransformation
                 )
                 self.video_label.setPixmap(pix)
             except Exception:
@@ -728,8 +792,11 @@ class VideoPlayer(QtWidgets.QMainWindow):
     # ==================== Slider Event Handlers ====================
     
     def on_slider_pressed(self):
-        """Mark start of slider drag."""
-        pass  # Placeholder for drag state if needed
+        """Start a slider drag; playback pauses until the slider is released."""
+        if not self.video_controller.video_cap:
+            return
+        if self.video_controller.begin_scrub() and self.video_controller.is_playing:
+            self.toggle_play_pause()
     
     def on_slider_moved(self, val: int):
         """
@@ -738,17 +805,55 @@ class VideoPlayer(QtWidgets.QMainWindow):
         Args:
             val: New slider value
         """
-        # Perform lightweight seek during drag
-        ret, frame = self.video_controller.seek_to_frame_fast(val)
-        if ret and frame is not None:
-            self._display_frame(frame)
+        # Request a lightweight seek; the frame arrives in _on_drag_frame_ready
+        self.video_controller.seek_to_frame_fast(val)
+        self._show_scrub_preview(val)
+    
+    def _show_scrub_preview(self, val: int):
+        """
+        Show the filmstrip thumbnail of a slider position above the slider handle.
+        
+        Args:
+            val: Slider value (frame index)
+        """
+        thumb = self.video_controller.get_thumb(val)
+        if thumb is None:
+            self.scrub_preview.hide()
+            return
+        h, w = thumb.shape[:2]
+        image = QtGui.QImage(thumb.data, w, h, thumb.strides[0], QtGui.QImage.Format.Format_BGR888)
+        self.scrub_preview.setPixmap(QtGui.QPixmap.fromImage(image))
+        self.scrub_preview.adjustSize()
+        # centre over the handle, kept inside the window
+        slider = self.progress_slider
+        span = max(1, slider.maximum() - slider.minimum())
+        x = int((val - slider.minimum()) / span * slider.width())
+        pos = slider.mapTo(self, QtCore.QPoint(x, 0))
+        px = max(0, min(pos.x() - self.scrub_preview.width() // 2, self.width() - self.scrub_preview.width()))
+        py = max(0, pos.y() - self.scrub_preview.height() - 4)
+        self.scrub_preview.move(px, py)
+        self.scrub_preview.raise_()
+        self.scrub_preview.show()
+    
+    def _on_drag_frame_ready(self, frame):
+        """
+        Show the frame of the latest drag seek.
+        
+        Args:
+            frame: BGR frame; video_controller.current_frame is its index
+        """
+        self._display_frame(frame)
         self.update_time_label()
         self._update_csv_cursor_from_video()
     
     def on_slider_released(self):
-        """Handle slider release after drag."""
+        """Handle slider release after drag: exact seek, then resume playback if it was running."""
         val = self.progress_slider.value()
-        self.seek_to_frame(val)
+        self.scrub_preview.hide()
+        ret, frame, was_playing = self.video_controller.end_scrub(val)
+        self._show_seek_result(ret, frame)
+        if was_playing and not self.video_controller.is_playing:
+            self.toggle_play_pause()
     
     def _on_gait_events_checkbox_changed(self, state):
         """
@@ -757,14 +862,14 @@ class VideoPlayer(QtWidgets.QMainWindow):
         Args:
             state: Qt.CheckState value (Checked or Unchecked)
         """
-        print(f"[VideoPlayer] Checkbox state changed: {state}", flush=True)
+        log.debug("[VideoPlayer] Checkbox state changed: %s", state)
         
         # state is an int: 0 = Unchecked, 2 = Checked
         show_events = (state == 2)
         
-        print(f"[VideoPlayer] show_events: {show_events}", flush=True)
-        print(f"[VideoPlayer] gait_events_L: {self.data_manager.gait_events_L is not None}", flush=True)
-        print(f"[VideoPlayer] gait_events_R: {self.data_manager.gait_events_R is not None}", flush=True)
+        log.debug("[VideoPlayer] show_events: %s", show_events)
+        log.debug("[VideoPlayer] gait_events_L: %s", self.data_manager.gait_events_L is not None)
+        log.debug("[VideoPlayer] gait_events_R: %s", self.data_manager.gait_events_R is not None)
         
         if show_events:
             # Draw gait events on the plot
@@ -777,22 +882,22 @@ class VideoPlayer(QtWidgets.QMainWindow):
                     )
                     # Update legend to include event colors
                     self.plot_manager.update_legend_with_events(True)
-                    print("[VideoPlayer] Showing gait events", flush=True)
+                    log.debug("[VideoPlayer] Showing gait events")
                 except Exception as e:
-                    print(f"[VideoPlayer] Error drawing gait events: {e}", flush=True)
+                    log.error("[VideoPlayer] Error drawing gait events: %s", e)
                     import traceback
                     traceback.print_exc()
             else:
-                print("[VideoPlayer] No gait events to show", flush=True)
+                log.debug("[VideoPlayer] No gait events to show")
         else:
             # Hide gait events
             try:
                 self.plot_manager.clear_gait_events()
                 # Update legend to remove event colors
                 self.plot_manager.update_legend_with_events(False)
-                print("[VideoPlayer] Hiding gait events", flush=True)
+                log.debug("[VideoPlayer] Hiding gait events")
             except Exception as e:
-                print(f"[VideoPlayer] Error clearing gait events: {e}", flush=True)
+                log.error("[VideoPlayer] Error clearing gait events: %s", e)
                 import traceback
                 traceback.print_exc()
     
@@ -805,11 +910,57 @@ class VideoPlayer(QtWidgets.QMainWindow):
         Args:
             path: Path to video file
         """
-        print(f"[VideoPlayer] Loading video: {path}", flush=True)
+        log.info("[VideoPlayer] Loading video: %s", path)
         if self.video_controller.is_playing:
             self.stop()
         
-        if not self.video_controller.load_video(path):
+        # Opening probes the file and can take a while (large or remote
+        # files); it runs on the I/O thread and _on_video_opened finishes
+        # the job. Playback controls do nothing until then
+        self._loading_video = path
+        self._set_video_controls_enabled(False)
+        self._submit_io(self._open_video, path)
+    
+    def _open_video(self, path: str):
+        """
+        Open a video in the video controller (I/O thread).
+        
+        Args:
+            path: Path to video file
+        """
+        try:
+            ok = self.video_controller.load_video(path)
+        except Exception as e:
+            log.error("[VideoPlayer] Error opening video: %s", e)
+            ok = False
+        self._video_opened.emit(path, ok)
+    
+    def _submit_io(self, fn, *args):
+        """Run fn(*args) on the I/O thread, tracked so closeEvent can cancel it."""
+        future = self._io_pool.submit(fn, *args)
+        self._io_futures.add(future)
+        future.add_done_callback(self._io_futures.discard)
+    
+    def _set_video_controls_enabled(self, enabled: bool):
+        """Enable or disable the playback buttons and the progress slider."""
+        for widget in (self.btn_play, self.btn_stop, self.btn_prev_frame, self.btn_next_frame, self.progress_slider):
+            widget.setEnabled(enabled)
+    
+    def _on_video_opened(self, path: str, ok: bool):
+        """
+        Show the first frame of a video opened by load_video.
+        
+        Args:
+            path: Path to video file
+            ok: Whether the video could be opened
+        """
+        if path != self._loading_video:
+            # a later load_video replaced this one; its own result follows
+            return
+        self._loading_video = None
+        self._set_video_controls_enabled(True)
+        
+        if not ok:
             QtWidgets.QMessageBox.critical(self, 'Error', 'Could not open video file')
             return
         
@@ -838,15 +989,15 @@ class VideoPlayer(QtWidgets.QMainWindow):
         
         # Use the shorter duration (limit to video length)
         x_max = min(csv_x_max, video_duration)
-        print(f"[VideoPlayer] Updating plot range: CSV={csv_x_max:.6f}s, Video={video_duration:.6f}s, Using={x_max:.6f}s", flush=True)
+        log.debug("[VideoPlayer] Updating plot range: CSV=%.6fs, Video=%.6fs, Using=%.6fs", csv_x_max, video_duration, x_max)
         
         self.plot_manager.set_plot_x_range(0.0, x_max)
     
     def load_csvs(self):
         """Load and plot CSV data files."""
-        print("[VideoPlayer] Loading CSV data", flush=True)
+        log.debug("[VideoPlayer] Loading CSV data")
         # DEBUG: show current csv_paths
-        print(f"[VideoPlayer] csv_paths: {getattr(self, 'csv_paths', None)}", flush=True)
+        log.debug("[VideoPlayer] csv_paths: %s", getattr(self, 'csv_paths', None))
 
         # Find L.csv
         csv_L = None
@@ -861,7 +1012,7 @@ class VideoPlayer(QtWidgets.QMainWindow):
                 self.plot_widget.plot([0], [0], pen=pg.mkPen('k'))
             except Exception:
                 pass
-            print("[VideoPlayer] No CSV found", flush=True)
+            log.info("[VideoPlayer] No CSV found")
             return
 
         # Try to find R.csv in same directory
@@ -882,18 +1033,18 @@ class VideoPlayer(QtWidgets.QMainWindow):
         )
 
         # Detect gait events using RAMP algorithm
-        print("[VideoPlayer] About to detect gait events...", flush=True)
+        log.debug("[VideoPlayer] About to detect gait events...")
         try:
             result = self.data_manager.detect_gait_events()
-            print(f"[VideoPlayer] detect_gait_events returned: {result}", flush=True)
+            log.debug("[VideoPlayer] detect_gait_events returned: %s", result)
             if result:
                 self.chk_show_gait_events.setEnabled(True)
-                print("[VideoPlayer] Gait events detected, checkbox enabled", flush=True)
+                log.debug("[VideoPlayer] Gait events detected, checkbox enabled")
             else:
                 self.chk_show_gait_events.setEnabled(False)
-                print("[VideoPlayer] No gait events detected", flush=True)
+                log.debug("[VideoPlayer] No gait events detected")
         except Exception as e:
-            print(f"[VideoPlayer] Error detecting gait events: {e}", flush=True)
+            log.error("[VideoPlayer] Error detecting gait events: %s", e)
             import traceback
             traceback.print_exc()
             self.chk_show_gait_events.setEnabled(False)
@@ -908,17 +1059,17 @@ class VideoPlayer(QtWidgets.QMainWindow):
             video_duration = self.video_controller.get_duration_seconds()
             # Use the shorter duration (limit to video length)
             x_max = min(csv_x_max, video_duration)
-            print(f"[VideoPlayer] CSV duration: {csv_x_max:.6f}s, Video duration: {video_duration:.6f}s, Using: {x_max:.6f}s", flush=True)
+            log.debug("[VideoPlayer] CSV duration: %.6fs, Video duration: %.6fs, Using: %.6fs", csv_x_max, video_duration, x_max)
         else:
             # No video loaded yet, use CSV duration
             x_max = csv_x_max
-            print(f"[VideoPlayer] No video loaded, using CSV duration: {x_max:.6f}s", flush=True)
+            log.debug("[VideoPlayer] No video loaded, using CSV duration: %.6fs", x_max)
         
         self.plot_manager.set_plot_x_range(0.0, x_max)
 
         # Update cursor
         self._update_csv_cursor_from_video()
-        print("[VideoPlayer] CSV data loaded", flush=True)
+        log.info("[VideoPlayer] CSV data loaded")
     
     def load_gaitrite_data(self):
         """Load and display GaitRite data."""
@@ -950,7 +1101,7 @@ class VideoPlayer(QtWidgets.QMainWindow):
     def load_heatmap_data(self):
         """Load and configure heatmap data from already loaded CSV data."""
         if not self.heatmap_adapter.is_available():
-            print("[VideoPlayer] Heatmap adapter not available", flush=True)
+            log.info("[VideoPlayer] Heatmap adapter not available")
             return
         
         # Get heatmap data from DataManager (reuses already loaded CSV data)
@@ -976,9 +1127,9 @@ class VideoPlayer(QtWidgets.QMainWindow):
                 self._sync_heatmap_to_video()
             
             total_frames = self.heatmap_adapter.get_total_frames()
-            print(f"[VideoPlayer] Heatmap data loaded: {total_frames} frames", flush=True)
+            log.info("[VideoPlayer] Heatmap data loaded: %s frames", total_frames)
         else:
-            print("[VideoPlayer] No heatmap data available", flush=True)
+            log.info("[VideoPlayer] No heatmap data available")
             self.btn_heatmap_play.setEnabled(False)
     
     # ==================== CSV Cursor Synchronization ====================
@@ -991,46 +1142,56 @@ class VideoPlayer(QtWidgets.QMainWindow):
         # Check if we're at the last video frame
         at_last_video_frame = (self.video_controller.current_frame >= self.video_controller.total_frames - 1)
 
+        # Get the time axis to ensure we use the EXACT same time values
+        x_data = self.data_manager.get_time_axis()
+
         # Map video frame to CSV index using proportional mapping
-        # This ensures the last video frame maps to the last CSV sample
-        csv_idx = self.data_manager.video_frame_to_csv_index(
-            self.video_controller.current_frame,
+        # This ensures the last video frame maps to the last CSV sample;
+        # the per-frame table gives the index and its time axis value
+        frame = self.video_controller.current_frame
+        table = self.data_manager.video_frame_to_csv_table(
             self.video_controller.fps,
-            self.video_controller.total_frames  # Pass total frames for proportional mapping
+            self.video_controller.total_frames
         )
-
-        # Ensure csv_idx is within [0, csv_len-1] to avoid out-of-range times
-        if hasattr(self.data_manager, 'csv_len') and self.data_manager.csv_len > 0:
-            csv_idx = max(0, min(int(csv_idx), int(self.data_manager.csv_len) - 1))
+        if table is not None and 0 <= frame < len(table[0]):
+            csv_idx = int(table[0][frame])
+            csv_time = float(table[1][frame])
         else:
-            try:
-                csv_idx = int(csv_idx)
-            except Exception:
-                csv_idx = 0
+            csv_idx = self.data_manager.video_frame_to_csv_index(
+                frame,
+                self.video_controller.fps,
+                self.video_controller.total_frames  # Pass total frames for proportional mapping
+            )
 
-        # Get the time axis to ensure we use the EXACT same time values
-        x_data = self.data_manager.get_time_axis()
-        
-        # Get cursor time from the actual time axis array (not recalculated)
-        # This ensures perfect alignment with the plot
-        if csv_idx < len(x_data):
-            csv_time = float(x_data[csv_idx])
-        else:
-            # Fallback calculation if index out of range
-            csv_time = float(csv_idx) / float(self.data_manager.csv_sampling_rate) \
-                if getattr(self.data_manager, 'csv_sampling_rate', 0) > 0 else float(csv_idx)
+            # Ensure csv_idx is within [0, csv_len-1] to avoid out-of-range times
+            if hasattr(self.data_manager, 'csv_len') and self.data_manager.csv_len > 0:
+                csv_idx = max(0, min(int(csv_idx), int(self.data_manager.csv_len) - 1))
+            else:
+                try:
+                    csv_idx = int(csv_idx)
+                except Exception:
+                    csv_idx = 0
+
+            # Get cursor time from the actual time axis array (not recalculated)
+            # This ensures perfect alignment with the plot
+            if csv_idx < len(x_data):
+                csv_time = float(x_data[csv_idx])
+            else:
+                # Fallback calculation if index out of range
+                csv_time = float(csv_idx) / float(self.data_manager.csv_sampling_rate) \
+                    if getattr(self.data_manager, 'csv_sampling_rate', 0) > 0 else float(csv_idx)
 
         # When at last video frame, position cursor at the end of the visible plot range
         # (which may be limited by video duration, not CSV duration)
         if at_last_video_frame:
             # Use video duration as the cursor position when at the last frame
             csv_time = self.video_controller.get_duration_seconds()
-            print(f"[VideoPlayer] At last video frame, setting cursor to video duration: {csv_time:.6f}s", flush=True)
+            log.debug("[VideoPlayer] At last video frame, setting cursor to video duration: %.6fs", csv_time)
 
         # Debug logging for last frame sync
-        if self.video_controller.current_frame >= self.video_controller.total_frames - 5:
+        if log.isEnabledFor(logging.DEBUG) and self.video_controller.current_frame >= self.video_controller.total_frames - 5:
             video_duration = self.video_controller.get_duration_seconds()
-            print(f"[VideoPlayer] Frame {self.video_controller.current_frame}/{self.video_controller.total_frames-1}, csv_idx={csv_idx}/{self.data_manager.csv_len-1}, csv_time={csv_time:.6f}, video_dur={video_duration:.6f}, at_last={at_last_video_frame}", flush=True)
+            log.debug("[VideoPlayer] Frame %s/%s, csv_idx=%s/%s, csv_time=%.6f, video_dur=%.6f, at_last=%s", self.video_controller.current_frame, self.video_controller.total_frames-1, csv_idx, self.data_manager.csv_len-1, csv_time, video_duration, at_last_video_frame)
 
         # Update cursor position (vertical yellow line)
         # When at last video frame, we pass the video duration as csv_time
@@ -1040,7 +1201,9 @@ class VideoPlayer(QtWidgets.QMainWindow):
             self.data_manager.sums_R,
             csv_idx,
             self.data_manager.csv_len,
-            at_last_video_frame  # Pass flag to force end position
+            at_last_video_frame,  # Pass flag to force end position
+            # only playback may be throttled; a seek or step must always land
+            force=at_last_video_frame or not self.video_controller.is_playing
         )
         
         # Sync heatmap if enabled
@@ -1079,7 +1242,7 @@ class VideoPlayer(QtWidgets.QMainWindow):
                 self.heatmap_adapter.seek(heatmap_frame)
         except Exception as e:
             # Log error for debugging but don't interrupt UI
-            print(f"[VideoPlayer] Heatmap sync error: {e}", flush=True)
+            log.warning("[VideoPlayer] Heatmap sync error: %s", e)
 
     # ==================== Dataset Selector Methods ====================
     
@@ -1104,13 +1267,12 @@ class VideoPlayer(QtWidgets.QMainWindow):
                 self.combo_subject.setEnabled(False)
                 return
             
-            subjects = [d for d in os.listdir(data_dir) 
-                       if os.path.isdir(os.path.join(data_dir, d)) 
-                       and d.upper().startswith('P')]
+            subjects = [d for d in list_subdirectories(data_dir)
+                       if d.upper().startswith('P')]
 
             # Sort participants numerically by the number after 'P' (P1, P2, P10)
             def _subj_key(name: str):
-                m = re.match(r'^P0*([0-9]+)', name.upper())
+                m = _SUBJECT_NUMBER_RE.match(name.upper())
                 if m:
                     try:
                         return (int(m.group(1)), name.upper())
@@ -1155,9 +1317,8 @@ class VideoPlayer(QtWidgets.QMainWindow):
             if not subject_path or not os.path.isdir(subject_path):
                 return
             
-            groups = [d for d in os.listdir(subject_path) 
-                     if os.path.isdir(os.path.join(subject_path, d))
-                     and d.lower() not in ('sitdown', 'stand')]
+            groups = [d for d in list_subdirectories(subject_path)
+                     if d.lower() not in EXCLUDED_DIRECTORIES]
             groups.sort()
             
             self.combo_group.addItem('Select category...', userData=None)
@@ -1190,12 +1351,11 @@ class VideoPlayer(QtWidgets.QMainWindow):
                 return
 
             # Sessions are stored as subdirectories under the group folder
-            sessions = [d for d in os.listdir(group_path)
-                        if os.path.isdir(os.path.join(group_path, d))]
+            sessions = list_subdirectories(group_path)
 
             # Numeric sort where possible (e.g., 1,2,10)
             def _sess_key(name: str):
-                m = re.match(r'^0*([0-9]+)', name)
+                m = _SESSION_NUMBER_RE.match(name)
                 if m:
                     try:
                         return (int(m.group(1)), name)
@@ -1211,25 +1371,28 @@ class VideoPlayer(QtWidgets.QMainWindow):
 
             self.combo_session.setCurrentIndex(0)
             self.combo_session.setEnabled(True)
-
-            # Connect session change handler (safe to call multiple times)
-            try:
-                self.combo_session.currentIndexChanged.connect(self.on_session_changed)
-            except Exception:
-                pass
         except Exception:
             pass
 
     def on_session_changed(self, index: int):
-        """Handle session selection change and locate CSV/video paths."""
+        """Handle session selection change and start locating the CSV/video paths."""
         if index < 0:
             return
         session_path = self.combo_session.itemData(index)
+        self.csv_paths = []
+        self.btn_load_dataset.setEnabled(False)
         if not session_path:
-            self.csv_paths = []
-            self.btn_load_dataset.setEnabled(False)
             return
+        # Load Dataset is enabled again when the scan result arrives
+        self._submit_io(self._scan_session, session_path)
 
+    def _scan_session(self, session_path: str):
+        """
+        Find the L.csv and the anonymized video of a session folder (scan thread).
+        
+        Args:
+            session_path: Session folder to search
+        """
         # Try to find L.csv (case-insensitive) inside session folder
         csv_L = None
         try:
@@ -1241,29 +1404,44 @@ class VideoPlayer(QtWidgets.QMainWindow):
 
             if not csv_L:
                 for f in os.listdir(session_path):
-                    if f.lower().startswith('l') and f.lower().endswith('.csv'):
+                    name_lower = f.lower()
+                    if name_lower.startswith('l') and name_lower.endswith('.csv'):
                         csv_L = os.path.join(session_path, f)
                         break
         except Exception:
             csv_L = None
 
-        self.csv_paths = [csv_L] if csv_L else []
-
         # Try to find an anonymized video inside the session folder
         try:
             video = find_video_file(session_path)
-            if video:
-                self.embedded_video_path = video
         except Exception:
-            pass
+            video = None
 
-        print(f"[VideoPlayer] on_session_changed: session_path={session_path}, csv_paths={self.csv_paths}, video={getattr(self, 'embedded_video_path', None)}", flush=True)
+        self._session_scanned.emit(session_path, csv_L, video)
+
+    def _on_session_scanned(self, session_path: str, csv_L, video):
+        """
+        Apply the scan result of a session folder unless another session was selected since.
+        
+        Args:
+            session_path: Session folder that was scanned
+            csv_L: Path of its L.csv, or None
+            video: Path of its anonymized video, or None
+        """
+        if session_path != self.combo_session.currentData():
+            return
+
+        self.csv_paths = [csv_L] if csv_L else []
+        if video:
+            self.embedded_video_path = video
+
+        log.debug("[VideoPlayer] on_session_changed: session_path=%s, csv_paths=%s, video=%s", session_path, self.csv_paths, getattr(self, 'embedded_video_path', None))
         self.btn_load_dataset.setEnabled(True)
 
     def on_load_dataset_clicked(self):
         """Handle Load Dataset button click: load CSVs, gaitrite data and embedded video if present."""
-        print("[VideoPlayer] on_load_dataset_clicked called", flush=True)
-        print(f"[VideoPlayer] current csv_paths={getattr(self, 'csv_paths', None)}", flush=True)
+        log.debug("[VideoPlayer] on_load_dataset_clicked called")
+        log.debug("[VideoPlayer] current csv_paths=%s", getattr(self, 'csv_paths', None))
 
         if not getattr(self, 'csv_paths', None):
             QtWidgets.QMessageBox.warning(self, 'Warning', 'No CSV selected')
@@ -1284,11 +1462,22 @@ class VideoPlayer(QtWidgets.QMainWindow):
     
     def closeEvent(self, event):
         """Handle window close event - cleanup resources."""
-        print("[VideoPlayer] Closing window, stopping heatmap adapter...", flush=True)
+        log.debug("[VideoPlayer] Closing window, stopping heatmap adapter...")
         
         # Stop heatmap adapter
         if hasattr(self, 'heatmap_adapter') and self.heatmap_adapter:
             self.heatmap_adapter.stop()
         
+        # Drop queued folder scans and video opens and wait for the running
+        # one, so no video is opened (and no filmstrip started) after shutdown
+        # (cancelled by hand: shutdown's cancel_futures needs Python 3.9)
+        for future in list(self._io_futures):
+            future.cancel()
+        self._io_pool.shutdown(wait=True)
+        
+        # Stop the decode thread and release the video
+        if hasattr(self, 'video_controller') and self.video_controller:
+            self.video_controller.shutdown()
+        
         # Accept the close event
         event.accept()
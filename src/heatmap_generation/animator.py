@@ -1,8 +1,7 @@
 import numpy as np
 import cv2
-from collections import deque
 from typing import List, Tuple
-from .heatmap import precompute_kernels, render_heatmap_from_flatZ, compute_cop, create_colorbar, draw_indices
+from .heatmap import precompute_separable_kernels, splat_separable, colorize_grid, compute_cops, create_colorbar, rasterize_indices, apply_indices
 
 
 class Animator:
@@ -14,58 +13,69 @@ class Animator:
         self.right_seq = []
         self.frame_idx = 0
         self.trail_len = params.get("trailLength", 10)
-        self.left_trail = deque(maxlen=self.trail_len)
-        self.right_trail = deque(maxlen=self.trail_len)
-        # precompute kernels
-        self.K_left = precompute_kernels(coords_left, params["gridW"], params["gridH"], params["wFinal"], params["hFinal"], params["radius"], params["smoothness"]) if coords_left else np.zeros((0, params["gridW"]*params["gridH"]), dtype=np.float32)
-        self.K_right = precompute_kernels(coords_right, params["gridW"], params["gridH"], params["wFinal"], params["hFinal"], params["radius"], params["smoothness"]) if coords_right else np.zeros((0, params["gridW"]*params["gridH"]), dtype=np.float32)
+        # static composition (canvas size, offsets, colorbar background, sensor
+        # markers) as (key, layout); rebuilt only when the layout parameters change
+        self._layout_cache = None
+        # precompute separable kernel factors (Gx, Gy) per foot
+        self.K_left = precompute_separable_kernels(coords_left, params["gridW"], params["gridH"], params["wFinal"], params["hFinal"], params["radius"], params["smoothness"])
+        self.K_right = precompute_separable_kernels(coords_right, params["gridW"], params["gridH"], params["wFinal"], params["hFinal"], params["radius"], params["smoothness"])
+
+    def apply_cosmetic(self, params):
+        # Apply parameters that do not affect the precomputed kernels
+        self.params = params
+        self.trail_len = params.get("trailLength", 10)
 
     def load_sequences(self, left_seq: List[List[int]], right_seq: List[List[int]]):
         self.left_seq = left_seq
         self.right_seq = right_seq
         self.frame_idx = 0
-        self.left_trail.clear()
-        self.right_trail.clear()
+
+    def adopt_sequences(self, left_seq, right_seq):
+        # Take already-converted sequences (e.g. from another Animator) without
+        # copying them; unlike load_sequences the frame position is kept
+        self.left_seq = left_seq
+        self.right_seq = right_seq
+        self.set_frame(self.frame_idx)
 
     def reset(self):
         self.frame_idx = 0
-        self.left_trail.clear()
-        self.right_trail.clear()
 
     def n_frames(self):
         return max(len(self.left_seq), len(self.right_seq))
 
-    def _render_side(self, seq, K, coords):
-        if not seq or K.shape[0] == 0:
-            blank = np.zeros((self.params["hFinal"], self.params["wFinal"], 3), dtype=np.uint8)
-            return blank, (0, 0)
-        frame = seq[self.frame_idx % len(seq)]
-        p = np.asarray(frame, dtype=np.float32)
-        if p.size != K.shape[0]:
-            # pad or trim
-            if p.size < K.shape[0]:
-                tmp = np.zeros((K.shape[0],), dtype=np.float32)
-                tmp[:p.size] = p
-                p = tmp
-            else:
-                p = p[:K.shape[0]]
-        Z_flat = p.dot(K)
-        img = render_heatmap_from_flatZ(Z_flat, self.params["wFinal"], self.params["hFinal"], self.params["gridW"], self.params["gridH"])  # BGR
-        cop = compute_cop(frame, coords)
-        return img, cop
+    def _color_grids(self, seq, K, idxs):
+        # Coloured grids (len(idxs), gridH, gridW, 3) for several frames from one
+        # batched splat and one colormap pass; None if this foot has no data
+        Gx, Gy = K
+        n_sensors = Gx.shape[1]
+        if len(seq) == 0 or n_sensors == 0:
+            return None
+        P = np.zeros((len(idxs), n_sensors), dtype=np.float32)
+        for k, idx in enumerate(idxs):
+            # pad or trim each frame to the number of sensors
+            p = np.asarray(seq[idx % len(seq)], dtype=np.float32)[:n_sensors]
+            P[k, :p.size] = p
+        return colorize_grid(splat_separable(P, Gx, Gy))
 
-    def get_frame(self) -> np.ndarray:
-        # render left and right
-        left_img, left_cop = self._render_side(self.left_seq, self.K_left, self.coords_left)
-        right_img, right_cop = self._render_side(self.right_seq, self.K_right, self.coords_right)
-        # update trails
-        self.left_trail.append(left_cop)
-        self.right_trail.append(right_cop)
-        # compose final image
+    def _cop_window(self, seq, coords, idx):
+        # COPs of frames idx-trail_len+1..idx (oldest first); the last one is the current COP
+        start = max(0, idx - max(1, self.trail_len) + 1)
+        if len(seq) == 0:
+            return [(0, 0)] * (idx - start + 1)
+        if isinstance(seq, np.ndarray) and idx < len(seq):
+            # contiguous window: a view, no per-frame gathering
+            return compute_cops(seq[start:idx + 1], coords)
+        return compute_cops([seq[j % len(seq)] for j in range(start, idx + 1)], coords)
+
+    def _layout(self):
         w = self.params["wFinal"]
         h = self.params["hFinal"]
         margin = self.params.get("margin", 50)
         legendW = self.params.get("legendWidth", 80)
+        key = (w, h, margin, legendW)
+        cache = self._layout_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
         # create colorbar (may return height != h)
         cb = create_colorbar(h, legendW)
         cb_h, cb_w = cb.shape[:2]
@@ -73,41 +83,108 @@ class Animator:
         content_h = max(h, cb_h)
         final_h = content_h + margin * 2
         final_w = w * 2 + margin * 3 + cb_w
-        out = np.full((final_h, final_w, 3), 255, dtype=np.uint8)
         # vertical offsets to center left/right images within content area
         ly = margin + (content_h - h) // 2
         cb_y = margin + (content_h - cb_h) // 2
-        # place left image
         lx = margin
-        out[ly:ly+h, lx:lx+w] = left_img
-        # place right image
         rx = lx + w + margin
-        out[ly:ly+h, rx:rx+w] = right_img
-        # place colorbar to the right of right image with margin
+        # colorbar to the right of right image with margin
         cb_x = rx + w + margin
-        out[cb_y:cb_y+cb_h, cb_x:cb_x+cb_w] = cb
-         # draw indices
-        draw_indices(out, self.coords_left, offset=(lx, ly))
-        draw_indices(out, self.coords_right, offset=(rx, ly))
+        background = np.full((final_h, final_w, 3), 255, dtype=np.uint8)
+        background[cb_y:cb_y+cb_h, cb_x:cb_x+cb_w] = cb
+        layout = {
+            "shape": background.shape,
+            "background": background,
+            "lx": lx, "rx": rx, "ly": ly,
+            # sensor markers rasterized once for this layout
+            "indices": rasterize_indices(background.shape, [(self.coords_left, (lx, ly)), (self.coords_right, (rx, ly))]),
+        }
+        self._layout_cache = (key, layout)
+        return layout
+
+    def frame_shape(self) -> Tuple[int, int, int]:
+        # Shape of the composed BGR frame for the current parameters
+        return self._layout()["shape"]
+
+    def get_frame(self) -> np.ndarray:
+        return self.render_frame_at(self.frame_idx)
+
+    def render_frame_at(self, idx: int) -> np.ndarray:
+        # Render a specific frame into a new array without modifying internal frame_idx
+        out = np.empty(self.frame_shape(), dtype=np.uint8)
+        self.render_into(out, idx)
+        return out
+
+    def render_frames(self, indices) -> List[np.ndarray]:
+        # Render several frames into new arrays; the splat and colormap run once
+        # for the whole block (used by the pre-renderer for look-ahead frames)
+        n = self.n_frames()
+        idxs = [max(0, min(int(i), max(0, n-1))) for i in indices]
+        if not idxs:
+            return []
+        left = self._color_grids(self.left_seq, self.K_left, idxs)
+        right = self._color_grids(self.right_seq, self.K_right, idxs)
+        frames = []
+        for k, idx in enumerate(idxs):
+            out = np.empty(self.frame_shape(), dtype=np.uint8)
+            self._compose(out, idx, None if left is None else left[k], None if right is None else right[k])
+            frames.append(out)
+        return frames
+
+    def render_into(self, out: np.ndarray, idx: int = None) -> np.ndarray:
+        # Render frame idx (default: current frame) into out, which must have
+        # frame_shape() and dtype uint8. No state is modified, so this is safe
+        # to call from a pre-render thread; the COP trail is derived from the
+        # preceding frames instead of from previously rendered ones
+        if idx is None:
+            idx = self.frame_idx
+        idx = max(0, min(int(idx), max(0, self.n_frames()-1)))
+        left = self._color_grids(self.left_seq, self.K_left, [idx])
+        right = self._color_grids(self.right_seq, self.K_right, [idx])
+        return self._compose(out, idx, None if left is None else left[0], None if right is None else right[0])
+
+    def _compose(self, out, idx, left_grid, right_grid):
+        layout = self._layout()
+        if out.shape != layout["shape"]:
+            raise ValueError(f"render_into: expected buffer of shape {layout['shape']}, got {out.shape}")
+        left_cops = self._cop_window(self.left_seq, self.coords_left, idx)
+        right_cops = self._cop_window(self.right_seq, self.coords_right, idx)
+        left_cop, right_cop = left_cops[-1], right_cops[-1]
+        left_trail = left_cops[-self.trail_len:] if self.trail_len > 0 else []
+        right_trail = right_cops[-self.trail_len:] if self.trail_len > 0 else []
+        # compose final image on the static background (white + colorbar)
+        w = self.params["wFinal"]
+        h = self.params["hFinal"]
+        lx, rx, ly = layout["lx"], layout["rx"], layout["ly"]
+        np.copyto(out, layout["background"])
+        # place left and right images (black if a foot has no data)
+        for x0, grid in ((lx, left_grid), (rx, right_grid)):
+            if grid is None:
+                out[ly:ly+h, x0:x0+w] = 0
+            else:
+                # upsample straight into the canvas region (no temporary image)
+                cv2.resize(grid, (w, h), dst=out[ly:ly+h, x0:x0+w], interpolation=cv2.INTER_LINEAR)
+        # draw indices
+        apply_indices(out, layout["indices"])
         # draw trails as filled pink points with decreasing size (newest -> largest)
         pink = (203, 105, 255)
         # left trail (smaller sizes, no outline)
-        nL = len(self.left_trail)
+        nL = len(left_trail)
         if nL > 0:
             max_size = 8
             min_size = 2
-            for i, pt in enumerate(reversed(self.left_trail)):
+            for i, pt in enumerate(reversed(left_trail)):
                 # newer points are larger
                 size = int(min_size + ((nL - i) / nL) * (max_size - min_size))
                 x = int(pt[0]) + lx
                 y = int(pt[1]) + ly
                 cv2.circle(out, (x, y), size, pink, -1)
         # right trail (smaller sizes, no outline)
-        nR = len(self.right_trail)
+        nR = len(right_trail)
         if nR > 0:
             max_size = 8
             min_size = 2
-            for i, pt in enumerate(reversed(self.right_trail)):
+            for i, pt in enumerate(reversed(right_trail)):
                 size = int(min_size + ((nR - i) / nR) * (max_size - min_size))
                 x = int(pt[0]) + rx
                 y = int(pt[1]) + ly
@@ -135,12 +212,3 @@ class Animator:
     def set_frame(self, idx: int):
         self.frame_idx = max(0, min(idx, max(0, self.n_frames()-1)))
 
-
-def render_frame_at(self, idx: int) -> np.ndarray:
-    # Render a specific frame without modifying internal frame_idx
-    old_idx = self.frame_idx
-    try:
-        self.frame_idx = max(0, min(int(idx), max(0, self.n_frames()-1)))
-        return self.get_frame()
-    finally:
-        self.frame_idx = old_idx
@@ -3,6 +3,28 @@ import cv2
 from typing import List, Tuple
 
 
+# colormap id -> (256, 1, 3) BGR lookup table, filled on first use
+_COLORMAP_LUTS = {}
+
+
+def colormap_lut(colormap: int = cv2.COLORMAP_JET) -> np.ndarray:
+    """Return the 256-entry BGR lookup table of an OpenCV colormap (built once)."""
+    lut = _COLORMAP_LUTS.get(colormap)
+    if lut is None:
+        lut = cv2.applyColorMap(np.arange(256, dtype=np.uint8).reshape(256, 1), colormap)
+        _COLORMAP_LUTS[colormap] = lut
+    return lut
+
+
+def apply_colormap(gray: np.ndarray, colormap: int = cv2.COLORMAP_JET) -> np.ndarray:
+    """Same result as cv2.applyColorMap(gray, colormap) for uint8 input.
+
+    cv2.applyColorMap rebuilds its colormap table on every call, which costs far
+    more than mapping a small grid; cv2.LUT with the cached table does not.
+    """
+    return cv2.LUT(cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR), colormap_lut(colormap))
+
+
 def precompute_kernels(coords: List[Tuple[float, float]], gW: int, gH: int, wFinal: int, hFinal: int, radius: float, smooth: float):
     """Precompute kernel per sensor. Returns K shape (nSensors, gH*gW) dtype float32."""
     n = len(coords)
@@ -20,12 +42,50 @@ def precompute_kernels(coords: List[Tuple[float, float]], gW: int, gH: int, wFin
     return K
 
 
+def precompute_separable_kernels(coords: List[Tuple[float, float]], gW: int, gH: int, wFinal: int, hFinal: int, radius: float, smooth: float):
+    """Precompute per-sensor 1-D Gaussian factors of the splat kernel.
+
+    exp(-s*(dx^2+dy^2)/r^2) = exp(-s*dx^2/r^2) * exp(-s*dy^2/r^2), so the
+    (nSensors, gH*gW) kernel matrix of precompute_kernels factors into
+    Gy (gH, nSensors) and Gx (gW, nSensors), and a frame renders as
+    Z = (Gy * p) @ Gx.T  (see splat_separable).
+
+    The kernels are evaluated exactly at every grid cell rather than blurred
+    over a window, so per-frame cost is O(nSensors * gH * gW) and does not
+    depend on radius or smoothness; only this precomputation sees them.
+    """
+    pts = np.asarray(coords if coords is not None else [], dtype=np.float64).reshape(-1, 2)
+    gx = (np.arange(gW) + 0.5) / gW * wFinal
+    gy = (np.arange(gH) + 0.5) / gH * hFinal
+    scale = -smooth / (radius * radius)
+    Gx = np.exp(scale * (gx[:, None] - pts[None, :, 0]) ** 2).astype(np.float32)
+    Gy = np.exp(scale * (gy[:, None] - pts[None, :, 1]) ** 2).astype(np.float32)
+    return Gx, Gy
+
+
+def splat_separable(p: np.ndarray, Gx: np.ndarray, Gy: np.ndarray) -> np.ndarray:
+    """Pressures p (nSensors,) -> Z grid (gH, gW) using the separable kernel factors.
+
+    p may also be a block of frames (nFrames, nSensors), giving (nFrames, gH, gW)
+    from a single batched matrix product.
+    """
+    return (Gy * p[..., None, :]) @ Gx.T
+
+
+def colorize_grid(Z: np.ndarray) -> np.ndarray:
+    """Z grid(s) (..., gH, gW) -> BGR uint8 (..., gH, gW, 3) on the 0..4095 JET scale."""
+    gW = Z.shape[-1]
+    # clip to 0..4095, scale to 0..255 in place and truncate, so 4095 maps to
+    # the top colormap entry (OpenCV's saturating conversions round instead)
+    scaled = np.clip(Z.reshape(-1, gW), 0, 4095)
+    np.multiply(scaled, 255.0 / 4095.0, out=scaled)
+    gray = scaled.astype(np.uint8)
+    return apply_colormap(gray).reshape(Z.shape + (3,))
+
+
 def render_heatmap_from_flatZ(Z_flat: np.ndarray, wFinal: int, hFinal: int, gW: int, gH: int) -> np.ndarray:
     """Z_flat shape (gH*gW,) -> returns BGR uint8 image (hFinal,wFinal,3)"""
-    Z = Z_flat.reshape((gH, gW))
-    Z = np.clip(Z, 0, 4095)
-    gray = (Z * (255.0 / 4095.0)).astype(np.uint8)
-    color = cv2.applyColorMap(gray, cv2.COLORMAP_JET)
+    color = colorize_grid(Z_flat.reshape((gH, gW)))
     color = cv2.resize(color, (wFinal, hFinal), interpolation=cv2.INTER_LINEAR)
     return color
 
@@ -52,6 +112,28 @@ def compute_cop(pressures: List[int], coords: List[Tuple[float, float]]) -> Tupl
     return (int(round(x)), int(round(y)))
 
 
+def compute_cops(frames, coords: List[Tuple[float, float]]) -> List[Tuple[int, int]]:
+    """Vectorized compute_cop over several frames; returns one (x, y) per frame."""
+    n_frames = len(frames)
+    if coords is None or len(coords) == 0 or n_frames == 0:
+        return [(0, 0)] * n_frames
+    coords_arr = np.asarray(coords, dtype=np.float32)
+    n_coords = coords_arr.shape[0]
+    ps = np.asarray(frames, dtype=np.float32).reshape(n_frames, -1)
+    if ps.shape[1] < n_coords:
+        # pad with zeros
+        tmp = np.zeros((n_frames, n_coords), dtype=np.float32)
+        tmp[:, :ps.shape[1]] = ps
+        ps = tmp
+    elif ps.shape[1] > n_coords:
+        ps = ps[:, :n_coords]
+    s = ps.sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        x = (coords_arr[:, 0] * ps).sum(axis=1) / s
+        y = (coords_arr[:, 1] * ps).sum(axis=1) / s
+    return [(int(round(x[i])), int(round(y[i]))) if s[i] > 0 else (0, 0) for i in range(n_frames)]
+
+
 def create_colorbar(height: int, width: int, ticks=None) -> np.ndarray:
     """Return a compact colorbar image; stripe slightly thicker than before."""
     # slightly thicker compact colorbar: stripe ~8 px (or width-8), labels right
@@ -66,7 +148,7 @@ def create_colorbar(height: int, width: int, ticks=None) -> np.ndarray:
     # make stripe a bit thicker than before (prefer ~8 px)
     preferred = 8
     stripe_w = max(preferred, min(preferred + 4, max(4, width - 8)))
-    stripe = cv2.applyColorMap(gray.reshape(-1, 1), cv2.COLORMAP_JET)
+    stripe = apply_colormap(gray.reshape(-1, 1))
     stripe = cv2.resize(stripe, (stripe_w, height), interpolation=cv2.INTER_LINEAR)
 
     # compact layout
@@ -109,3 +191,28 @@ def draw_indices(img: np.ndarray, coords: List[Tuple[float, float]], offset=(0,0
         # white filled circle with thin black border for visibility
         cv2.circle(img, (x_off, y_off), 6, (255, 255, 255), -1)
         cv2.circle(img, (x_off, y_off), 6, (0, 0, 0), 1)
+
+
+def rasterize_indices(shape, coords_offsets) -> Tuple[np.ndarray, np.ndarray]:
+    """Rasterize draw_indices markers once for a fixed image layout.
+
+    coords_offsets is a list of (coords, offset) pairs as passed to draw_indices.
+    Returns (flat byte indices, byte values) so that every frame can stamp all
+    markers with a single fancy-index assignment (see apply_indices) instead of
+    two cv2.circle calls per sensor. Markers are opaque and not antialiased, so
+    the result is identical to calling draw_indices on each frame.
+    """
+    sentinel = (1, 2, 3)  # never produced by the white/black markers
+    canvas = np.empty(shape, dtype=np.uint8)
+    canvas[:] = sentinel
+    for coords, offset in coords_offsets:
+        draw_indices(canvas, coords, offset=offset)
+    covered = (canvas != sentinel).any(axis=2)
+    idx = np.flatnonzero(np.repeat(covered.ravel(), canvas.shape[2]))
+    return idx, canvas.reshape(-1)[idx].copy()
+
+
+def apply_indices(img: np.ndarray, overlay: Tuple[np.ndarray, np.ndarray]):
+    """Stamp markers rasterized by rasterize_indices onto a contiguous BGR image."""
+    idx, values = overlay
+    img.reshape(-1)[idx] = values
@@ -1,29 +1,44 @@
 """PreRenderer for Heatmap_Project
 
 Provides a small ring-buffer pre-renderer that renders composed frames in background
-using Animator.render_frame_at(index). The implementation is lightweight and uses a
-background Python thread with a condition variable. Intended to be imported from
+using Animator.render_frames(indices) (or render_frame_at(index) per frame). The implementation is lightweight: a
+background Python thread with a condition variable tracks the requested window
+and hands missing frames to a small thread pool, so look-ahead frames render in
+parallel (NumPy/OpenCV release the GIL while rendering). Intended to be imported from
 `gui.py` as `from prerenderer import PreRenderer`.
 
 API:
-- PreRenderer(animator, capacity=8)
+- PreRenderer(animator, capacity=8, workers=None)
 - start(), stop()
 - request(idx)  # ask to fill buffer around idx
 - get(idx) -> np.ndarray | None
+- put(idx, frame)
+- clear()  # drop buffered frames (e.g. after a parameter change)
 
-The class purposely keeps a small memory footprint and evicts frames outside
-of the requested window.
+The class purposely keeps a small memory footprint: frames live in a fixed
+ring of `capacity` slots addressed by idx % capacity, so a window of
+consecutive frames never collides and frames outside it are simply overwritten.
 """
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
+import os
 import threading
 import time
 import numpy as np
 
 class PreRenderer:
-    def __init__(self, animator, capacity: int = 8):
+    def __init__(self, animator, capacity: int = 8, workers: Optional[int] = None):
         self.animator = animator
         self.capacity = max(1, int(capacity))
-        self.buffer = {}  # idx -> np.ndarray
+        # no point in more render threads than frames in the window
+        if workers is None:
+            workers = max(2, (os.cpu_count() or 2) - 1)
+        self.workers = max(1, min(int(workers), self.capacity))
+        self._pool = None
+        self._in_flight = set()  # frame indices submitted to the pool and not yet stored
+        self._slots = [None] * self.capacity  # frame stored in slot idx % capacity
+        self._slot_idx = np.full(self.capacity, -1, dtype=np.int64)  # frame index held by each slot
+        self._generation = 0  # bumped by clear() so in-flight renders are discarded
         self.lock = threading.Lock()
         self.cond = threading.Condition(self.lock)
         self.target = None
@@ -34,6 +49,7 @@ class PreRenderer:
         if self.running:
             return
         self.running = True
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="prerender")
         self.thread = threading.Thread(target=self._worker, daemon=True)
         self.thread.start()
 
@@ -44,17 +60,60 @@ class PreRenderer:
         if self.thread is not None:
             self.thread.join()
             self.thread = None
+        if self._pool is not None:
+            # queued renders return immediately once running is False
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        with self.lock:
+            self._in_flight.clear()
 
     def request(self, idx: int):
         with self.cond:
             self.target = int(idx)
             self.cond.notify()
 
+    def clear(self):
+        with self.lock:
+            self._slots = [None] * self.capacity
+            self._slot_idx.fill(-1)
+            self._generation += 1
+
     def get(self, idx: int) -> Optional[np.ndarray]:
+        idx = int(idx)
+        slot = idx % self.capacity
         with self.lock:
-            v = self.buffer.get(int(idx), None)
+            if self._slot_idx[slot] != idx:
+                return None
             # return a view/reference (caller must not modify)
-            return v
+            return self._slots[slot]
+
+    def put(self, idx: int, frame: np.ndarray, generation: Optional[int] = None):
+        idx = int(idx)
+        slot = idx % self.capacity
+        with self.lock:
+            if generation is not None and generation != self._generation:
+                # rendered before a clear(); drop it
+                return
+            self._slots[slot] = frame
+            self._slot_idx[slot] = idx
+
+    def _render_block(self, indices, generation: int):
+        try:
+            if self.running:
+                animator = self.animator
+                render_frames = getattr(animator, "render_frames", None)
+                if render_frames is not None:
+                    frames = render_frames(indices)
+                else:
+                    frames = [animator.render_frame_at(i) for i in indices]
+                for idx, frm in zip(indices, frames):
+                    self.put(idx, frm, generation)
+        except Exception:
+            # on error, skip
+            pass
+        finally:
+            with self.lock:
+                self._in_flight.difference_update(indices)
 
     def _worker(self):
         while True:
@@ -73,26 +132,18 @@ class PreRenderer:
             half = max(1, self.capacity // 2)
             start = max(0, target - half // 2)
             end = min(n, start + self.capacity)
-            desired = list(range(start, end))
-            # render missing frames
-            for i in desired:
-                with self.lock:
-                    need = i not in self.buffer
-                if need:
-                    try:
-                        frm = self.animator.render_frame_at(i)
-                    except Exception:
-                        # on error, skip
-                        continue
-                    with self.lock:
-                        self.buffer[i] = frm
-                # small yield
-            # evict keys outside desired window
+            # submit missing frames to the pool, split into one block per
+            # worker so each block shares a batched splat; older frames in the
+            # same slots are overwritten when the new ones land
             with self.lock:
-                keys = list(self.buffer.keys())
-                for k in keys:
-                    if k < start or k >= end:
-                        del self.buffer[k]
+                missing = [i for i in range(start, end)
+                           if self._slot_idx[i % self.capacity] != i and i not in self._in_flight]
+                self._in_flight.update(missing)
+                generation = self._generation
+            if missing:
+                block = -(-len(missing) // self.workers)
+                for k in range(0, len(missing), block):
+                    self._pool.submit(self._render_block, missing[k:k + block], generation)
             # wait shortly or until new target
             with self.cond:
                 cur_target = self.target
@@ -5,19 +5,28 @@ This module now exposes small, testable helpers:
 - detect_qt_binding()
 - import_qt_widgets(binding)
 - import_video_player()
-- run_gui(QtWidgets, VideoPlayer)
+- setup_logging()
+- create_app(QtWidgets)
+- run_gui(app, VideoPlayer, splash)
 - main()
 
-The runtime behavior is unchanged; main() orchestrates detection, imports
-and runs the GUI.
+main() orchestrates detection, imports and runs the GUI. The QApplication
+and a splash screen are created before the heavy UI modules (pyqtgraph,
+OpenCV, pandas) are imported, so the window system is up while they load.
 """
 
 import os
 import sys
+import atexit
 import importlib
+import logging
+import logging.handlers
+import queue
 from typing import Optional, Tuple
 from PyQt6 import QtWidgets, QtGui
 
+log = logging.getLogger(__name__)
+
 
 def detect_qt_binding() -> Optional[str]:
     """Return the name of an available Qt binding or None.
@@ -81,50 +90,87 @@ def import_video_player():
     return VideoPlayer
 
 
-def run_gui(QtWidgets, VideoPlayer) -> int:
-    """Create QApplication, show the VideoPlayer and run the event loop.
+def setup_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
+    """Send log records through a queue to a console handler on a background thread.
 
-    Returns the QApplication exit code.
+    Logging calls (e.g. decode errors in the video controller) then only
+    enqueue the record, so the GUI thread never waits on console output.
+    Returns the started listener; it is stopped at interpreter exit.
+    """
+    records = queue.SimpleQueue()
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter("%(message)s"))
+    listener = logging.handlers.QueueListener(records, console)
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(records))
+    root.setLevel(level)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+
+def _icon_path() -> str:
+    """Path of the application logo, inside a PyInstaller bundle or the source tree."""
+    if hasattr(sys, '_MEIPASS'):
+        # Running in PyInstaller bundle
+        return os.path.join(sys._MEIPASS, 'assets', 'Logo.png')
+    # Running in development
+    return os.path.join(os.path.dirname(__file__), '..', '..', 'assets', 'Logo.png')
+
+
+def create_app(QtWidgets):
+    """Create the QApplication with its icon and quit hook.
+
+    Returns (app, splash); splash is a QSplashScreen showing the logo while
+    the UI modules are imported, or None if there is no logo.
     """
     app = QtWidgets.QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(True)
-    app.aboutToQuit.connect(lambda: print("[VideoGaitAnalyzer] Application quitting", flush=True))
+    app.aboutToQuit.connect(lambda: log.info("[VideoGaitAnalyzer] Application quitting"))
 
-    # Set application icon
-    if hasattr(sys, '_MEIPASS'):
-        # Running in PyInstaller bundle
-        icon_path = os.path.join(sys._MEIPASS, 'assets', 'Logo.png')
-    else:
-        # Running in development
-        icon_path = os.path.join(os.path.dirname(__file__), '..', '..', 'assets', 'Logo.png')
-    
+    splash = None
+    icon_path = _icon_path()
     if os.path.exists(icon_path):
         app.setWindowIcon(QtGui.QIcon(icon_path))
+        pixmap = QtGui.QPixmap(icon_path)
+        if not pixmap.isNull():
+            splash = QtWidgets.QSplashScreen(pixmap)
+            splash.show()
+            app.processEvents()
+    return app, splash
+
+
+def run_gui(app, VideoPlayer, splash=None) -> int:
+    """Show the VideoPlayer and run the event loop.
 
+    Returns the QApplication exit code.
+    """
     player = VideoPlayer()
-    print("[VideoGaitAnalyzer] Showing main window", flush=True)
+    log.info("[VideoGaitAnalyzer] Showing main window")
     player.show()
+    if splash is not None:
+        splash.finish(player)
 
-    print("[VideoGaitAnalyzer] Entering event loop", flush=True)
+    log.info("[VideoGaitAnalyzer] Entering event loop")
     rc = app.exec()
-    print(f"[VideoGaitAnalyzer] Application exited with code {rc}", flush=True)
+    log.info("[VideoGaitAnalyzer] Application exited with code %d", rc)
     return rc
 
 
 def main() -> None:
     """Main entry point: detect bindings, import modules and run the GUI."""
     try:
-        print("[VideoGaitAnalyzer] Starting application", flush=True)
+        setup_logging()
+        log.info("[VideoGaitAnalyzer] Starting application")
 
         qt_binding = detect_qt_binding()
         if qt_binding is None:
-            print(
+            log.error(
                 "[VideoGaitAnalyzer] No Qt bindings found (PyQt6/PyQt5/PySide2/PySide6).\n"
                 "Install the GUI extras to run the application, e.g.:\n"
                 "    pip install .[gui]\n"
                 "or install a binding directly, e.g.:\n"
-                "    pip install PyQt6\n",
-                flush=True,
+                "    pip install PyQt6\n"
             )
             sys.exit(2)
 
@@ -132,24 +178,25 @@ def main() -> None:
         try:
             QtWidgets = import_qt_widgets(qt_binding)
         except Exception as e:
-            print(f"[VideoGaitAnalyzer] Failed to import QtWidgets: {e}", flush=True)
+            log.error("[VideoGaitAnalyzer] Failed to import QtWidgets: %s", e)
             sys.exit(3)
 
+        # Bring up the application (and splash) before the heavy imports
+        app, splash = create_app(QtWidgets)
+
         # Import UI components
         try:
             VideoPlayer = import_video_player()
         except Exception as e:
-            print(f"[VideoGaitAnalyzer] Failed importing UI components: {e}", flush=True)
+            log.error("[VideoGaitAnalyzer] Failed importing UI components: %s", e)
             sys.exit(4)
 
         # Run GUI loop
-        rc = run_gui(QtWidgets, VideoPlayer)
+        rc = run_gui(app, VideoPlayer, splash)
         sys.exit(rc)
 
     except Exception as e:
-        import traceback
-        print(f"[VideoGaitAnalyzer] ERROR: {e}", flush=True)
-        traceback.print_exc()
+        log.exception("[VideoGaitAnalyzer] ERROR: %s", e)
         sys.exit(1)
 
 
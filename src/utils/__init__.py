@@ -5,11 +5,10 @@ This package contains utility functions and helper classes for:
 - Time formatting
 - File operations
 - Data processing
-- Qt plugin configuration
 """
 
 from .time_utils import format_time_mmss
-from .file_utils import find_video_file, find_csv_file, discover_datasets
+from .file_utils import find_video_file, find_csv_file, discover_datasets, clear_discover_cache, list_subdirectories
 from .heatmap_utils import load_heatmap_data_from_directory
 
 __all__ = [
@@ -17,5 +16,7 @@ __all__ = [
     "find_video_file",
     "find_csv_file",
     "discover_datasets",
+    "clear_discover_cache",
+    "list_subdirectories",
     "load_heatmap_data_from_directory",
 ]
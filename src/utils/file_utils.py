@@ -5,13 +5,51 @@ This module provides pathlib-based functions for finding video files, CSV
 files, and discovering dataset directories in a cross-platform way.
 """
 
+import os
+import stat
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Optional
-from ..constants import VIDEO_EXTENSIONS, EXCLUDED_DIRECTORIES
+from typing import Dict, List, Tuple, Optional
+from ..constants import VIDEO_EXTENSIONS, EXCLUDED_DIRECTORIES, DISCOVER_MAX_WORKERS
 
+# Lowercase names of directories never searched (the constant may be edited
+# with any case), and lowercase video extensions, for a single str.endswith call per file name
+_EXCLUDED = frozenset(name.lower() for name in EXCLUDED_DIRECTORIES)
+_VIDEO_EXT_TUPLE = tuple(ext.lower() for ext in VIDEO_EXTENSIONS)
 
-def _is_excluded_dir(name: str) -> bool:
-    return name.lower() in EXCLUDED_DIRECTORIES
+# path -> (directory mtime_ns, subdirectory names), see list_subdirectories
+_subdir_cache: Dict[str, Tuple[int, List[str]]] = {}
+
+# (base path, max_depth) -> (mtime stamp, datasets), see discover_datasets
+_discover_cache: Dict[Tuple[str, int], Tuple[tuple, List[Tuple[str, str]]]] = {}
+
+
+def list_subdirectories(directory: str) -> List[str]:
+    """
+    Names of the subdirectories of a directory (unsorted).
+
+    Uses os.scandir, whose entries usually know their type without an extra
+    stat per entry. Results are cached per path and reused while the
+    directory's modification time is unchanged (adding or removing an entry
+    updates it), so re-selecting a subject or group does not list it again.
+    Returns an empty list if the directory cannot be read.
+    """
+    try:
+        mtime = os.stat(directory).st_mtime_ns
+    except OSError:
+        _subdir_cache.pop(directory, None)
+        return []
+    cached = _subdir_cache.get(directory)
+    if cached is not None and cached[0] == mtime:
+        return list(cached[1])
+    try:
+        with os.scandir(directory) as entries:
+            names = [e.name for e in entries if e.is_dir()]
+    except OSError:
+        return []
+    _subdir_cache[directory] = (mtime, names)
+    return list(names)
 
 
 def find_video_file(directory: str) -> Optional[str]:
@@ -29,22 +67,12 @@ def find_video_file(directory: str) -> Optional[str]:
     if not base.is_dir():
         return None
 
-    # Check files in the directory itself first (sorted for determinism)
+    # Breadth-first, so files in the directory itself are found first
     try:
-        for p in sorted(base.iterdir(), key=lambda p: p.name.lower()):
-            if p.is_file():
-                fname_lower = p.name.lower()
-                if any(fname_lower.endswith(ext) for ext in VIDEO_EXTENSIONS) and 'anonym' in fname_lower:
-                    return str(p)
-    except Exception:
-        pass
-
-    # If not found, walk the tree but skip excluded directories
-    try:
-        for root, dirs, files in os_walk_with_excludes(base):
-            for f in sorted(files, key=lambda s: s.lower()):
+        for root, files in _scan_tree(base):
+            for f in files:
                 fname_lower = f.lower()
-                if any(fname_lower.endswith(ext) for ext in VIDEO_EXTENSIONS) and 'anonym' in fname_lower:
+                if fname_lower.endswith(_VIDEO_EXT_TUPLE) and 'anonym' in fname_lower:
                     return str(Path(root) / f)
     except Exception:
         pass
@@ -56,7 +84,8 @@ def find_csv_file(directory: str, filename: str = 'L.csv') -> Optional[str]:
     """
     Find a specific CSV file in the directory.
 
-    Searches first in the directory itself, then recursively if not found.
+    Searches first in the directory itself, then its subdirectories level
+    by level.
     Returns absolute string path or None.
     """
     try:
@@ -64,15 +93,19 @@ def find_csv_file(directory: str, filename: str = 'L.csv') -> Optional[str]:
     except Exception:
         return None
 
-    if not base.is_dir():
-        return None
-
+    # Usual case: the file sits in the directory itself, which one stat
+    # answers without listing anything (it also fails if base is not a
+    # directory, in which case the scan below finds nothing)
     target = base / filename
-    if target.exists():
-        return str(target)
+    try:
+        if stat.S_ISREG(os.stat(target).st_mode):
+            return str(target)
+    except OSError:
+        pass
 
+    # Otherwise search breadth-first
     try:
-        for root, dirs, files in os_walk_with_excludes(base):
+        for root, files in _scan_tree(base):
             if filename in files:
                 return str(Path(root) / filename)
     except Exception:
@@ -87,6 +120,11 @@ def discover_datasets(base_directory: str, max_depth: int = 3) -> List[Tuple[str
 
     Returns list of tuples (label, absolute_path) where label is the
     relative path from base_directory.
+
+    Results are cached per base directory and depth, and reused while the
+    modification times of the base directory and its immediate
+    subdirectories are unchanged. Changes deeper in the tree are not
+    noticed; call clear_discover_cache() to force a new walk.
     """
     results = []
     seen = set()
@@ -99,43 +137,150 @@ def discover_datasets(base_directory: str, max_depth: int = 3) -> List[Tuple[str
     if not base.is_dir():
         return results
 
-    try:
-        for root, dirs, files in os_walk_with_excludes(base):
-            root_path = Path(root)
-            try:
-                rel = root_path.relative_to(base)
-                depth = 0 if str(rel) == '.' else len(rel.parts)
-            except Exception:
-                depth = 0
-
-            if depth > max_depth:
-                # don't descend further
-                dirs[:] = []
-                continue
+    key = (str(base), max_depth)
+    stamp = _discover_stamp(base)
+    cached = _discover_cache.get(key)
+    if stamp is not None and cached is not None and cached[0] == stamp:
+        return list(cached[1])
 
-            has_video = any((f.lower().endswith(tuple(VIDEO_EXTENSIONS)) and 'anonym' in f.lower()) for f in files)
-            has_csv = any(f.lower() == 'l.csv' or f.lower().endswith('l.csv') for f in files)
+    # The base directory here, then each top-level subtree on a pool thread:
+    # os.scandir and stat release the GIL, so the per-directory latency of
+    # network shares overlaps
+    found = []
+    files, subdirs = _list_entries(str(base))
+    if _is_dataset_dir(files):
+        found.append(str(base))
 
-            if has_video or has_csv:
-                abs_path = str(root_path)
-                if abs_path not in seen:
-                    seen.add(abs_path)
-                    label = str(root_path.relative_to(base))
-                    results.append((label, abs_path))
-    except Exception:
-        pass
+    if subdirs and max_depth >= 1:
+        workers = max(1, min(DISCOVER_MAX_WORKERS, len(subdirs)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='discover') as pool:
+            for paths in pool.map(lambda sub: _discover_subtree(sub, 1, max_depth), subdirs):
+                found.extend(paths)
+
+    for abs_path in found:
+        if abs_path not in seen:
+            seen.add(abs_path)
+            label = str(Path(abs_path).relative_to(base))
+            results.append((label, abs_path))
 
     results.sort()
-    return results
+    if stamp is not None:
+        _discover_cache[key] = (stamp, results)
+    return list(results)
 
 
-# Helper: os.walk wrapper that yields directories/files but skips excluded names
-def os_walk_with_excludes(base_path: Path):
-    """Yield (root, dirs, files) while skipping excluded directories."""
-    # Use a generator based on os.walk to preserve behavior across platforms
-    import os
+def _is_dataset_dir(files: List[str]) -> bool:
+    """
+    Whether a directory with these file names holds a dataset.
+
+    A directory qualifies with either an anonymised video or an L.csv, so
+    the check stops at the first such file. The CSV test is the suffix
+    match discover_datasets has always used; note that it also accepts
+    unrelated names ending in 'l.csv', such as 'total.csv'.
+    """
+    for f in files:
+        name_lower = f.lower()
+        if name_lower.endswith('l.csv') or (
+                name_lower.endswith(_VIDEO_EXT_TUPLE) and 'anonym' in name_lower):
+            return True
+    return False
 
-    for root, dirs, files in os.walk(str(base_path)):
-        # mutate dirs in-place to prevent walking into excluded directories
-        dirs[:] = [d for d in dirs if not _is_excluded_dir(d)]
-        yield root, dirs, files
+
+def _discover_subtree(top: str, depth: int, max_depth: int) -> List[str]:
+    """
+    Dataset directories in top (at the given depth below the base) and below.
+
+    Subdirectories are only listed while they are within max_depth, so
+    out-of-range subtrees are never opened. Runs on a discover_datasets
+    pool thread.
+    """
+    found = []
+    files, subdirs = _list_entries(top)
+    if _is_dataset_dir(files):
+        found.append(top)
+    if depth < max_depth:
+        for sub in subdirs:
+            found.extend(_discover_subtree(sub, depth + 1, max_depth))
+    return found
+
+
+def _list_entries(directory: str) -> Tuple[List[str], List[str]]:
+    """
+    File names and subdirectory paths of a directory, from one os.scandir.
+
+    Excluded and symlinked subdirectories are left out. Returns two empty lists if the
+    directory cannot be read.
+    """
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    # like os.walk, symlinked directories are not entered
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name.lower() not in _EXCLUDED:
+                            subdirs.append(entry.path)
+                    elif entry.is_file():
+                        files.append(entry.name)
+                except OSError:
+                    continue
+    except OSError:
+        return [], []
+    return files, subdirs
+
+
+def clear_discover_cache() -> None:
+    """Forget all cached discover_datasets results."""
+    _discover_cache.clear()
+
+
+def _discover_stamp(base_path: Path) -> Optional[tuple]:
+    """
+    Modification times of a directory and its immediate subdirectories.
+
+    Used to validate cached discover_datasets results. Returns None if the
+    directory cannot be read.
+    """
+    try:
+        stamps = [os.stat(base_path).st_mtime_ns]
+        with os.scandir(base_path) as entries:
+            subdirs = sorted((e for e in entries if e.is_dir()), key=lambda e: e.name)
+        for entry in subdirs:
+            stamps.append((entry.name, entry.stat().st_mtime_ns))
+    except OSError:
+        return None
+    return tuple(stamps)
+
+
+def _scan_tree(base_path: Path):
+    """
+    Yield (directory, file names) breadth-first, skipping excluded and
+    symlinked directories.
+
+    Every directory is read once with os.scandir; file names are sorted
+    case-insensitively and subdirectories are visited in name order, so
+    searches are deterministic and return the shallowest match.
+    """
+    queue = deque([str(base_path)])
+    while queue:
+        root = queue.popleft()
+        try:
+            # lowercase each name once, for both the sort and the exclusions
+            with os.scandir(root) as it:
+                entries = sorted(((e.name.lower(), e) for e in it), key=lambda pair: pair[0])
+        except OSError:
+            continue
+        files = []
+        for name_lower, entry in entries:
+            try:
+                # like os.walk, symlinked directories are not entered (a link
+                # back up the tree would otherwise be searched forever)
+                if entry.is_dir(follow_symlinks=False):
+                    if name_lower not in _EXCLUDED:
+                        queue.append(entry.path)
+                elif entry.is_file():
+                    files.append(entry.name)
+            except OSError:
+                continue
+        yield root, files
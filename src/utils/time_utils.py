@@ -5,6 +5,19 @@ This module provides functions for converting between different time representat
 used in video playback and data visualization.
 """
 
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def format_ms(total_ms: int) -> str:
+    """
+    Format a whole number of milliseconds as MM:SS.mmm.
+
+    Cached: the playback label and the plot axis ticks format the same few
+    values over and over.
+    """
+    return f"{total_ms // 60000:02d}:{(total_ms // 1000) % 60:02d}.{total_ms % 1000:03d}"
+
 
 def format_time_mmss(seconds: float) -> str:
     """
@@ -22,7 +35,4 @@ def format_time_mmss(seconds: float) -> str:
     except Exception:
         total_ms = 0
 
-    mins = total_ms // 60000
-    secs = (total_ms // 1000) % 60
-    ms = total_ms % 1000
-    return f"{mins:02d}:{secs:02d}.{ms:03d}"
+    return format_ms(total_ms)
@@ -3,7 +3,7 @@ Custom Qt widgets for the Video Gait Analyzer.
 
 This package contains custom PyQt5 widgets including:
 - ClickableSlider: Slider with click-to-seek functionality
-- TimeAxis: Custom axis for displaying time in MM:SS format
+- TimeAxis: Custom axis for displaying time in MM:SS.mmm format
 - HeatmapWidget: Widget for displaying heatmap animation frames
 """
 
@@ -8,7 +8,6 @@ frame updates via Qt signals.
 
 import numpy as np
 from PyQt6 import QtWidgets, QtCore, QtGui
-import cv2
 
 
 class HeatmapWidget(QtWidgets.QWidget):
@@ -56,22 +55,22 @@ class HeatmapWidget(QtWidgets.QWidget):
             # Store current frame
             self._current_frame = frame
             
-            # Convert BGR to RGB
+            # Wrap the BGR buffer directly (no BGR->RGB copy); the pixmap
+            # conversion below makes the only copy of the pixel data
             h, w = frame.shape[:2]
             if frame.dtype == np.float32 or frame.dtype == np.float64:
                 # Convert to uint8 if needed
-                frame_rgb = cv2.cvtColor((frame * 255).astype(np.uint8), cv2.COLOR_BGR2RGB)
-            else:
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                frame = (frame * 255).astype(np.uint8)
+            frame = np.ascontiguousarray(frame)
             
             # Create QImage
             bytes_per_line = 3 * w
             qimg = QtGui.QImage(
-                frame_rgb.data, 
+                frame.data, 
                 w, 
                 h, 
                 bytes_per_line, 
-                QtGui.QImage.Format.Format_RGB888
+                QtGui.QImage.Format.Format_BGR888
             )
             
             # Create pixmap
@@ -1,20 +1,22 @@
 """
 Custom time axis for PyQtGraph plots.
 
-Provides an axis that displays time values in MM:SS format
+Provides an axis that displays time values in MM:SS.mmm format
 instead of raw seconds.
 """
 
 import numpy as np
 import pyqtgraph as pg
 
+from ..utils.time_utils import format_ms
+
 
 class TimeAxis(pg.AxisItem):
     """
-    Custom PyQtGraph axis that displays time in MM:SS format.
+    Custom PyQtGraph axis that displays time in MM:SS.mmm format.
     
     This axis converts numeric time values (in seconds) to
-    human-readable MM:SS format for better user experience.
+    human-readable MM:SS.mmm format for better user experience.
     
     Example:
         >>> time_axis = TimeAxis(orientation='bottom')
@@ -43,19 +45,15 @@ class TimeAxis(pg.AxisItem):
         Returns:
             List of formatted time strings
         """
-        out = []
-        for v in values:
-            try:
-                if v is None or not np.isfinite(v):
-                    out.append('')
-                    continue
-                secs = float(v)
-                # Round to nearest millisecond
-                total_ms = int(round(secs * 1000.0))
-                mins = total_ms // 60000
-                s = (total_ms // 1000) % 60
-                ms = total_ms % 1000
-                out.append(f"{mins:02d}:{s:02d}.{ms:03d}")
-            except Exception:
-                out.append('')
+        try:
+            # None and non-finite ticks become NaN and are left blank
+            arr = np.asarray(values, dtype=np.float64).ravel()
+        except (TypeError, ValueError):
+            return [''] * len(values)
+        finite = np.isfinite(arr)
+        # Round to nearest millisecond in one pass
+        total_ms = np.rint(arr[finite] * 1000.0).astype(np.int64)
+        out = [''] * len(arr)
+        for i, ms in zip(np.flatnonzero(finite).tolist(), total_ms.tolist()):
+            out[i] = format_ms(ms)
         return out